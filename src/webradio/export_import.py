@@ -8,7 +8,7 @@ in standard formats (OPML and M3U) for backup, sharing, and cross-app compatibil
 import json
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from datetime import datetime
 
 from webradio.logger import get_logger
@@ -127,6 +127,72 @@ class ExportImportManager:
             logger.error(f"Failed to export to M3U: {e}")
             return False
 
+    def iter_opml(self, file_path: str) -> Iterator[Dict]:
+        """
+        Read stations from an OPML file one at a time.
+
+        The file is parsed incrementally and each outline element is removed
+        from the tree once its station has been read, so memory use does not
+        grow with the size of the file.
+
+        Args:
+            file_path: Path to the OPML file
+
+        Yields:
+            Station dictionaries
+
+        Raises:
+            OSError, xml.etree.ElementTree.ParseError: If the file cannot be read
+        """
+        depth = 0
+        body = None
+        body_depth = None
+
+        for event, elem in ET.iterparse(file_path, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if elem.tag == 'body' and body_depth is None:
+                    body = elem
+                    body_depth = depth
+                continue
+
+            # Stations are the outline elements directly inside <body>
+            if body_depth is not None and depth == body_depth + 1:
+                station = self._station_from_outline(elem) if elem.tag == 'outline' else None
+                # Detach it, iterparse keeps the whole tree below the root
+                body.remove(elem)
+                if station:
+                    yield station
+
+            depth -= 1
+
+        if body_depth is None:
+            logger.warning("OPML file has no body element")
+
+    def _station_from_outline(self, outline: ET.Element) -> Optional[Dict]:
+        """Build a station dictionary from an OPML outline element"""
+        # Extract station data from OPML attributes
+        station = {
+            'name': outline.get('text', 'Unknown Station'),
+            'url': outline.get('url', ''),
+            'url_resolved': outline.get('url', ''),
+        }
+
+        # Add optional fields
+        if outline.get('htmlUrl'):
+            station['homepage'] = outline.get('htmlUrl')
+        if outline.get('icon'):
+            station['favicon'] = outline.get('icon')
+        if outline.get('category'):
+            station['tags'] = outline.get('category')
+        if outline.get('country'):
+            station['country'] = outline.get('country')
+        if outline.get('language'):
+            station['language'] = outline.get('language')
+
+        # Only valid with a URL
+        return station if station['url'] else None
+
     def import_from_opml(self, file_path: str) -> Optional[List[Dict]]:
         """
         Import stations from OPML format.
@@ -138,41 +204,7 @@ class ExportImportManager:
             List of station dictionaries, or None if import failed
         """
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-
-            stations = []
-
-            # Find all outline elements (stations)
-            body = root.find('body')
-            if body is None:
-                logger.warning("OPML file has no body element")
-                return []
-
-            for outline in body.findall('outline'):
-                # Extract station data from OPML attributes
-                station = {
-                    'name': outline.get('text', 'Unknown Station'),
-                    'url': outline.get('url', ''),
-                    'url_resolved': outline.get('url', ''),
-                }
-
-                # Add optional fields
-                if outline.get('htmlUrl'):
-                    station['homepage'] = outline.get('htmlUrl')
-                if outline.get('icon'):
-                    station['favicon'] = outline.get('icon')
-                if outline.get('category'):
-                    station['tags'] = outline.get('category')
-                if outline.get('country'):
-                    station['country'] = outline.get('country')
-                if outline.get('language'):
-                    station['language'] = outline.get('language')
-
-                # Only add if we have a valid URL
-                if station['url']:
-                    stations.append(station)
-
+            stations = list(self.iter_opml(file_path))
             logger.info(f"Imported {len(stations)} stations from OPML: {file_path}")
             return stations
 
@@ -180,24 +212,23 @@ class ExportImportManager:
             logger.error(f"Failed to import from OPML: {e}")
             return None
 
-    def import_from_m3u(self, file_path: str) -> Optional[List[Dict]]:
+    def iter_m3u(self, file_path: str) -> Iterator[Dict]:
         """
-        Import stations from M3U playlist format.
+        Read stations from an M3U playlist one at a time.
 
         Args:
             file_path: Path to the M3U file
 
-        Returns:
-            List of station dictionaries, or None if import failed
-        """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+        Yields:
+            Station dictionaries
 
-            stations = []
+        Raises:
+            OSError, UnicodeDecodeError: If the file cannot be read
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
             current_station = {}
 
-            for line in lines:
+            for line in f:
                 line = line.strip()
 
                 # Skip empty lines and M3U header
@@ -228,9 +259,21 @@ class ExportImportManager:
                     if 'name' not in current_station:
                         current_station['name'] = 'Unknown Station'
 
-                    stations.append(current_station)
+                    yield current_station
                     current_station = {}
 
+    def import_from_m3u(self, file_path: str) -> Optional[List[Dict]]:
+        """
+        Import stations from M3U playlist format.
+
+        Args:
+            file_path: Path to the M3U file
+
+        Returns:
+            List of station dictionaries, or None if import failed
+        """
+        try:
+            stations = list(self.iter_m3u(file_path))
             logger.info(f"Imported {len(stations)} stations from M3U: {file_path}")
             return stations
 
@@ -0,0 +1,227 @@
+"""
+Favicon Cache for Gnome Web Radio
+
+This module keeps recently decoded station logos in memory so the same
+favicon is not downloaded and decoded again when it is shown in another
+view or when a station is played repeatedly. Optionally, the scaled logos
+are also kept on disk so they survive restarts.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+from webradio.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FaviconCache:
+    """
+    LRU cache of station logos keyed by (url, size).
+
+    Values are the final paintables (Gdk.Texture) ready to be assigned to
+    an image. Failed URLs are remembered for a short time so dead favicon
+    hosts are not contacted on every view. Safe to use from worker threads.
+
+    With a cache directory, scaled logos are also stored there as PNG files
+    named after the SHA-1 of (url, size). The least recently used files are
+    removed by prune_disk() once there are more than max_files.
+    """
+
+    def __init__(self, max_entries: int = 128, failure_ttl: float = 300.0,
+                 cache_dir: Optional[str] = None, max_files: int = 1000):
+        """
+        Initialize favicon cache.
+
+        Args:
+            max_entries: Maximum number of cached logos
+            failure_ttl: Seconds a failed URL is skipped before retrying
+            cache_dir: Directory for scaled logos on disk (None: memory only)
+            max_files: Maximum number of logos kept on disk
+        """
+        self.max_entries = max_entries
+        self.failure_ttl = failure_ttl
+        self.max_files = max_files
+
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Favicon disk cache disabled: {e}")
+                self.cache_dir = None
+
+        self._entries: 'OrderedDict[Tuple[str, int], Any]' = OrderedDict()
+        self._failures = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, url: str, size: int) -> Tuple[bool, Optional[Any]]:
+        """
+        Look up a cached logo.
+
+        Args:
+            url: Favicon URL
+            size: Target size in pixels
+
+        Returns:
+            tuple: (found, texture) - found is True for cached logos and for
+                   recently failed URLs, in which case texture is None
+        """
+        key = (url, size)
+        with self._lock:
+            texture = self._entries.get(key)
+            if texture is not None:
+                self._entries.move_to_end(key)
+                return True, texture
+
+            failed_at = self._failures.get(url)
+            if failed_at is not None:
+                if time.monotonic() - failed_at < self.failure_ttl:
+                    return True, None
+                del self._failures[url]
+
+        return False, None
+
+    def store(self, url: str, size: int, texture: Any):
+        """
+        Store a decoded logo, evicting the least recently used one if full.
+
+        Args:
+            url: Favicon URL
+            size: Target size in pixels
+            texture: Paintable to cache
+        """
+        key = (url, size)
+        with self._lock:
+            self._entries[key] = texture
+            self._entries.move_to_end(key)
+            self._failures.pop(url, None)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def store_failure(self, url: str):
+        """
+        Remember that a favicon URL could not be loaded.
+
+        Args:
+            url: Favicon URL
+        """
+        with self._lock:
+            self._failures[url] = time.monotonic()
+
+        logger.debug(f"Favicon unavailable, skipping for {self.failure_ttl:.0f}s: {url}")
+
+    def _disk_path(self, url: str, size: int) -> Path:
+        """Get the file of a logo in the disk cache"""
+        key = hashlib.sha1(f'{url}|{size}'.encode('utf-8')).hexdigest()
+        return self.cache_dir / f'{key}.png'
+
+    def find_on_disk(self, url: str, size: int) -> Optional[Path]:
+        """
+        Find a scaled logo in the disk cache, marking it as recently used.
+
+        Args:
+            url: Favicon URL
+            size: Target size in pixels
+
+        Returns:
+            Path: PNG file of the logo, or None if it is not cached on disk
+        """
+        if self.cache_dir is None:
+            return None
+
+        path = self._disk_path(url, size)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def write_to_disk(self, url: str, size: int, save: Callable[[str], Any]):
+        """
+        Store a scaled logo in the disk cache.
+
+        Args:
+            url: Favicon URL
+            size: Target size in pixels
+            save: Writes the logo as PNG to the path it is given
+                  (e.g. Gdk.Texture.save_to_png)
+        """
+        if self.cache_dir is None:
+            return
+
+        path = self._disk_path(url, size)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.favicon-', suffix='.tmp')
+            os.close(fd)
+            try:
+                if save(tmp_path) is False:
+                    raise OSError("could not encode PNG")
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Failed to write favicon cache {path}: {e}")
+
+    def prune_disk(self) -> int:
+        """
+        Remove the least recently used logos beyond max_files from disk.
+
+        Returns:
+            int: Number of removed files
+        """
+        if self.cache_dir is None:
+            return 0
+
+        try:
+            files = [(entry.stat().st_mtime, entry.path) for entry in os.scandir(self.cache_dir)
+                     if entry.name.endswith('.png')]
+        except OSError as e:
+            logger.debug(f"Failed to list favicon cache: {e}")
+            return 0
+
+        if len(files) <= self.max_files:
+            return 0
+
+        files.sort()
+        removed = 0
+        for _, path in files[:len(files) - self.max_files]:
+            try:
+                os.unlink(path)
+                removed += 1
+            except OSError:
+                pass
+
+        logger.debug(f"Removed {removed} old favicons from disk cache")
+        return removed
+
+    def clear(self):
+        """Remove all cached logos and failures"""
+        with self._lock:
+            self._entries.clear()
+            self._failures.clear()
+
+
+def create_favicon_cache(max_entries: int = 128, failure_ttl: float = 300.0,
+                         cache_dir: Optional[str] = None, max_files: int = 1000) -> FaviconCache:
+    """
+    Factory function to create a favicon cache.
+
+    Args:
+        max_entries: Maximum number of cached logos
+        failure_ttl: Seconds a failed URL is skipped before retrying
+        cache_dir: Directory for scaled logos on disk (None: memory only)
+        max_files: Maximum number of logos kept on disk
+
+    Returns:
+        FaviconCache: Configured favicon cache
+    """
+    return FaviconCache(max_entries, failure_ttl, cache_dir, max_files)
@@ -2,7 +2,8 @@
 
 import json
 import os
-from typing import List, Dict, Optional
+import re
+from typing import List, Dict, Iterable, Optional, FrozenSet
 from pathlib import Path
 from webradio.logger import get_logger
 from webradio.exceptions import FavoritesException
@@ -20,6 +21,17 @@ class FavoritesManager:
         self._ensure_config_dir()
         self.load_favorites()
 
+    @property
+    def favorites(self) -> List[Dict]:
+        """Favorite stations in the order they were added"""
+        return self._favorites
+
+    @favorites.setter
+    def favorites(self, favorites: List[Dict]):
+        self._favorites = favorites
+        # UUID index so is_favorite() does not scan the list
+        self._uuids = {f.get('stationuuid', '') for f in favorites}
+
     def _ensure_config_dir(self):
         """Create config directory if it doesn't exist"""
         try:
@@ -55,14 +67,10 @@ class FavoritesManager:
             logger.error(f"Error saving favorites: {e}")
             raise FavoritesException(f"Cannot save favorites: {e}") from e
 
-    def add_favorite(self, station: Dict) -> bool:
-        """Add a station to favorites"""
-        # Check if already in favorites
-        if self.is_favorite(station.get('stationuuid', '')):
-            return False
-
-        # Store essential station info
-        favorite = {
+    @staticmethod
+    def _make_favorite(station: Dict) -> Dict:
+        """Keep only the essential station info for storage"""
+        return {
             'stationuuid': station.get('stationuuid', ''),
             'name': station.get('name', ''),
             'url': station.get('url', ''),
@@ -76,10 +84,38 @@ class FavoritesManager:
             'homepage': station.get('homepage', ''),
         }
 
+    def add_favorite(self, station: Dict) -> bool:
+        """Add a station to favorites"""
+        # Check if already in favorites
+        if self.is_favorite(station.get('stationuuid', '')):
+            return False
+
+        favorite = self._make_favorite(station)
         self.favorites.append(favorite)
+        self._uuids.add(favorite['stationuuid'])
         self.save_favorites()
         return True
 
+    def add_favorites(self, stations: Iterable[Dict]) -> int:
+        """
+        Add several stations to favorites, skipping duplicates.
+
+        The favorites file is written once at the end instead of once per
+        station. Returns the number of stations added.
+        """
+        added = 0
+        for station in stations:
+            if self.is_favorite(station.get('stationuuid', '')):
+                continue
+            favorite = self._make_favorite(station)
+            self.favorites.append(favorite)
+            self._uuids.add(favorite['stationuuid'])
+            added += 1
+
+        if added:
+            self.save_favorites()
+        return added
+
     def remove_favorite(self, station_uuid: str) -> bool:
         """Remove a station from favorites"""
         original_length = len(self.favorites)
@@ -92,7 +128,11 @@ class FavoritesManager:
 
     def is_favorite(self, station_uuid: str) -> bool:
         """Check if a station is in favorites"""
-        return any(f.get('stationuuid') == station_uuid for f in self.favorites)
+        return station_uuid in self._uuids
+
+    def get_favorite_uuids(self) -> FrozenSet[str]:
+        """Get the UUIDs of all favorites for fast membership tests"""
+        return frozenset(self._uuids)
 
     def get_favorites(self) -> List[Dict]:
         """Get all favorite stations"""
@@ -104,7 +144,6 @@ class FavoritesManager:
             return self.get_favorites()
 
         # Convert wildcard to regex pattern
-        import re
         pattern = query.replace('*', '.*').replace('?', '.')
         pattern = re.compile(pattern, re.IGNORECASE)
 
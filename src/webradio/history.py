@@ -7,6 +7,10 @@ from pathlib import Path
 from datetime import datetime, timedelta
 import time
 
+from webradio.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class HistoryManager:
     """Manage history of recently played radio stations"""
@@ -32,7 +36,7 @@ class HistoryManager:
             else:
                 self.history = []
         except Exception as e:
-            print(f"Error loading history: {e}")
+            logger.error("Error loading history: %s", e)
             self.history = []
 
     def save_history(self):
@@ -41,7 +45,7 @@ class HistoryManager:
             with open(self.history_file, 'w', encoding='utf-8') as f:
                 json.dump(self.history, f, indent=2, ensure_ascii=False)
         except Exception as e:
-            print(f"Error saving history: {e}")
+            logger.error("Error saving history: %s", e)
 
     def add_entry(self, station: Dict, metadata: Optional[Dict] = None) -> bool:
         """Add a station play event to history"""
@@ -86,7 +90,7 @@ class HistoryManager:
             return True
 
         except Exception as e:
-            print(f"Error adding history entry: {e}")
+            logger.error("Error adding history entry: %s", e)
             return False
 
     def _find_recent_play(self, station_uuid: str, hours: int = 1) -> Optional[Dict]:
@@ -167,7 +171,7 @@ class HistoryManager:
             self.save_history()
             return True
         except Exception as e:
-            print(f"Error clearing history: {e}")
+            logger.error("Error clearing history: %s", e)
             return False
 
     def clear_old(self, days: int = 30) -> int:
@@ -189,14 +193,14 @@ class HistoryManager:
             return removed_count
 
         except Exception as e:
-            print(f"Error cleaning old history: {e}")
+            logger.error("Error cleaning old history: %s", e)
             return 0
 
     def _cleanup_old_entries(self, days: int = 90):
         """Auto-cleanup entries older than 90 days on initialization"""
         removed = self.clear_old(days)
         if removed > 0:
-            print(f"Cleaned up {removed} history entries older than {days} days")
+            logger.info("Cleaned up %s history entries older than %s days", removed, days)
 
     def get_count(self) -> int:
         """Get total number of history entries"""
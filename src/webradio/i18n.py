@@ -5,6 +5,10 @@ import os
 import locale
 from pathlib import Path
 
+from webradio.logger import get_logger
+
+logger = get_logger(__name__)
+
 # Translations dictionary
 TRANSLATIONS = {
     'en': {
@@ -462,11 +466,16 @@ class I18n:
 
         # Default to English if language not supported
         self.lang = lang if lang in TRANSLATIONS else 'en'
-        print(f"Language: {self.lang}")
+        self._build_strings()
+        logger.info("Language: %s", self.lang)
+
+    def _build_strings(self):
+        """Merge the current language over English once, so lookups are a single dict probe"""
+        self._strings = {**TRANSLATIONS['en'], **TRANSLATIONS[self.lang]}
 
     def _(self, key: str, **kwargs) -> str:
         """Get translated string"""
-        text = TRANSLATIONS[self.lang].get(key, TRANSLATIONS['en'].get(key, key))
+        text = self._strings.get(key, key)
 
         # Format with kwargs if provided
         if kwargs:
@@ -480,7 +489,8 @@ class I18n:
         """Set language manually"""
         if lang in TRANSLATIONS:
             self.lang = lang
-            print(f"Language changed to: {lang}")
+            self._build_strings()
+            logger.info("Language changed to: %s", lang)
 
 # Global translator instance
 _translator = I18n()
@@ -0,0 +1,245 @@
+"""
+Icon Pool for Gnome Web Radio
+
+This module loads station logos and YouTube thumbnails for all views. An
+image is read from the cache, or downloaded and decoded on a worker pool,
+and only the finished textures are handed to the main thread. Views asking
+for an image that is already loading share that load.
+"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+
+from concurrent.futures import Executor, Future
+from gi.repository import Gdk, GLib
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from webradio.favicon_cache import FaviconCache
+from webradio.logger import get_logger
+from webradio.ui.helpers import decode_scaled_texture_from_chunks, decode_scaled_textures
+
+logger = get_logger(__name__)
+
+# Bytes read from a download before handing them to the decoder
+CHUNK_SIZE = 16 * 1024
+
+# Returned by IconPool._download for loads nobody waits for anymore
+_SUPERSEDED = object()
+
+
+class IconPool:
+    """
+    Shared loader for images shown at one or more sizes.
+
+    Textures are kept in a FaviconCache, in memory and (if it has a cache
+    directory) on disk. Downloads go through one requests session, so
+    images from the same host reuse a kept-alive connection, and are
+    decoded scaled while they arrive.
+
+    All methods except the worker part are meant to be called on the main
+    thread; callbacks are always invoked there.
+    """
+
+    def __init__(self, cache: FaviconCache, executor: Executor, session,
+                 timeout: float = 5, headers: Optional[Dict[str, str]] = None,
+                 url_for_size: Optional[Callable[[str, int], str]] = None):
+        """
+        Initialize icon pool.
+
+        Args:
+            cache: Memory/disk cache of the scaled textures
+            executor: Worker pool running downloads and decodes
+            session: requests.Session used for downloads
+            timeout: Seconds before a download is given up
+            headers: Extra request headers
+            url_for_size: Maps an image URL to the URL to download for a
+                          display size (e.g. a smaller variant); the original
+                          URL is tried if that one does not exist
+        """
+        self.cache = cache
+        self.timeout = timeout
+        self.headers = headers
+        self.url_for_size = url_for_size
+
+        self._executor = executor
+        self._session = session
+        # (url, sizes) being loaded -> [(on_loaded, on_failed, wanted), ...]
+        self._waiters = {}
+
+    def request(self, url: str, sizes: Sequence[int],
+                on_loaded: Callable[[Dict[int, Gdk.Texture]], None],
+                wanted: Optional[Callable[[], bool]] = None,
+                on_failed: Optional[Callable[[], None]] = None) -> Optional[Future]:
+        """
+        Load an image scaled to fit each of the given sizes.
+
+        Cached images are passed to on_loaded right away, as a dict of size
+        to texture. Otherwise the image is loaded on the worker pool and
+        on_loaded is called from the main loop once it is ready; on_failed,
+        if given, is called instead when the image cannot be loaded.
+
+        wanted, if given, is called (also from the worker pool, so it must
+        not touch widgets) to check whether the image is still needed;
+        loads nobody wants anymore are skipped and no callback is called.
+
+        Args:
+            url: Image URL
+            sizes: Sizes in pixels the image is shown at
+            on_loaded: Receives the textures
+            wanted: Whether the image is still needed
+            on_failed: Called if the image cannot be loaded
+
+        Returns:
+            Future: The started load, None if the image was cached or is
+                    already being loaded
+        """
+        sizes = tuple(sorted(set(sizes), reverse=True))
+        cached = self._lookup(url, sizes)
+        if cached is not None:
+            if cached:
+                on_loaded(cached)
+            elif on_failed is not None:
+                on_failed()
+            return None
+
+        key = (url, sizes)
+        waiters = self._waiters.get(key)
+        if waiters is not None:
+            waiters.append((on_loaded, on_failed, wanted))
+            return None
+        waiters = self._waiters[key] = [(on_loaded, on_failed, wanted)]
+
+        try:
+            future = self._executor.submit(self._load, key, waiters)
+        except RuntimeError:
+            # Pool shut down, the window is closing
+            del self._waiters[key]
+            return None
+
+        future.add_done_callback(lambda future: self._on_load_done(key, future))
+        return future
+
+    def _on_load_done(self, key, future: Future):
+        """Give waiters of a load cancelled before it started another chance"""
+        if future.cancelled():
+            GLib.idle_add(self._deliver, key, None, True)
+
+    def _lookup(self, url: str, sizes: Tuple[int, ...]) -> Optional[Dict[int, Gdk.Texture]]:
+        """Get cached textures, an empty dict for a recently failed URL, None if not cached"""
+        textures = {}
+        for size in sizes:
+            found, texture = self.cache.lookup(url, size)
+            if not found:
+                return None
+            if texture is None:
+                return {}
+            textures[size] = texture
+        return textures
+
+    @staticmethod
+    def _is_wanted(waiters) -> bool:
+        """Whether any view still waits for a load"""
+        return any(wanted is None or wanted() for _, _, wanted in list(waiters))
+
+    def _load(self, key, waiters):
+        """Read or download an image (runs on the worker pool)"""
+        url, sizes = key
+
+        # Skip images whose views were dropped while this load was queued
+        if not self._is_wanted(waiters):
+            GLib.idle_add(self._deliver, key, None, True)
+            return
+
+        textures = self._read_from_disk(url, sizes)
+        if textures is None:
+            try:
+                textures = self._download(url, sizes, waiters)
+            except Exception as e:
+                logger.debug("Failed to load image %s: %s", url, e)
+                textures = None
+
+            if textures is _SUPERSEDED:
+                GLib.idle_add(self._deliver, key, None, True)
+                return
+
+            if textures:
+                for size, texture in textures.items():
+                    self.cache.write_to_disk(url, size, texture.save_to_png)
+
+        if not textures:
+            self.cache.store_failure(url)
+        else:
+            for size, texture in textures.items():
+                self.cache.store(url, size, texture)
+        GLib.idle_add(self._deliver, key, textures)
+
+    def _read_from_disk(self, url: str, sizes: Tuple[int, ...]) -> Optional[Dict[int, Gdk.Texture]]:
+        """Load the scaled textures from the disk cache, None unless all sizes are there"""
+        textures = {}
+        for size in sizes:
+            path = self.cache.find_on_disk(url, size)
+            if path is None:
+                return None
+            try:
+                # Already scaled, so no download and only a tiny decode
+                textures[size] = Gdk.Texture.new_from_filename(str(path))
+            except GLib.Error as e:
+                logger.debug("Failed to read cached image %s: %s", path, e)
+                return None
+        return textures
+
+    def _download(self, url: str, sizes: Tuple[int, ...], waiters):
+        """Download and decode an image while it arrives"""
+        download_url = self.url_for_size(url, sizes[0]) if self.url_for_size else url
+        response = self._session.get(download_url, headers=self.headers, stream=True, timeout=self.timeout)
+        if response.status_code == 404 and download_url != url:
+            response.close()
+            response = self._session.get(url, headers=self.headers, stream=True, timeout=self.timeout)
+
+        with response:
+            if response.status_code != 200:
+                return None
+            # Superseded while waiting for the server, skip the decode
+            if not self._is_wanted(waiters):
+                return _SUPERSEDED
+
+            chunks = response.iter_content(CHUNK_SIZE)
+            if len(sizes) > 1:
+                return decode_scaled_textures(chunks, sizes)
+
+            texture = decode_scaled_texture_from_chunks(chunks, sizes[0])
+            return {sizes[0]: texture} if texture is not None else None
+
+    def _deliver(self, key, textures, skipped=False):
+        """Hand a loaded image to everyone waiting for it"""
+        for on_loaded, on_failed, wanted in self._waiters.pop(key, ()):
+            if wanted is not None and not wanted():
+                continue
+            if skipped:
+                # Asked for after the load was skipped, load it after all
+                self.request(key[0], key[1], on_loaded, wanted, on_failed)
+            elif textures:
+                on_loaded(textures)
+            elif on_failed is not None:
+                on_failed()
+        return False
+
+
+def create_icon_pool(cache: FaviconCache, executor: Executor, session,
+                     timeout: float = 5, headers: Optional[Dict[str, str]] = None,
+                     url_for_size: Optional[Callable[[str, int], str]] = None) -> IconPool:
+    """
+    Factory function to create an icon pool.
+
+    Args:
+        cache: Memory/disk cache of the scaled textures
+        executor: Worker pool running downloads and decodes
+        session: requests.Session used for downloads
+        timeout: Seconds before a download is given up
+        headers: Extra request headers
+        url_for_size: Maps an image URL to the URL to download for a display size
+
+    Returns:
+        IconPool: Configured icon pool
+    """
+    return IconPool(cache, executor, session, timeout, headers, url_for_size)
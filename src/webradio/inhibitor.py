@@ -4,6 +4,10 @@ import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, Gio, GLib
 
+from webradio.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class SessionInhibitor:
     """Manages GNOME session inhibitor to prevent suspend during playback"""
@@ -36,9 +40,9 @@ class SessionInhibitor:
                 'org.gnome.SessionManager',
                 None
             )
-            print("Session inhibitor initialized successfully")
+            logger.info("Session inhibitor initialized successfully")
         except Exception as e:
-            print(f"Could not initialize session manager: {e}")
+            logger.warning("Could not initialize session manager: %s", e)
             self.session_manager = None
 
     def inhibit(self):
@@ -50,7 +54,7 @@ class SessionInhibitor:
             return
 
         if not self.session_manager:
-            print("Session manager not available, cannot inhibit suspend")
+            logger.warning("Session manager not available, cannot inhibit suspend")
             return
 
         try:
@@ -81,10 +85,10 @@ class SessionInhibitor:
             if result:
                 self.inhibit_cookie = result.unpack()[0]
                 self._is_inhibited = True
-                print(f"System suspend inhibited (cookie: {self.inhibit_cookie})")
+                logger.info("System suspend inhibited (cookie: %s)", self.inhibit_cookie)
 
         except Exception as e:
-            print(f"Failed to inhibit suspend: {e}")
+            logger.error("Failed to inhibit suspend: %s", e)
 
     def uninhibit(self):
         """
@@ -107,12 +111,12 @@ class SessionInhibitor:
                 None
             )
 
-            print(f"System suspend uninhibited (cookie: {self.inhibit_cookie})")
+            logger.info("System suspend uninhibited (cookie: %s)", self.inhibit_cookie)
             self.inhibit_cookie = None
             self._is_inhibited = False
 
         except Exception as e:
-            print(f"Failed to uninhibit suspend: {e}")
+            logger.error("Failed to uninhibit suspend: %s", e)
 
     def is_inhibited(self):
         """Check if suspend is currently inhibited"""
@@ -242,8 +242,7 @@ class KeyboardShortcuts:
                 # Shortcut key
                 shortcut_label = Gtk.Label()
                 shortcut_label.set_text(self.get_shortcut_display(action))
-                shortcut_label.add_css_class('monospace')
-                shortcut_label.add_css_class('dim-label')
+                shortcut_label.set_css_classes(['monospace', 'dim-label'])
                 box.append(shortcut_label)
 
                 row.set_child(box)
@@ -4,8 +4,15 @@ import logging
 import logging.handlers
 from pathlib import Path
 from typing import Optional
+import os
 import sys
 
+# Environment variable selecting the log level, e.g. WEBRADIO_LOG=DEBUG
+LOG_LEVEL_ENV = 'WEBRADIO_LOG'
+
+# Level used when WEBRADIO_LOG is unset or invalid; debug messages are skipped
+DEFAULT_LOG_LEVEL = 'INFO'
+
 
 class WebRadioLogger:
     """Centralized logger for WebRadio application"""
@@ -31,9 +38,13 @@ class WebRadioLogger:
 
         log_file = log_dir / 'webradio.log'
 
-        # Create root logger
+        # Create root logger, below its level records are not even formatted
+        level_name = os.environ.get(LOG_LEVEL_ENV, DEFAULT_LOG_LEVEL).upper()
+        level = getattr(logging, level_name, None)
+        if not isinstance(level, int):
+            level_name, level = DEFAULT_LOG_LEVEL, getattr(logging, DEFAULT_LOG_LEVEL)
         self.logger = logging.getLogger('webradio')
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(level)
 
         # Remove existing handlers to avoid duplicates
         self.logger.handlers.clear()
@@ -46,14 +57,15 @@ class WebRadioLogger:
         )
         console_handler.setFormatter(console_formatter)
 
-        # File handler with rotation (DEBUG and above)
+        # File handler with rotation (configured level and above)
         file_handler = logging.handlers.RotatingFileHandler(
             log_file,
             maxBytes=5 * 1024 * 1024,  # 5 MB
             backupCount=3,
             encoding='utf-8'
         )
-        file_handler.setLevel(logging.DEBUG)
+        file_handler.setLevel(level)
+        self.file_handler = file_handler
         file_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
@@ -67,6 +79,7 @@ class WebRadioLogger:
         self.logger.info("=" * 60)
         self.logger.info("WebRadio Player - Logging initialized")
         self.logger.info(f"Log file: {log_file}")
+        self.logger.info(f"Log level: {level_name}")
         self.logger.info("=" * 60)
 
     def get_logger(self, name: str) -> logging.Logger:
@@ -79,6 +92,7 @@ class WebRadioLogger:
         if not isinstance(numeric_level, int):
             raise ValueError(f'Invalid log level: {level}')
         self.logger.setLevel(numeric_level)
+        self.file_handler.setLevel(numeric_level)
         self.logger.info(f"Log level set to: {level.upper()}")
 
 
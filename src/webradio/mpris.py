@@ -8,8 +8,11 @@ import dbus
 import dbus.service
 from dbus.mainloop.glib import DBusGMainLoop
 
+from webradio.logger import get_logger
 from .player import PlayerState
 
+logger = get_logger(__name__)
+
 
 class MPRISInterface(dbus.service.Object):
     """
@@ -48,11 +51,11 @@ class MPRISInterface(dbus.service.Object):
                 '/org/mpris/MediaPlayer2'
             )
 
-            print("MPRIS interface initialized successfully")
+            logger.info("MPRIS interface initialized successfully")
             self.enabled = True
 
         except Exception as e:
-            print(f"Failed to initialize MPRIS: {e}")
+            logger.error("Failed to initialize MPRIS: %s", e)
             self.enabled = False
 
     # Root Interface Properties
@@ -198,13 +201,13 @@ class MPRISInterface(dbus.service.Object):
     @dbus.service.method(MPRIS_IFACE)
     def Raise(self):
         """Raise/show the window"""
-        print("MPRIS: Raise window")
+        logger.debug("MPRIS: Raise window")
         GLib.idle_add(self.window.present)
 
     @dbus.service.method(MPRIS_IFACE)
     def Quit(self):
         """Quit the application"""
-        print("MPRIS: Quit application")
+        logger.debug("MPRIS: Quit application")
         GLib.idle_add(self._quit_app)
 
     def _quit_app(self):
@@ -226,14 +229,14 @@ class MPRISInterface(dbus.service.Object):
     @dbus.service.method(MPRIS_PLAYER_IFACE)
     def Pause(self):
         """Pause playback"""
-        print("MPRIS: Pause")
+        logger.debug("MPRIS: Pause")
         GLib.idle_add(self.player.pause)
         GLib.idle_add(self.update_properties)
 
     @dbus.service.method(MPRIS_PLAYER_IFACE)
     def PlayPause(self):
         """Toggle play/pause"""
-        print("MPRIS: PlayPause")
+        logger.debug("MPRIS: PlayPause")
 
         def do_playpause():
             if self.player.is_playing():
@@ -244,7 +247,7 @@ class MPRISInterface(dbus.service.Object):
                     self.player.resume()
                 # If stopped or error, restart the stream
                 elif self.player.current_uri and self.player.current_station:
-                    print(f"MPRIS: Restarting stream {self.player.current_uri}")
+                    logger.debug("MPRIS: Restarting stream %s", self.player.current_uri)
                     self.player.play(self.player.current_uri, self.player.current_station)
                 # Otherwise try to resume anyway
                 else:
@@ -257,7 +260,7 @@ class MPRISInterface(dbus.service.Object):
     @dbus.service.method(MPRIS_PLAYER_IFACE)
     def Play(self):
         """Resume playback or restart stream"""
-        print("MPRIS: Play")
+        logger.debug("MPRIS: Play")
 
         def do_play():
             # If paused, just resume
@@ -265,7 +268,7 @@ class MPRISInterface(dbus.service.Object):
                 self.player.resume()
             # If stopped or error, restart the stream
             elif self.player.current_uri and self.player.current_station:
-                print(f"MPRIS: Restarting stream {self.player.current_uri}")
+                logger.debug("MPRIS: Restarting stream %s", self.player.current_uri)
                 self.player.play(self.player.current_uri, self.player.current_station)
             # Otherwise try to resume anyway
             else:
@@ -278,7 +281,7 @@ class MPRISInterface(dbus.service.Object):
     @dbus.service.method(MPRIS_PLAYER_IFACE)
     def Stop(self):
         """Stop playback"""
-        print("MPRIS: Stop")
+        logger.debug("MPRIS: Stop")
         GLib.idle_add(self.player.stop)
         GLib.idle_add(self.update_properties)
 
@@ -311,7 +314,7 @@ class MPRISInterface(dbus.service.Object):
                 []
             )
         except Exception as e:
-            print(f"Failed to update MPRIS properties: {e}")
+            logger.error("Failed to update MPRIS properties: %s", e)
 
     def update_metadata(self):
         """Update metadata (called when track changes)"""
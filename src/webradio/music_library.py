@@ -12,6 +12,10 @@ from mutagen.flac import FLAC
 from mutagen.oggvorbis import OggVorbis
 from mutagen.mp4 import MP4
 
+from webradio.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class MusicLibrary:
     """Manages local music files and metadata"""
@@ -38,9 +42,9 @@ class MusicLibrary:
                     data = json.load(f)
                     self.music_paths = data.get('paths', [])
                     self.tracks = data.get('tracks', [])
-                    print(f"Loaded {len(self.tracks)} tracks from library")
+                    logger.debug("Loaded %s tracks from library", len(self.tracks))
             except Exception as e:
-                print(f"Error loading library: {e}")
+                logger.error("Error loading library: %s", e)
 
     def _save_library(self):
         """Save library to cache file"""
@@ -52,9 +56,9 @@ class MusicLibrary:
             }
             with open(self.library_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
-            print(f"Saved {len(self.tracks)} tracks to library")
+            logger.debug("Saved %s tracks to library", len(self.tracks))
         except Exception as e:
-            print(f"Error saving library: {e}")
+            logger.error("Error saving library: %s", e)
 
     def add_music_path(self, path: str):
         """Add a directory to scan for music"""
@@ -73,7 +77,7 @@ class MusicLibrary:
     def scan_library(self, callback=None):
         """Scan all music paths for files"""
         if self.is_scanning:
-            print("Scan already in progress")
+            logger.debug("Scan already in progress")
             return
 
         def scan():
@@ -84,10 +88,10 @@ class MusicLibrary:
             try:
                 for music_path in self.music_paths:
                     if not os.path.exists(music_path):
-                        print(f"Path does not exist: {music_path}")
+                        logger.warning("Path does not exist: %s", music_path)
                         continue
 
-                    print(f"Scanning: {music_path}")
+                    logger.debug("Scanning: %s", music_path)
 
                     for root, dirs, files in os.walk(music_path):
                         for file in files:
@@ -101,16 +105,14 @@ class MusicLibrary:
                                     if callback and total_files % 10 == 0:
                                         callback(total_files)
 
-                print(f"Scan complete: {total_files} tracks found")
+                logger.debug("Scan complete: %s tracks found", total_files)
                 self._save_library()
 
                 if callback:
                     callback(total_files, done=True)
 
-            except Exception as e:
-                print(f"Error during scan: {e}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                logger.exception("Error during scan")
             finally:
                 self.is_scanning = False
 
@@ -151,7 +153,7 @@ class MusicLibrary:
             return track
 
         except Exception as e:
-            print(f"Error reading metadata from {file_path}: {e}")
+            logger.debug("Error reading metadata from %s: %s", file_path, e)
             return None
 
     def get_all_tracks(self) -> List[Dict]:
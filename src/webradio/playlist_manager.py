@@ -7,6 +7,7 @@ playlists of radio stations.
 
 import json
 import os
+import uuid
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
@@ -82,7 +83,6 @@ class PlaylistManager:
         Returns:
             str: Playlist ID
         """
-        import uuid
         playlist_id = str(uuid.uuid4())
 
         self.playlists[playlist_id] = {
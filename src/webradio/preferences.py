@@ -9,6 +9,9 @@ from pathlib import Path
 from webradio.equalizer import EqualizerPreset
 from webradio.recorder import RecordingFormat
 from webradio.i18n import _
+from webradio.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class PreferencesWindow(Adw.PreferencesWindow):
@@ -438,7 +441,7 @@ class PreferencesWindow(Adw.PreferencesWindow):
         lang = lang_map.get(selected, 'auto')
 
         self.settings.set_string('language', lang)
-        print(f"Language changed to: {lang}")
+        logger.debug("Language changed to: %s", lang)
 
     def _on_spectrum_style_changed(self, combo_row, _):
         """Handle spectrum style change"""
@@ -450,7 +453,7 @@ class PreferencesWindow(Adw.PreferencesWindow):
         style = style_map.get(selected, 'bars')
 
         self.settings.set_string('spectrum-style', style)
-        print(f"Spectrum style changed to: {style}")
+        logger.debug("Spectrum style changed to: %s", style)
 
     def _on_buffer_size_changed(self, spin_row):
         """Handle buffer size change"""
@@ -459,7 +462,7 @@ class PreferencesWindow(Adw.PreferencesWindow):
 
         value = int(spin_row.get_value())
         self.settings.set_int('buffer-size', value)
-        print(f"Buffer size changed to: {value}")
+        logger.debug("Buffer size changed to: %s", value)
 
     def _on_preset_changed(self, combo_row, preset_keys):
         """Handle equalizer preset change"""
@@ -477,7 +480,7 @@ class PreferencesWindow(Adw.PreferencesWindow):
                 for i, scale in enumerate(self.eq_scales):
                     scale.set_value(gains[i])
 
-            print(f"Equalizer preset changed to: {preset}")
+            logger.debug("Equalizer preset changed to: %s", preset)
 
     def _on_reset_equalizer(self, button):
         """Reset equalizer to flat"""
@@ -492,7 +495,7 @@ class PreferencesWindow(Adw.PreferencesWindow):
 
         # Set preset to flat
         self.settings.set_string('equalizer-preset', 'flat')
-        print("Equalizer reset to flat")
+        logger.debug("Equalizer reset to flat")
 
     def _on_eq_band_changed(self, band, value):
         """Handle equalizer band change"""
@@ -512,7 +515,7 @@ class PreferencesWindow(Adw.PreferencesWindow):
         if 0 <= selected < len(format_keys):
             fmt = format_keys[selected]
             self.settings.set_string('recording-format', fmt)
-            print(f"Recording format changed to: {fmt}")
+            logger.debug("Recording format changed to: %s", fmt)
 
     def _on_choose_directory(self, button):
         """Show directory chooser dialog"""
@@ -531,9 +534,9 @@ class PreferencesWindow(Adw.PreferencesWindow):
                 if self.settings:
                     self.settings.set_string('recording-directory', path)
                     self.dir_label_row.set_subtitle(path)
-                    print(f"Recording directory changed to: {path}")
+                    logger.debug("Recording directory changed to: %s", path)
         except Exception as e:
-            print(f"Directory selection cancelled or failed: {e}")
+            logger.debug("Directory selection cancelled or failed: %s", e)
 
     def _on_template_changed(self, entry_row):
         """Handle filename template change"""
@@ -552,7 +555,7 @@ class PreferencesWindow(Adw.PreferencesWindow):
         if 0 <= selected < len(bitrate_values):
             bitrate = bitrate_values[selected]
             self.settings.set_int('quality-filter-min-bitrate', bitrate)
-            print(f"Minimum bitrate changed to: {bitrate}")
+            logger.debug("Minimum bitrate changed to: %s", bitrate)
 
     def _on_country_changed(self, entry_row):
         """Handle default country change"""
@@ -571,4 +574,4 @@ class PreferencesWindow(Adw.PreferencesWindow):
         if 0 <= selected < len(order_keys):
             order = order_keys[selected]
             self.settings.set_string('order-by', order)
-            print(f"Sort order changed to: {order}")
+            logger.debug("Sort order changed to: %s", order)
@@ -6,23 +6,28 @@ import random
 from typing import List, Dict, Optional
 from urllib.parse import quote
 
+from webradio.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class RadioBrowserAPI:
     """Interface to the Radio Browser API"""
 
     def __init__(self):
-        self.base_url = self._get_server_url()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'WebRadioPlayer/1.0.0',
             'Content-Type': 'application/json'
         })
+        self.base_url = self._get_server_url()
 
     def _get_server_url(self) -> str:
         """Get a random Radio Browser server"""
         try:
             # Get list of available servers
-            response = requests.get('https://all.api.radio-browser.info/json/servers')
+            # Through the API session, with a timeout so a slow lookup cannot stall startup
+            response = self.session.get('https://all.api.radio-browser.info/json/servers', timeout=5)
             servers = response.json()
             if servers:
                 # Pick a random server
@@ -55,7 +60,7 @@ class RadioBrowserAPI:
 
             return response.json()
         except Exception as e:
-            print(f"Error searching stations: {e}")
+            logger.error("Error searching stations: %s", e)
             return []
 
     def get_top_stations(self, limit: int = 100, offset: int = 0) -> List[Dict]:
@@ -67,7 +72,7 @@ class RadioBrowserAPI:
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            print(f"Error getting top stations: {e}")
+            logger.error("Error getting top stations: %s", e)
             return []
 
     def search_by_tag(self, tag: str, limit: int = 100, offset: int = 0) -> List[Dict]:
@@ -79,7 +84,7 @@ class RadioBrowserAPI:
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            print(f"Error searching by tag: {e}")
+            logger.error("Error searching by tag: %s", e)
             return []
 
     def search_by_country(self, country: str, limit: int = 100) -> List[Dict]:
@@ -91,7 +96,7 @@ class RadioBrowserAPI:
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            print(f"Error searching by country: {e}")
+            logger.error("Error searching by country: %s", e)
             return []
 
     def get_station_by_uuid(self, uuid: str) -> Optional[Dict]:
@@ -103,16 +108,16 @@ class RadioBrowserAPI:
             stations = response.json()
             return stations[0] if stations else None
         except Exception as e:
-            print(f"Error getting station by UUID: {e}")
+            logger.error("Error getting station by UUID: %s", e)
             return None
 
-    def register_click(self, station_uuid: str):
-        """Register a click (play) on a station"""
+    def register_click(self, station_uuid: str) -> bool:
+        """Register a click (play) on a station, returns whether it was accepted"""
         try:
             url = f"{self.base_url}/json/url/{station_uuid}"
-            self.session.get(url, timeout=5)
+            return self.session.get(url, timeout=5).ok
         except Exception:
-            pass  # Non-critical operation
+            return False  # Non-critical operation
 
     def vote_for_station(self, station_uuid: str):
         """Vote for a station"""
@@ -131,5 +136,5 @@ class RadioBrowserAPI:
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            print(f"Error getting countries: {e}")
+            logger.error("Error getting countries: %s", e)
             return []
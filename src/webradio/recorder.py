@@ -4,6 +4,8 @@ from typing import Optional
 from pathlib import Path
 from datetime import datetime
 import os
+import subprocess
+import threading
 from gi.repository import Gio, GObject
 from webradio.logger import get_logger
 
@@ -385,9 +387,6 @@ class StreamRecorder(GObject.Object):
             return False
 
         try:
-            import threading
-            import subprocess
-
             youtube_url = station_info.get('url', '')
             if not youtube_url:
                 error = "No YouTube URL found"
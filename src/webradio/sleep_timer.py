@@ -4,6 +4,10 @@ from gi.repository import GLib, GObject, Gio
 from typing import Optional, Callable
 from datetime import datetime, timedelta
 
+from webradio.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class SleepTimer(GObject.Object):
     """Sleep timer to stop playback after specified time"""
@@ -65,7 +69,7 @@ class SleepTimer(GObject.Object):
                 self.action = 'stop'
 
         except Exception as e:
-            print(f"Error loading sleep timer settings: {e}")
+            logger.error("Error loading sleep timer settings: %s", e)
 
     def _save_settings(self):
         """Save timer settings to GSettings"""
@@ -77,12 +81,12 @@ class SleepTimer(GObject.Object):
             self.settings.set_string('sleep-timer-action', self.action)
 
         except Exception as e:
-            print(f"Error saving sleep timer settings: {e}")
+            logger.error("Error saving sleep timer settings: %s", e)
 
     def start(self, minutes: int = None, action: str = None) -> bool:
         """Start the sleep timer"""
         if self.is_active:
-            print("Timer already active")
+            logger.info("Timer already active")
             return False
 
         # Set duration
@@ -112,7 +116,7 @@ class SleepTimer(GObject.Object):
         # Emit signal
         self.emit('timer-started', self.duration_minutes)
 
-        print(f"Sleep timer started: {self.duration_minutes} minutes, action: {self.action}")
+        logger.info("Sleep timer started: %s minutes, action: %s", self.duration_minutes, self.action)
         return True
 
     def stop(self) -> bool:
@@ -134,7 +138,7 @@ class SleepTimer(GObject.Object):
         # Emit signal
         self.emit('timer-stopped')
 
-        print("Sleep timer stopped")
+        logger.info("Sleep timer stopped")
         return True
 
     def _on_tick(self) -> bool:
@@ -167,7 +171,7 @@ class SleepTimer(GObject.Object):
 
     def _on_expired(self):
         """Called when timer expires"""
-        print(f"Sleep timer expired, action: {self.action}")
+        logger.info("Sleep timer expired, action: %s", self.action)
 
         # Stop timer
         self.is_active = False
@@ -183,17 +187,17 @@ class SleepTimer(GObject.Object):
         """Execute the configured action"""
         if self.action == 'stop':
             if self.player and self.player.is_playing():
-                print("Stopping playback (sleep timer)")
+                logger.info("Stopping playback (sleep timer)")
                 self.player.stop()
 
         elif self.action == 'pause':
             if self.player and self.player.is_playing():
-                print("Pausing playback (sleep timer)")
+                logger.info("Pausing playback (sleep timer)")
                 self.player.pause()
 
         elif self.action == 'quit':
             if self.application:
-                print("Quitting application (sleep timer)")
+                logger.info("Quitting application (sleep timer)")
                 self.application.quit()
 
         return False  # Don't repeat
@@ -282,7 +286,7 @@ class SleepTimer(GObject.Object):
         if minutes >= self.warning_threshold_minutes:
             self.warning_shown = False
 
-        print(f"Added {minutes} minutes to sleep timer")
+        logger.info("Added %s minutes to sleep timer", minutes)
         return True
 
     def subtract_time(self, minutes: int) -> bool:
@@ -304,5 +308,5 @@ class SleepTimer(GObject.Object):
         remaining = (self.end_time - now).total_seconds()
         self.remaining_seconds = max(0, int(remaining))
 
-        print(f"Subtracted {minutes} minutes from sleep timer")
+        logger.info("Subtracted %s minutes from sleep timer", minutes)
         return True
@@ -6,6 +6,10 @@ from gi.repository import Gtk, Gdk, GLib
 import math
 import cairo
 
+from webradio.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class SpectrumVisualizer(Gtk.DrawingArea):
     """Audio spectrum visualization widget"""
@@ -53,7 +57,7 @@ class SpectrumVisualizer(Gtk.DrawingArea):
             if color:
                 self.fg_color = color
         except Exception as e:
-            print(f"Could not get theme colors: {e}")
+            logger.warning("Could not get theme colors: %s", e)
 
     def set_spectrum_data(self, magnitudes):
         """Update spectrum data"""
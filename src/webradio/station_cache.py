@@ -0,0 +1,120 @@
+"""
+Station Cache for Gnome Web Radio
+
+This module persists station lists from the Radio Browser API on disk so
+they can be shown immediately on the next start while fresh data loads.
+"""
+
+import json
+import os
+import tempfile
+from typing import Optional, List, Dict
+from pathlib import Path
+
+from webradio.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class StationCache:
+    """
+    Disk cache for station lists.
+
+    Each list is stored as a JSON file named after its key in the cache
+    directory. Writes are atomic so a crash never leaves a truncated file.
+    If the directory cannot be created, lists are kept in memory for the
+    session only.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize station cache.
+
+        Args:
+            cache_dir: Cache directory path (default: ~/.cache/webradio/)
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'webradio')
+
+        self.cache_dir = Path(cache_dir)
+        self._memory: Dict[str, List[Dict]] = {}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Station disk cache disabled: {e}")
+            self.cache_dir = None
+
+        logger.debug(f"Station cache initialized: {self.cache_dir}")
+
+    def _path(self, key: str) -> Path:
+        """Get the cache file path for a key"""
+        return self.cache_dir / f'{key}.json'
+
+    def load(self, key: str) -> Optional[List[Dict]]:
+        """
+        Load a cached station list.
+
+        Args:
+            key: Cache key (e.g. 'top_stations')
+
+        Returns:
+            list: Cached stations, or None if missing or unreadable
+        """
+        if self.cache_dir is None:
+            return self._memory.get(key)
+
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            stations = json.loads(path.read_bytes())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read station cache {path}: {e}")
+            return None
+
+        if not isinstance(stations, list):
+            logger.warning(f"Ignoring malformed station cache: {path}")
+            return None
+
+        logger.debug(f"Loaded {len(stations)} cached stations for '{key}'")
+        return stations
+
+    def save(self, key: str, stations: List[Dict]):
+        """
+        Save a station list atomically.
+
+        Args:
+            key: Cache key (e.g. 'top_stations')
+            stations: Stations to store
+        """
+        if self.cache_dir is None:
+            self._memory[key] = stations
+            return
+
+        path = self._path(key)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f'.{key}-', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(stations, f, ensure_ascii=False, separators=(',', ':'))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            logger.debug(f"Cached {len(stations)} stations for '{key}'")
+        except OSError as e:
+            logger.warning(f"Failed to write station cache {path}: {e}")
+
+
+def create_station_cache(cache_dir: Optional[str] = None) -> StationCache:
+    """
+    Factory function to create a station cache.
+
+    Args:
+        cache_dir: Cache directory path
+
+    Returns:
+        StationCache: Configured station cache
+    """
+    return StationCache(cache_dir)
@@ -4,6 +4,10 @@ import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gio, GLib, Gtk
 
+from webradio.logger import get_logger
+
+logger = get_logger(__name__)
+
 # Try different AppIndicator implementations
 TRAY_AVAILABLE = False
 AppIndicator = None
@@ -13,16 +17,16 @@ try:
     gi.require_version('AyatanaAppIndicator3', '0.1')
     from gi.repository import AyatanaAppIndicator3 as AppIndicator
     TRAY_AVAILABLE = True
-    print("Using AyatanaAppIndicator3 for system tray")
+    logger.info("Using AyatanaAppIndicator3 for system tray")
 except (ImportError, ValueError):
     # Try legacy AppIndicator3
     try:
         gi.require_version('AppIndicator3', '0.1')
         from gi.repository import AppIndicator3 as AppIndicator
         TRAY_AVAILABLE = True
-        print("Using AppIndicator3 for system tray")
+        logger.info("Using AppIndicator3 for system tray")
     except (ImportError, ValueError):
-        print("No AppIndicator available - system tray disabled")
+        logger.info("No AppIndicator available - system tray disabled")
         TRAY_AVAILABLE = False
 
 
@@ -38,7 +42,7 @@ class TrayIcon:
         if TRAY_AVAILABLE:
             self._setup_tray()
         else:
-            print("System tray not available on this system")
+            logger.info("System tray not available on this system")
 
     def _setup_tray(self):
         """Setup system tray icon"""
@@ -66,10 +70,10 @@ class TrayIcon:
             self._setup_actions()
 
             self.enabled = True
-            print("System tray icon enabled")
+            logger.info("System tray icon enabled")
 
         except Exception as e:
-            print(f"Failed to setup tray icon: {e}")
+            logger.error("Failed to setup tray icon: %s", e)
             self.enabled = False
 
     def _create_gtk3_menu(self):
@@ -110,7 +114,7 @@ class TrayIcon:
             menu.show_all()
             return menu
         except Exception as e:
-            print(f"Failed to create GTK3 menu: {e}")
+            logger.error("Failed to create GTK3 menu: %s", e)
             # Fallback to empty menu
             return None
 
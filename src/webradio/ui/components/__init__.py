@@ -1,6 +1,10 @@
 """UI Components for WebRadio Player"""
 
 from webradio.ui.components.station_row import StationRow, MusicTrackRow, YouTubeVideoRow
+from webradio.ui.components.station_list import StationItem, StationListView
+from webradio.ui.components.video_list import VideoItem, YouTubeVideoListView
 from webradio.ui.components.player_bar import PlayerBar
+from webradio.ui.components.recent_station_row import RecentStationRow
+from webradio.ui.components.player_controls import PlayerControls
 
-__all__ = ['StationRow', 'MusicTrackRow', 'YouTubeVideoRow', 'PlayerBar']
+__all__ = ['StationRow', 'MusicTrackRow', 'YouTubeVideoRow', 'StationItem', 'StationListView', 'VideoItem', 'YouTubeVideoListView', 'PlayerBar', 'RecentStationRow', 'PlayerControls']
@@ -3,7 +3,7 @@
 import gi
 gi.require_version('Gtk', '4.0')
 
-from gi.repository import Gtk, Gio, GLib
+from gi.repository import Gtk, Gdk, Gio, GLib
 from typing import Callable, Optional
 from webradio.logger import get_logger
 from webradio.i18n import _
@@ -149,11 +149,11 @@ class PlayerBar(Gtk.Box):
 
         # Play/Pause (suggested-action + circular)
         self.play_button = Gtk.Button()
+        # Set style classes in one call, before set_icon_name adds 'image-button'
+        self.play_button.set_css_classes(['suggested-action', 'circular'])
         self.play_button.set_icon_name('media-playback-start-symbolic')
         self.play_button.set_tooltip_text(_('Play/Pause'))
         self.play_button.connect('clicked', self._on_play_pause_internal)
-        self.play_button.add_css_class('suggested-action')
-        self.play_button.add_css_class('circular')
         self.play_button.set_sensitive(False)
         controls_box.append(self.play_button)
 
@@ -250,7 +250,6 @@ class PlayerBar(Gtk.Box):
     def set_logo(self, pixbuf=None, icon_name: str = 'audio-x-generic'):
         """Update station logo"""
         if pixbuf:
-            from gi.repository import Gdk
             texture = Gdk.Texture.new_for_pixbuf(pixbuf)
             self.playing_logo.set_from_paintable(texture)
         else:
@@ -0,0 +1,87 @@
+"""Player control bar of the main window"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+
+from gi.repository import Gtk
+from typing import Callable
+
+from webradio.i18n import _
+from webradio.ui.helpers import ui_file
+
+
+@Gtk.Template(filename=ui_file('player_controls.ui'))
+class PlayerControls(Gtk.Box):
+    """
+    Player bar with station info, seek bar, playback controls and volume.
+
+    The widget tree and its signal connections are defined in
+    data/ui/player_controls.ui; the template callbacks forward to the
+    handlers passed in by the window.
+    """
+
+    __gtype_name__ = 'WebRadioPlayerControls'
+
+    playing_logo = Gtk.Template.Child()
+    station_label = Gtk.Template.Child()
+    metadata_label = Gtk.Template.Child()
+    seek_scale = Gtk.Template.Child()
+    current_time_label = Gtk.Template.Child()
+    total_time_label = Gtk.Template.Child()
+    fav_button = Gtk.Template.Child()
+    play_button = Gtk.Template.Child()
+    stop_button = Gtk.Template.Child()
+    record_button = Gtk.Template.Child()
+    recording_label = Gtk.Template.Child()
+    sleep_button = Gtk.Template.Child()
+    volume_button = Gtk.Template.Child()
+
+    def __init__(
+        self,
+        on_seek_changed: Callable,
+        on_favorite_toggled: Callable,
+        on_play_pause: Callable,
+        on_stop: Callable,
+        on_record_toggled: Callable,
+        on_volume_changed: Callable,
+    ):
+        super().__init__()
+
+        self._on_seek_changed = on_seek_changed
+        self._on_favorite_toggled = on_favorite_toggled
+        self._on_play_pause = on_play_pause
+        self._on_stop = on_stop
+        self._on_record_toggled = on_record_toggled
+        self._on_volume_changed = on_volume_changed
+
+        # Translated strings (not handled by the template)
+        self.station_label.set_label(_('no_station_playing'))
+        self.fav_button.set_tooltip_text(_('Add to favorites'))
+        self.play_button.set_tooltip_text(_('Play/Pause'))
+        self.stop_button.set_tooltip_text(_('Stop'))
+        self.record_button.set_tooltip_text(_('Record Stream'))
+        self.sleep_button.set_tooltip_text(_('Sleep Timer'))
+
+    @Gtk.Template.Callback()
+    def on_seek_change_value(self, scale, scroll, value):
+        return self._on_seek_changed(scale, scroll, value)
+
+    @Gtk.Template.Callback()
+    def on_fav_toggled(self, button):
+        self._on_favorite_toggled(button)
+
+    @Gtk.Template.Callback()
+    def on_play_clicked(self, button):
+        self._on_play_pause(button)
+
+    @Gtk.Template.Callback()
+    def on_stop_clicked(self, button):
+        self._on_stop(button)
+
+    @Gtk.Template.Callback()
+    def on_record_toggled(self, button):
+        self._on_record_toggled(button)
+
+    @Gtk.Template.Callback()
+    def on_volume_changed(self, button, value):
+        self._on_volume_changed(button, value)
@@ -0,0 +1,25 @@
+"""Compact recently played station row for the home page"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+
+from gi.repository import Gtk
+from typing import Dict, Callable
+
+from webradio.ui.helpers import ui_file
+
+
+@Gtk.Template(filename=ui_file('recent_station_row.ui'))
+class RecentStationRow(Gtk.Button):
+    """Compact clickable station row, built from data/ui/recent_station_row.ui"""
+
+    __gtype_name__ = 'WebRadioRecentStationRow'
+
+    name_label = Gtk.Template.Child()
+
+    def __init__(self, station: Dict[str, any], on_activate: Callable):
+        super().__init__()
+        self.station = station
+
+        self.name_label.set_label(station.get('name', 'Unknown Station'))
+        self.connect('clicked', lambda b: on_activate(station))
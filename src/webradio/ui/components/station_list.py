@@ -0,0 +1,84 @@
+"""Recycling station list for WebRadio Player"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+
+from gi.repository import Gio, GObject, Gtk
+from typing import Callable, Dict, Iterable, Optional
+
+from webradio.ui.components.station_row import StationRowContent, format_station_details
+
+
+class StationItem(GObject.Object):
+    """
+    List model item holding a station.
+
+    The details line is formatted once here instead of on every bind,
+    as rows are rebound to the same stations while scrolling back and forth.
+    """
+
+    __gtype_name__ = 'WebRadioStationItem'
+
+    def __init__(self, station: Dict[str, any], is_favorite: bool = False):
+        super().__init__()
+        self.station = station
+        self.is_favorite = is_favorite
+        self.details = format_station_details(station)
+
+
+class StationListView(Gtk.ListView):
+    """
+    List of stations that only creates widgets for the visible rows.
+
+    Stations are kept in a Gio.ListStore of StationItem; while scrolling,
+    the row widgets that leave the view are bound to the stations coming
+    into it. Long, infinitely scrolled results therefore cost a model item
+    per station instead of a widget tree per station.
+    """
+
+    __gtype_name__ = 'WebRadioStationListView'
+
+    def __init__(self, load_logo: Optional[Callable] = None):
+        """
+        Args:
+            load_logo: Optional shared image loader, called as
+                load_logo(url, size, on_loaded, wanted)
+        """
+        self.store = Gio.ListStore.new(StationItem)
+        self.load_logo = load_logo
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_setup)
+        factory.connect('bind', self._on_bind)
+        factory.connect('unbind', self._on_unbind)
+
+        super().__init__(model=Gtk.NoSelection.new(self.store), factory=factory)
+        # Activate on a single click, like the other station lists (ListBox)
+        self.set_single_click_activate(True)
+
+    def set_stations(self, stations: Iterable[Dict[str, any]], favorite_uuids=frozenset(), append: bool = False):
+        """
+        Replace the shown stations, or add stations at the end.
+
+        The model is changed in a single splice, so the view updates once.
+        """
+        items = [StationItem(station, station.get('stationuuid', '') in favorite_uuids) for station in stations]
+        if append:
+            self.store.splice(self.store.get_n_items(), 0, items)
+        else:
+            self.store.splice(0, self.store.get_n_items(), items)
+
+    def get_station(self, position: int) -> Optional[Dict[str, any]]:
+        """Get the station at a position, as passed to the activate signal"""
+        item = self.store.get_item(position)
+        return item.station if item is not None else None
+
+    def _on_setup(self, factory, list_item):
+        list_item.set_child(StationRowContent())
+
+    def _on_bind(self, factory, list_item):
+        item = list_item.get_item()
+        list_item.get_child().bind(item.station, item.is_favorite, self.load_logo, item.details)
+
+    def _on_unbind(self, factory, list_item):
+        list_item.get_child().unbind()
@@ -2,170 +2,279 @@
 
 import gi
 gi.require_version('Gtk', '4.0')
-gi.require_version('GdkPixbuf', '2.0')
 
-from gi.repository import Gtk, Gdk, GdkPixbuf, GLib, Gio
-import threading
+from gi.repository import Gtk, Gdk, Gio, GLib
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+import os
 import requests
 from typing import Dict, Optional, Callable
+from webradio.favicon_cache import create_favicon_cache
 from webradio.logger import get_logger
 from webradio.i18n import _
+from webradio.ui.helpers import ui_file
+from webradio.youtube_music import thumbnail_url_for_size
 
 logger = get_logger(__name__)
 
-
+# Download/decode threads shared by rows loading their own images
+ROW_IMAGE_WORKERS = 4
+
+# Row images kept in memory; scaled copies also go to the window's logo cache on disk
+ROW_IMAGE_CACHE_ENTRIES = 512
+
+# Seconds before a row image download is given up
+ROW_IMAGE_TIMEOUT = 10
+
+# Created on first use by rows that get no loader passed in
+_row_icon_pool = None
+
+
+def format_station_details(station: Dict[str, any]) -> str:
+    """Get the 'country • codec • bitrate' line shown under a station name"""
+    details = []
+    if station.get('country'):
+        details.append(station['country'])
+    if station.get('codec'):
+        details.append(station['codec'].upper())
+    if station.get('bitrate'):
+        details.append(f"{station['bitrate']}kbps")
+    return ' • '.join(details)
+
+
+def format_video_duration(video: Dict[str, any]) -> str:
+    """Get the 'm:ss' length shown next to a video, empty if unknown"""
+    duration = int(video.get('duration', 0))
+    if duration <= 0:
+        return ''
+    mins, secs = divmod(duration, 60)
+    return f"{mins}:{secs:02d}"
+
+
+def _load_row_image(url: str, size: int, on_loaded: Callable, wanted: Optional[Callable] = None):
+    """
+    Load a row image through a module-wide icon pool.
+
+    Rows built without a shared loader used to start a thread (and a new
+    connection) each; they now share a few workers and one kept-alive
+    session, and scaled images are cached in memory and on disk, so
+    building a row again does not download or decode its image again.
+    """
+    global _row_icon_pool
+    if _row_icon_pool is None:
+        # Imported here: icon_pool imports webradio.ui.helpers, whose package imports this module
+        from webradio.icon_pool import create_icon_pool
+
+        session = requests.Session()
+        session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        session.mount('http://', HTTPAdapter(pool_maxsize=ROW_IMAGE_WORKERS))
+        session.mount('https://', HTTPAdapter(pool_maxsize=ROW_IMAGE_WORKERS))
+        executor = ThreadPoolExecutor(max_workers=ROW_IMAGE_WORKERS, thread_name_prefix='webradio-row-image')
+        cache = create_favicon_cache(max_entries=ROW_IMAGE_CACHE_ENTRIES,
+                                     cache_dir=os.path.join(GLib.get_user_cache_dir(), 'webradio', 'favicons'))
+        # Station logos are left alone, YouTube thumbnails get their small variant
+        _row_icon_pool = create_icon_pool(cache, executor, session, timeout=ROW_IMAGE_TIMEOUT,
+                                          url_for_size=thumbnail_url_for_size)
+    _row_icon_pool.request(url, (size,), lambda textures: on_loaded(textures[size]), wanted)
+
+
+@Gtk.Template(filename=ui_file('music_track_row.ui'))
 class MusicTrackRow(Gtk.ListBoxRow):
-    """Custom row for displaying a music track"""
+    """Custom row for displaying a music track, built from data/ui/music_track_row.ui"""
+
+    __gtype_name__ = 'WebRadioMusicTrackRow'
+
+    title_label = Gtk.Template.Child()
+    details_label = Gtk.Template.Child()
+    duration_label = Gtk.Template.Child()
 
     def __init__(self, track: Dict[str, any]):
         super().__init__()
         self.track = track
 
-        # Main container
-        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-        box.set_margin_top(8)
-        box.set_margin_bottom(8)
+        self.title_label.set_label(track.get('title', 'Unknown'))
+        self.details_label.set_label(f"{track.get('artist', 'Unknown')} • {track.get('album', 'Unknown')}")
+
+        mins, secs = divmod(track.get('duration', 0), 60)
+        self.duration_label.set_label(f"{mins}:{secs:02d}")
 
-        # Artist/Title
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        info_box.set_hexpand(True)
 
-        # Track title
-        title_label = Gtk.Label(label=track.get('title', 'Unknown'))
-        title_label.set_xalign(0)
-        title_label.set_wrap(False)
-        title_label.set_ellipsize(3)  # ELLIPSIZE_END
-        info_box.append(title_label)
+@Gtk.Template(filename=ui_file('youtube_video_row_content.ui'))
+class YouTubeVideoRowContent(Gtk.Box):
+    """
+    Thumbnail, title, channel and duration of a YouTube video, built from
+    data/ui/youtube_video_row_content.ui.
 
-        # Artist - Album
-        artist_album = f"{track.get('artist', 'Unknown')} • {track.get('album', 'Unknown')}"
-        details_label = Gtk.Label(label=artist_album)
-        details_label.set_xalign(0)
-        details_label.set_opacity(0.7)
-        info_box.append(details_label)
+    The child of YouTubeVideoRow, and the row widget of YouTubeVideoListView,
+    which binds other videos to the same widget while the list is scrolled.
+    """
 
-        box.append(info_box)
+    __gtype_name__ = 'WebRadioYouTubeVideoRowContent'
+
+    thumbnail = Gtk.Template.Child()
+    title_label = Gtk.Template.Child()
+    channel_label = Gtk.Template.Child()
+    duration_label = Gtk.Template.Child()
+
+    def __init__(self):
+        super().__init__()
+
+        # URL of the thumbnail currently wanted, None while unbound
+        self._thumbnail_url = None
+        self._bound = False
+
+    def bind(self, video: Dict[str, any], load_thumbnail: Optional[Callable] = None,
+             duration: Optional[str] = None):
+        """
+        Show a video.
+
+        Args:
+            video: Video info
+            load_thumbnail: Optional shared image loader, called as
+                load_thumbnail(url, size, on_loaded, wanted)
+            duration: Precomputed format_video_duration() of the video
+        """
+        self.title_label.set_label(video.get('title', 'Unknown'))
+        self.channel_label.set_label(video.get('channel', 'Unknown'))
+
+        if duration is None:
+            duration = format_video_duration(video)
+        self.duration_label.set_label(duration)
+
+        self.thumbnail.set_from_icon_name('multimedia-player-symbolic')
+        # The loader picks the thumbnail variant to download for the size
+        url = video.get('thumbnail') or None
+        self._thumbnail_url = url
+        self._bound = True
+        if not url:
+            return
+
+        def on_loaded(texture):
+            # The widget may show another video by now
+            if self._thumbnail_url == url:
+                self.thumbnail.set_from_paintable(texture)
+
+        wanted = lambda: self._thumbnail_url == url
+        if load_thumbnail:
+            load_thumbnail(url, 48, on_loaded, wanted)
+        else:
+            _load_row_image(url, 48, on_loaded, wanted)
 
-        # Duration
-        duration = track.get('duration', 0)
-        mins = duration // 60
-        secs = duration % 60
-        duration_label = Gtk.Label(label=f"{mins}:{secs:02d}")
-        duration_label.set_opacity(0.7)
-        box.append(duration_label)
+    def unbind(self):
+        """Stop waiting for the thumbnail of the shown video"""
+        self._thumbnail_url = None
+        self._bound = False
 
-        self.set_child(box)
+    def is_unbound(self) -> bool:
+        """Whether unbind() was called after the last bind()"""
+        return not self._bound
 
 
 class YouTubeVideoRow(Gtk.ListBoxRow):
     """Custom row for displaying a YouTube video"""
 
-    def __init__(self, video: Dict[str, any]):
+    def __init__(self, video: Dict[str, any], load_thumbnail: Optional[Callable] = None):
+        """
+        Args:
+            video: Video info
+            load_thumbnail: Optional shared image loader, called as
+                load_thumbnail(url, size, on_loaded, wanted) with on_loaded
+                receiving the texture on the main thread
+        """
         super().__init__()
         self.video = video
+        self.load_thumbnail = load_thumbnail
 
-        # Main container - same spacing as radio stations
-        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-        box.set_margin_top(8)
-        box.set_margin_bottom(8)
+        self._content = YouTubeVideoRowContent()
+        self.thumbnail = self._content.thumbnail
+        self.set_child(self._content)
 
-        # Thumbnail - same size as radio station logo (48px)
-        self.thumbnail = Gtk.Image()
-        self.thumbnail.set_pixel_size(48)
-        self.thumbnail.set_from_icon_name('multimedia-player-symbolic')
-        box.append(self.thumbnail)
-
-        # Load thumbnail asynchronously if URL is available
-        thumbnail_url = video.get('thumbnail', '')
-        if thumbnail_url:
-            self._load_thumbnail_async(thumbnail_url)
-
-        # Video info
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        info_box.set_hexpand(True)
-
-        # Title
-        title_label = Gtk.Label(label=video.get('title', 'Unknown'))
-        title_label.set_xalign(0)
-        title_label.set_wrap(False)
-        title_label.set_ellipsize(3)  # ELLIPSIZE_END
-        info_box.append(title_label)
-
-        # Channel
-        channel_label = Gtk.Label(label=video.get('channel', 'Unknown'))
-        channel_label.set_xalign(0)
-        channel_label.set_opacity(0.7)
-        info_box.append(channel_label)
-
-        box.append(info_box)
-
-        # Duration - fixed width to align with header
-        duration = int(video.get('duration', 0))
-        duration_label = Gtk.Label()
-        duration_label.set_xalign(0)
-        duration_label.set_opacity(0.7)
-        duration_label.set_size_request(60, -1)
-        if duration > 0:
-            mins = duration // 60
-            secs = duration % 60
-            duration_label.set_label(f"{mins}:{secs:02d}")
-        else:
-            duration_label.set_label("")
-        box.append(duration_label)
+        # Load thumbnail asynchronously; rows removed from the list (new
+        # results) stop waiting, so queued downloads for them are skipped
+        self._content.bind(video, load_thumbnail)
+        self.connect('unrealize', self._on_unrealize)
+        self.connect('realize', self._on_realize)
 
-        self.set_child(box)
+    def _on_unrealize(self, row):
+        self._content.unbind()
 
-    def _load_thumbnail_async(self, url: str):
-        """Load thumbnail image asynchronously from URL"""
-        import urllib.request
+    def _on_realize(self, row):
+        # Shown again after being dropped, the thumbnail is usually cached by now
+        if self._content.is_unbound():
+            self._content.bind(self.video, self.load_thumbnail)
 
-        def download_and_set():
-            try:
-                logger.debug(f"Loading YouTube thumbnail from: {url}")
 
-                # Download thumbnail with user agent to avoid blocks
-                req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-                response = urllib.request.urlopen(req, timeout=10)
-                data = response.read()
+@Gtk.Template(filename=ui_file('station_row_content.ui'))
+class StationRowContent(Gtk.Box):
+    """
+    Logo, name, details and favorite star of a station, built from
+    data/ui/station_row_content.ui.
 
-                logger.debug(f"Downloaded {len(data)} bytes for YouTube thumbnail")
+    The child of StationRow, and the row widget of StationListView, which
+    binds other stations to the same widget while the list is scrolled.
+    """
 
-                # Load into pixbuf
-                input_stream = Gio.MemoryInputStream.new_from_data(data, None)
-                pixbuf = GdkPixbuf.Pixbuf.new_from_stream(input_stream, None)
+    __gtype_name__ = 'WebRadioStationRowContent'
 
-                # Scale thumbnail to 48x48 to match radio station logos
-                target_size = 48
+    logo_image = Gtk.Template.Child()
+    name_label = Gtk.Template.Child()
+    details_label = Gtk.Template.Child()
+    fav_icon = Gtk.Template.Child()
 
-                orig_width = pixbuf.get_width()
-                orig_height = pixbuf.get_height()
+    def __init__(self):
+        super().__init__()
 
-                # Calculate scale to fit within 48x48 while maintaining aspect ratio
-                scale = min(target_size / orig_width, target_size / orig_height)
-                new_width = int(orig_width * scale)
-                new_height = int(orig_height * scale)
+        # URL of the logo currently wanted, None while unbound
+        self._logo_url = None
+        self._bound = False
 
-                scaled_pixbuf = pixbuf.scale_simple(new_width, new_height, GdkPixbuf.InterpType.BILINEAR)
+    def bind(self, station: Dict[str, any], is_favorite: bool, load_logo: Optional[Callable] = None,
+             details: Optional[str] = None):
+        """
+        Show a station.
 
-                logger.debug(f"Scaled YouTube thumbnail from {orig_width}x{orig_height} to {new_width}x{new_height}")
+        Args:
+            station: Station info
+            is_favorite: Whether the station is a favorite
+            load_logo: Optional shared image loader, called as
+                load_logo(url, size, on_loaded, wanted)
+            details: Precomputed format_station_details() of the station
+        """
+        self.name_label.set_label(station.get('name', 'Unknown'))
 
-                # Set image in main thread using Gdk.Texture (GTK4 way)
-                def set_thumbnail():
-                    texture = Gdk.Texture.new_for_pixbuf(scaled_pixbuf)
-                    self.thumbnail.set_from_paintable(texture)
-                    return False
+        if details is None:
+            details = format_station_details(station)
+        self.details_label.set_label(details)
+        self.details_label.set_visible(bool(details))
 
-                GLib.idle_add(set_thumbnail)
+        self.fav_icon.set_visible(is_favorite)
 
-            except Exception as e:
-                logger.warning(f"Failed to load YouTube thumbnail from {url}: {e}")
-                # Keep default icon on error
+        self.logo_image.set_from_icon_name('audio-x-generic')
+        url = station.get('favicon') or None
+        self._logo_url = url
+        self._bound = True
+        if not url:
+            return
+
+        def on_loaded(texture):
+            # The widget may show another station by now
+            if self._logo_url == url:
+                self.logo_image.set_from_paintable(texture)
 
-        threading.Thread(target=download_and_set, daemon=True).start()
+        wanted = lambda: self._logo_url == url
+        if load_logo:
+            load_logo(url, 48, on_loaded, wanted)
+        else:
+            _load_row_image(url, 48, on_loaded, wanted)
+
+    def unbind(self):
+        """Stop waiting for the logo of the shown station"""
+        self._logo_url = None
+        self._bound = False
+
+    def is_unbound(self) -> bool:
+        """Whether unbind() was called after the last bind()"""
+        return not self._bound
 
 
 class StationRow(Gtk.ListBoxRow):
@@ -175,8 +284,18 @@ class StationRow(Gtk.ListBoxRow):
         self,
         station: Dict[str, any],
         is_favorite: bool = False,
-        on_delete_favorite: Optional[Callable] = None
+        on_delete_favorite: Optional[Callable] = None,
+        load_logo: Optional[Callable] = None
     ):
+        """
+        Args:
+            station: Station info
+            is_favorite: Whether the station is a favorite
+            on_delete_favorite: Called with the station when it is removed from favorites
+            load_logo: Optional shared image loader, called as
+                load_logo(url, size, on_loaded, wanted) with on_loaded
+                receiving the texture on the main thread
+        """
         super().__init__()
         self.station = station
         self.is_favorite = is_favorite
@@ -186,83 +305,24 @@ class StationRow(Gtk.ListBoxRow):
         if is_favorite and on_delete_favorite:
             self._setup_context_menu()
 
-        # Main container
-        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-        box.set_margin_top(8)
-        box.set_margin_bottom(8)
+        self._load_logo = load_logo
+        self._content = StationRowContent()
+        self.logo_image = self._content.logo_image
+        self.set_child(self._content)
 
-        # Station logo
-        self.logo_image = Gtk.Image()
-        self.logo_image.set_pixel_size(48)
-        self.logo_image.set_from_icon_name('audio-x-generic')
-        box.append(self.logo_image)
-
-        # Station info
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        info_box.set_hexpand(True)
-
-        # Station name
-        name_label = Gtk.Label(label=station.get('name', 'Unknown'))
-        name_label.set_xalign(0)
-        name_label.set_wrap(False)
-        name_label.set_ellipsize(3)  # ELLIPSIZE_END
-        info_box.append(name_label)
-
-        # Station details
-        details = []
-        if station.get('country'):
-            details.append(station['country'])
-        if station.get('codec'):
-            details.append(station['codec'].upper())
-        if station.get('bitrate'):
-            details.append(f"{station['bitrate']}kbps")
-
-        if details:
-            details_label = Gtk.Label(label=' • '.join(details))
-            details_label.set_xalign(0)
-            details_label.set_opacity(0.7)
-            info_box.append(details_label)
-
-        box.append(info_box)
-
-        # Favorite indicator
-        if is_favorite:
-            fav_icon = Gtk.Image.new_from_icon_name('starred')
-            fav_icon.add_css_class('accent')
-            box.append(fav_icon)
-
-        self.set_child(box)
-
-        # Load station logo asynchronously
-        if station.get('favicon'):
-            threading.Thread(target=self._load_logo, args=(station['favicon'],), daemon=True).start()
-
-    def _load_logo(self, url: str):
-        """Load station logo from URL"""
-        try:
-            logger.debug(f"Loading station logo from: {url}")
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                GLib.idle_add(self._set_logo_from_data, response.content)
-        except Exception as e:
-            logger.debug(f"Failed to load station logo: {e}")
-
-    def _set_logo_from_data(self, image_data: bytes):
-        """Set logo from image data"""
-        try:
-            loader = GdkPixbuf.PixbufLoader()
-            loader.write(image_data)
-            loader.close()
-            pixbuf = loader.get_pixbuf()
-            if pixbuf:
-                scaled = pixbuf.scale_simple(48, 48, GdkPixbuf.InterpType.BILINEAR)
-                texture = Gdk.Texture.new_for_pixbuf(scaled)
-                self.logo_image.set_from_paintable(texture)
-                logger.debug("Station logo loaded successfully")
-        except Exception as e:
-            logger.debug(f"Failed to set station logo: {e}")
+        # Load station logo asynchronously; rows removed from their list
+        # stop waiting, so queued downloads for them are skipped
+        self._content.bind(station, is_favorite, load_logo)
+        self.connect('unrealize', self._on_unrealize)
+        self.connect('realize', self._on_realize)
+
+    def _on_unrealize(self, row):
+        self._content.unbind()
+
+    def _on_realize(self, row):
+        # Shown again after being dropped, the logo is usually cached by now
+        if self._content.is_unbound():
+            self._content.bind(self.station, self.is_favorite, self._load_logo)
 
     def _setup_context_menu(self):
         """Setup right-click context menu for favorites"""
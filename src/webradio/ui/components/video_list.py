@@ -0,0 +1,83 @@
+"""Recycling YouTube result list for WebRadio Player"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+
+from gi.repository import Gio, GObject, Gtk
+from typing import Callable, Dict, Iterable, Optional
+
+from webradio.ui.components.station_row import YouTubeVideoRowContent, format_video_duration
+
+
+class VideoItem(GObject.Object):
+    """
+    List model item holding a YouTube video.
+
+    The duration is formatted once here instead of on every bind,
+    as rows are rebound to the same videos while scrolling back and forth.
+    """
+
+    __gtype_name__ = 'WebRadioVideoItem'
+
+    def __init__(self, video: Dict[str, any]):
+        super().__init__()
+        self.video = video
+        self.duration = format_video_duration(video)
+
+
+class YouTubeVideoListView(Gtk.ListView):
+    """
+    List of YouTube videos that only creates widgets for the visible rows.
+
+    Like StationListView, videos are kept in a Gio.ListStore of VideoItem
+    and the row widgets leaving the view are bound to the videos coming
+    into it, so infinitely scrolled results cost a model item per video
+    instead of a widget tree and thumbnail per video.
+    """
+
+    __gtype_name__ = 'WebRadioYouTubeVideoListView'
+
+    def __init__(self, load_thumbnail: Optional[Callable] = None):
+        """
+        Args:
+            load_thumbnail: Optional shared image loader, called as
+                load_thumbnail(url, size, on_loaded, wanted)
+        """
+        self.store = Gio.ListStore.new(VideoItem)
+        self.load_thumbnail = load_thumbnail
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_setup)
+        factory.connect('bind', self._on_bind)
+        factory.connect('unbind', self._on_unbind)
+
+        super().__init__(model=Gtk.NoSelection.new(self.store), factory=factory)
+        # Activate on a single click, like the other result lists (ListBox)
+        self.set_single_click_activate(True)
+
+    def set_videos(self, videos: Iterable[Dict[str, any]], append: bool = False):
+        """
+        Replace the shown videos, or add videos at the end.
+
+        The model is changed in a single splice, so the view updates once.
+        """
+        items = [VideoItem(video) for video in videos]
+        if append:
+            self.store.splice(self.store.get_n_items(), 0, items)
+        else:
+            self.store.splice(0, self.store.get_n_items(), items)
+
+    def get_video(self, position: int) -> Optional[Dict[str, any]]:
+        """Get the video at a position, as passed to the activate signal"""
+        item = self.store.get_item(position)
+        return item.video if item is not None else None
+
+    def _on_setup(self, factory, list_item):
+        list_item.set_child(YouTubeVideoRowContent())
+
+    def _on_bind(self, factory, list_item):
+        item = list_item.get_item()
+        list_item.get_child().bind(item.video, self.load_thumbnail, item.duration)
+
+    def _on_unbind(self, factory, list_item):
+        list_item.get_child().unbind()
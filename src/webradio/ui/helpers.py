@@ -0,0 +1,216 @@
+"""Shared widget helpers for WebRadio Player"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+gi.require_version('GdkPixbuf', '2.0')
+
+from gi.repository import Gdk, GdkPixbuf, Gio, GLib, Gtk
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+import itertools
+import struct
+import time
+
+# GtkBuilder templates shipped with the package (see pyproject package-data)
+UI_DIR = Path(__file__).resolve().parent.parent / 'data' / 'ui'
+
+
+def ui_file(name: str) -> str:
+    """Get the path of a bundled .ui template file"""
+    return str(UI_DIR / name)
+
+
+def _png_dimensions(image_data: bytes) -> Optional[Tuple[int, int]]:
+    """Read width and height from the header of PNG data, None for other formats"""
+    if len(image_data) < 24 or image_data[:8] != b'\x89PNG\r\n\x1a\n' or image_data[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', image_data[16:24])
+
+
+# JPEG start-of-frame markers, which carry the image size (DHT, JPG and DAC share the range)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg_dimensions(image_data: bytes) -> Optional[Tuple[int, int]]:
+    """Read width and height from the frame header of JPEG data, None for other formats"""
+    if image_data[:2] != b'\xff\xd8':
+        return None
+
+    pos = 2
+    while pos + 9 <= len(image_data):
+        if image_data[pos] != 0xFF:
+            return None
+        marker = image_data[pos + 1]
+        if marker == 0xFF:
+            pos += 1  # Fill byte
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            pos += 2  # Markers without a segment
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack('>HH', image_data[pos + 5:pos + 9])
+            return width, height
+        pos += 2 + struct.unpack('>H', image_data[pos + 2:pos + 4])[0]
+    return None
+
+
+def _image_dimensions(image_data: bytes) -> Optional[Tuple[int, int]]:
+    """Read width and height of PNG or JPEG data without decoding it"""
+    return _png_dimensions(image_data) or _jpeg_dimensions(image_data)
+
+
+def decode_scaled_texture(image_data: bytes, size: int) -> Optional[Gdk.Texture]:
+    """Decode image data into a texture fitting size x size (safe to call off the main thread)"""
+    # Images that already fit go straight to a texture (GTK 4.6+), skipping the
+    # pixbuf copies; the image widget's pixel size takes care of the display size
+    dimensions = _image_dimensions(image_data)
+    if dimensions and max(dimensions) <= size and hasattr(Gdk.Texture, 'new_from_bytes'):
+        try:
+            return Gdk.Texture.new_from_bytes(GLib.Bytes.new(image_data))
+        except GLib.Error:
+            pass
+
+    # Scale while decoding so large images are never decoded at full resolution
+    stream = Gio.MemoryInputStream.new_from_bytes(GLib.Bytes.new(image_data))
+    pixbuf = GdkPixbuf.Pixbuf.new_from_stream_at_scale(stream, size, size, True, None)
+    if pixbuf is None:
+        return None
+
+    return Gdk.Texture.new_for_pixbuf(pixbuf)
+
+
+def _decode_scaled_pixbuf(chunks: Iterable[bytes], size: int) -> Optional[GdkPixbuf.Pixbuf]:
+    """Feed image data to a pixbuf loader that scales it to fit size x size while decoding"""
+    def on_size_prepared(loader, width, height):
+        # Scale while decoding, like new_from_stream_at_scale()
+        scale = min(size / width, size / height, 1.0)
+        loader.set_size(max(1, round(width * scale)), max(1, round(height * scale)))
+
+    loader = GdkPixbuf.PixbufLoader()
+    loader.connect('size-prepared', on_size_prepared)
+    try:
+        for chunk in chunks:
+            if chunk:
+                loader.write(chunk)
+    finally:
+        # close() finishes the decode; it raises for truncated or broken data
+        loader.close()
+
+    return loader.get_pixbuf()
+
+
+def decode_scaled_textures(chunks: Iterable[bytes], sizes: Iterable[int]) -> Dict[int, Gdk.Texture]:
+    """
+    Decode image data arriving in chunks once into textures fitting each size.
+
+    The image is decoded scaled to the largest size while it arrives, and
+    the smaller variants are scaled down from that pixbuf. Safe to call off
+    the main thread.
+    """
+    sizes = sorted(set(sizes), reverse=True)
+    pixbuf = _decode_scaled_pixbuf(chunks, sizes[0])
+    if pixbuf is None:
+        return {}
+
+    textures = {}
+    width, height = pixbuf.get_width(), pixbuf.get_height()
+    for size in sizes:
+        scale = min(size / width, size / height, 1.0)
+        if scale < 1.0:
+            scaled = pixbuf.scale_simple(max(1, round(width * scale)), max(1, round(height * scale)),
+                                         GdkPixbuf.InterpType.BILINEAR)
+        else:
+            scaled = pixbuf
+        textures[size] = Gdk.Texture.new_for_pixbuf(scaled)
+    return textures
+
+
+def decode_scaled_texture_from_chunks(chunks: Iterable[bytes], size: int) -> Optional[Gdk.Texture]:
+    """
+    Decode image data arriving in chunks into a texture fitting size x size.
+
+    Chunks are fed to a pixbuf loader as they arrive, so decoding overlaps
+    with the download and the whole file is never held in memory. Images that
+    already fit are collected and take the decode_scaled_texture() fast path.
+    Safe to call off the main thread.
+    """
+    chunks = iter(chunks)
+    first = next((chunk for chunk in chunks if chunk), b'')
+    if not first:
+        return None
+
+    dimensions = _image_dimensions(first)
+    if dimensions and max(dimensions) <= size:
+        return decode_scaled_texture(first + b''.join(chunks), size)
+
+    pixbuf = _decode_scaled_pixbuf(itertools.chain((first,), chunks), size)
+    if pixbuf is None:
+        return None
+
+    return Gdk.Texture.new_for_pixbuf(pixbuf)
+
+
+def clear_listbox(listbox: Gtk.ListBox):
+    """
+    Remove all rows from a ListBox.
+
+    Uses Gtk.ListBox.remove_all() (GTK 4.12+) so the list is invalidated
+    once instead of once per removed row. Falls back to removing children
+    one by one on older GTK versions, with property notifications frozen
+    until the list is empty.
+    """
+    if hasattr(listbox, 'remove_all'):
+        listbox.remove_all()
+        return
+
+    listbox.freeze_notify()
+    try:
+        child = listbox.get_first_child()
+        while child:
+            next_child = child.get_next_sibling()
+            listbox.remove(child)
+            child = next_child
+    finally:
+        listbox.thaw_notify()
+
+
+class Debouncer:
+    """
+    Call a function once calls to trigger() have paused for delay_ms.
+
+    Triggering only moves the deadline forward; a single timeout source is
+    kept and re-armed for the remaining time when it fires early, so fast
+    typing does not create and destroy a GLib source per keystroke.
+    """
+
+    def __init__(self, delay_ms: int, callback):
+        self.delay_ms = delay_ms
+        self.callback = callback
+        self._args = ()
+        self._deadline = 0.0
+        self._source_id = None
+
+    def trigger(self, *args):
+        """(Re)start the delay; callback is called with the latest args"""
+        self._args = args
+        self._deadline = time.monotonic() + self.delay_ms / 1000
+        if self._source_id is None:
+            self._source_id = GLib.timeout_add(self.delay_ms, self._on_timeout)
+
+    def cancel(self):
+        """Drop a pending call"""
+        if self._source_id is not None:
+            GLib.source_remove(self._source_id)
+            self._source_id = None
+        self._args = ()
+
+    def _on_timeout(self):
+        remaining_ms = int((self._deadline - time.monotonic()) * 1000)
+        if remaining_ms > 0:
+            self._source_id = GLib.timeout_add(remaining_ms, self._on_timeout)
+            return GLib.SOURCE_REMOVE
+
+        self._source_id = None
+        args, self._args = self._args, ()
+        self.callback(*args)
+        return GLib.SOURCE_REMOVE
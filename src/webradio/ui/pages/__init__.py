@@ -8,5 +8,12 @@ from webradio.ui.pages.discover_page import DiscoverPage
 from webradio.ui.pages.favorites_page import FavoritesPage
 from webradio.ui.pages.history_page import HistoryPage
 from webradio.ui.pages.youtube_page import YouTubePage
+from webradio.ui.pages.search_page import SearchPage
+from webradio.ui.pages.playlists_page import PlaylistsPage
+from webradio.ui.pages.artists_page import ArtistsPage
+from webradio.ui.pages.albums_page import AlbumsPage
 
-__all__ = ['DiscoverPage', 'FavoritesPage', 'HistoryPage', 'YouTubePage']
+__all__ = [
+    'DiscoverPage', 'FavoritesPage', 'HistoryPage', 'YouTubePage',
+    'SearchPage', 'PlaylistsPage', 'ArtistsPage', 'AlbumsPage'
+]
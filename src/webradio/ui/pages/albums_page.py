@@ -0,0 +1,48 @@
+"""
+Albums Page Component for Gnome Web Radio
+
+This module contains the AlbumsPage component for browsing local music albums.
+The static widget tree is defined in data/ui/albums_page.ui.
+"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk
+
+from webradio.logger import get_logger
+from webradio.i18n import _
+from webradio.ui.helpers import ui_file
+
+logger = get_logger(__name__)
+
+
+@Gtk.Template(filename=ui_file('albums_page.ui'))
+class AlbumsPage(Gtk.Box):
+    """
+    Albums page component.
+
+    This component provides:
+    - List of albums from the local music library
+    - Placeholder for empty state
+    """
+
+    __gtype_name__ = 'WebRadioAlbumsPage'
+
+    title_label = Gtk.Template.Child()
+    listbox = Gtk.Template.Child()
+    placeholder = Gtk.Template.Child()
+
+    def __init__(self):
+        """Initialize the AlbumsPage component."""
+        super().__init__()
+
+        logger.info("Initializing AlbumsPage component")
+
+        # Translated strings (not handled by the template)
+        self.title_label.set_label(_("albums_title"))
+        self.placeholder.set_title(_("no_albums"))
+        self.placeholder.set_description(_("add_folder_hint"))
+
+    def get_listbox(self):
+        """Get the albums listbox widget for external access"""
+        return self.listbox
@@ -0,0 +1,48 @@
+"""
+Artists Page Component for Gnome Web Radio
+
+This module contains the ArtistsPage component for browsing local music artists.
+The static widget tree is defined in data/ui/artists_page.ui.
+"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk
+
+from webradio.logger import get_logger
+from webradio.i18n import _
+from webradio.ui.helpers import ui_file
+
+logger = get_logger(__name__)
+
+
+@Gtk.Template(filename=ui_file('artists_page.ui'))
+class ArtistsPage(Gtk.Box):
+    """
+    Artists page component.
+
+    This component provides:
+    - List of artists from the local music library
+    - Placeholder for empty state
+    """
+
+    __gtype_name__ = 'WebRadioArtistsPage'
+
+    title_label = Gtk.Template.Child()
+    listbox = Gtk.Template.Child()
+    placeholder = Gtk.Template.Child()
+
+    def __init__(self):
+        """Initialize the ArtistsPage component."""
+        super().__init__()
+
+        logger.info("Initializing ArtistsPage component")
+
+        # Translated strings (not handled by the template)
+        self.title_label.set_label(_("artists_title"))
+        self.placeholder.set_title(_("no_artists"))
+        self.placeholder.set_description(_("add_folder_hint"))
+
+    def get_listbox(self):
+        """Get the artists listbox widget for external access"""
+        return self.listbox
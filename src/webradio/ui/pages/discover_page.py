@@ -11,6 +11,7 @@ from gi.repository import Gtk, Adw
 
 from webradio.logger import get_logger
 from webradio.i18n import _
+from webradio.ui.components.station_list import StationListView
 
 logger = get_logger(__name__)
 
@@ -34,7 +35,8 @@ class DiscoverPage(Gtk.Box):
         on_load_top_stations,
         on_load_by_tag,
         on_station_scroll,
-        on_station_activated
+        on_station_activated,
+        load_station_logo=None
     ):
         """
         Initialize the DiscoverPage component.
@@ -45,8 +47,10 @@ class DiscoverPage(Gtk.Box):
             on_country_changed: Callback when country filter changes
             on_load_top_stations: Callback to load top voted stations
             on_load_by_tag: Callback to load stations by tag (tag parameter)
-            on_station_scroll: Callback for infinite scrolling
-            on_station_activated: Callback when station row is activated
+            on_station_scroll: Callback for infinite scrolling (edge-reached)
+            on_station_activated: Callback when a station is activated
+                                  (list view, position)
+            load_station_logo: Optional shared image loader for the station logos
         """
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
 
@@ -60,6 +64,7 @@ class DiscoverPage(Gtk.Box):
         self._on_load_by_tag = on_load_by_tag
         self._on_station_scroll = on_station_scroll
         self._on_station_activated = on_station_activated
+        self._load_station_logo = load_station_logo
 
         # Search state
         self.search_timeout_id = None
@@ -144,30 +149,39 @@ class DiscoverPage(Gtk.Box):
         self.station_scrolled.set_vexpand(True)
         self.station_scrolled.set_min_content_height(300)
 
-        # Connect to scroll event for infinite scrolling
-        vadjustment = self.station_scrolled.get_vadjustment()
-        vadjustment.connect('value-changed', self._on_station_scroll)
+        # Infinite scrolling: edge-reached fires once the list hits an edge,
+        # not on every scrolled pixel
+        self.station_scrolled.connect('edge-reached', self._on_station_scroll)
 
-        self.station_listbox = Gtk.ListBox()
-        self.station_listbox.connect('row-activated', self._on_station_activated)
+        # Only the visible rows exist as widgets, however many pages are loaded
+        self.station_list = StationListView(self._load_station_logo)
+        self.station_list.connect('activate', self._on_station_activated)
+        self.station_scrolled.set_child(self.station_list)
 
-        # Status page placeholder
+        # Status page placeholder, shown instead of the list while it is empty
         discover_placeholder = Adw.StatusPage()
         discover_placeholder.set_icon_name('radio-symbolic')
         discover_placeholder.set_title(_('No Stations Loaded'))
         discover_placeholder.set_description(_('Click "Top Voted" to browse popular stations'))
-        self.station_listbox.set_placeholder(discover_placeholder)
 
-        self.station_scrolled.set_child(self.station_listbox)
-        self.append(self.station_scrolled)
+        self.station_stack = Gtk.Stack()
+        self.station_stack.set_vexpand(True)
+        self.station_stack.add_named(discover_placeholder, 'placeholder')
+        self.station_stack.add_named(self.station_scrolled, 'stations')
+        self.station_list.store.connect('items-changed', self._on_stations_changed)
+        self.append(self.station_stack)
+
+    def _on_stations_changed(self, store, position, removed, added):
+        """Switch between the placeholder and the list"""
+        self.station_stack.set_visible_child_name('stations' if store.get_n_items() else 'placeholder')
 
     def _on_load_top_stations(self, widget):
         """Wrapper for top stations callback"""
         self._on_load_top_stations()
 
-    def get_station_listbox(self):
-        """Get the station listbox widget for external access"""
-        return self.station_listbox
+    def get_station_list(self):
+        """Get the station list widget for external access"""
+        return self.station_list
 
     def get_search_entry(self):
         """Get the search entry widget for external access"""
@@ -0,0 +1,45 @@
+"""
+Playlists Page Component for Gnome Web Radio
+
+This module contains the PlaylistsPage component.
+The static widget tree is defined in data/ui/playlists_page.ui.
+"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk
+
+from webradio.logger import get_logger
+from webradio.i18n import _
+from webradio.ui.helpers import ui_file
+
+logger = get_logger(__name__)
+
+
+@Gtk.Template(filename=ui_file('playlists_page.ui'))
+class PlaylistsPage(Gtk.Box):
+    """
+    Playlists page component.
+
+    This component provides:
+    - Header with create playlist button
+    - Status page while no playlists exist
+    """
+
+    __gtype_name__ = 'WebRadioPlaylistsPage'
+
+    title_label = Gtk.Template.Child()
+    create_button = Gtk.Template.Child()
+    status_page = Gtk.Template.Child()
+
+    def __init__(self):
+        """Initialize the PlaylistsPage component."""
+        super().__init__()
+
+        logger.info("Initializing PlaylistsPage component")
+
+        # Translated strings (not handled by the template)
+        self.title_label.set_label(_("playlists_title"))
+        self.create_button.set_tooltip_text(_("create_playlist"))
+        self.status_page.set_title(_("no_playlists"))
+        self.status_page.set_description(_("create_playlist_hint"))
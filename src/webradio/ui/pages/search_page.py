@@ -0,0 +1,77 @@
+"""
+Search Page Component for Gnome Web Radio
+
+This module contains the SearchPage component for the global station search.
+The static widget tree is defined in data/ui/search_page.ui.
+"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+gi.require_version('Adw', '1')
+from gi.repository import Gtk, Adw
+
+from webradio.logger import get_logger
+from webradio.i18n import _
+from webradio.ui.helpers import ui_file
+
+logger = get_logger(__name__)
+
+
+@Gtk.Template(filename=ui_file('search_page.ui'))
+class SearchPage(Gtk.Box):
+    """
+    Global search page component.
+
+    This component provides:
+    - Search entry with search button
+    - Results list with an initial status page
+    """
+
+    __gtype_name__ = 'WebRadioSearchPage'
+
+    title_label = Gtk.Template.Child()
+    search_entry = Gtk.Template.Child()
+    search_button = Gtk.Template.Child()
+    results_listbox = Gtk.Template.Child()
+
+    def __init__(self, on_search_activate, on_search_changed, on_station_activated):
+        """
+        Initialize the SearchPage component.
+
+        Args:
+            on_search_activate: Callback when search is activated (entry or button)
+            on_search_changed: Callback when search text changes
+            on_station_activated: Callback when a result row is activated
+        """
+        super().__init__()
+
+        logger.info("Initializing SearchPage component")
+
+        # Translated strings (not handled by the template)
+        self.title_label.set_label(_("Search"))
+        self.search_entry.set_placeholder_text(_('search_placeholder'))
+        self.search_button.set_label(_('search_button'))
+
+        self.search_entry.connect('activate', on_search_activate)
+        self.search_entry.connect('changed', on_search_changed)
+        self.search_button.connect('clicked', on_search_activate)
+        self.results_listbox.connect('row-activated', on_station_activated)
+
+        # Initial status page
+        self.status_page = Adw.StatusPage()
+        self.status_page.set_icon_name('system-search-symbolic')
+        self.status_page.set_title(_("Search"))
+        self.status_page.set_description(_("search_description"))
+        self.results_listbox.append(self.status_page)
+
+    def get_search_entry(self):
+        """Get the search entry widget for external access"""
+        return self.search_entry
+
+    def get_listbox(self):
+        """Get the results listbox widget for external access"""
+        return self.results_listbox
+
+    def get_status_page(self):
+        """Get the initial status page for external access"""
+        return self.status_page
@@ -11,6 +11,7 @@ from gi.repository import Gtk, Adw
 
 from webradio.logger import get_logger
 from webradio.i18n import _
+from webradio.ui.components.video_list import YouTubeVideoListView
 
 logger = get_logger(__name__)
 
@@ -32,7 +33,8 @@ class YouTubePage(Gtk.Box):
         on_search,
         on_filter_changed,
         on_scroll,
-        on_video_activated
+        on_video_activated,
+        load_thumbnail=None
     ):
         """
         Initialize the YouTubePage component.
@@ -41,8 +43,10 @@ class YouTubePage(Gtk.Box):
             youtube_music: YouTubeMusic instance for checking availability
             on_search: Callback when search is activated
             on_filter_changed: Callback when duration filter changes
-            on_scroll: Callback for infinite scrolling
-            on_video_activated: Callback when video row is activated
+            on_scroll: Callback for infinite scrolling (edge-reached)
+            on_video_activated: Callback when a video is activated
+                                (list view, position)
+            load_thumbnail: Optional shared image loader for the video thumbnails
         """
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
 
@@ -54,6 +58,7 @@ class YouTubePage(Gtk.Box):
         self._on_filter_changed = on_filter_changed
         self._on_scroll = on_scroll
         self._on_video_activated = on_video_activated
+        self._load_thumbnail = load_thumbnail
 
         # Setup UI
         self.set_margin_start(18)
@@ -153,27 +158,46 @@ class YouTubePage(Gtk.Box):
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_vexpand(True)
 
-        # Connect to scroll event for infinite scrolling
-        vadj = scrolled.get_vadjustment()
-        vadj.connect('value-changed', self._on_scroll)
+        # Infinite scrolling: edge-reached fires once the list hits an edge,
+        # not on every scrolled pixel
+        scrolled.connect('edge-reached', self._on_scroll)
 
-        self.youtube_listbox = Gtk.ListBox()
-        self.youtube_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.youtube_listbox.connect('row-activated', self._on_video_activated)
+        # Only the visible rows exist as widgets, however many results are loaded
+        self.video_list = YouTubeVideoListView(self._load_thumbnail)
+        self.video_list.connect('activate', self._on_video_activated)
+        scrolled.set_child(self.video_list)
 
-        # Placeholder
+        # Shown under the results while a search or the next page is loading
+        self.loading_label = Gtk.Label()
+        self.loading_label.set_margin_top(12)
+        self.loading_label.set_margin_bottom(12)
+        self.loading_label.set_visible(False)
+
+        results_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        results_box.append(scrolled)
+        results_box.append(self.loading_label)
+
+        # Status page placeholder, shown instead of the list while it is empty
         placeholder = Adw.StatusPage()
         placeholder.set_icon_name('multimedia-player-symbolic')
         placeholder.set_title(_("youtube_title"))
         placeholder.set_description(_("youtube_search"))
-        self.youtube_listbox.set_placeholder(placeholder)
 
-        scrolled.set_child(self.youtube_listbox)
-        self.append(scrolled)
+        self.results_stack = Gtk.Stack()
+        self.results_stack.set_vexpand(True)
+        self.results_stack.add_named(placeholder, 'placeholder')
+        self.results_stack.add_named(results_box, 'results')
+        self.video_list.store.connect('items-changed', lambda *args: self._update_results_stack())
+        self.append(self.results_stack)
+
+    def _update_results_stack(self):
+        """Switch between the placeholder and the results"""
+        shown = self.video_list.store.get_n_items() or self.loading_label.get_visible()
+        self.results_stack.set_visible_child_name('results' if shown else 'placeholder')
 
-    def get_listbox(self):
-        """Get the YouTube listbox widget for external access"""
-        return self.youtube_listbox
+    def get_video_list(self):
+        """Get the YouTube result list view for external access"""
+        return self.video_list
 
     def get_search_entry(self):
         """Get the search entry widget for external access"""
@@ -183,32 +207,20 @@ class YouTubePage(Gtk.Box):
         """Get the duration filter dropdown for external access"""
         return self.youtube_duration_filter
 
+    def set_loading(self, text=None):
+        """Show a loading message under the results, or hide it with None"""
+        self.loading_label.set_label(text or '')
+        self.loading_label.set_visible(text is not None)
+        self._update_results_stack()
+
     def clear(self):
         """Clear all items from the YouTube results list"""
-        child = self.youtube_listbox.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.youtube_listbox.remove(child)
-            child = next_child
+        self.video_list.set_videos(())
         logger.debug("YouTube results list cleared")
 
-    def add_video_row(self, row):
-        """
-        Add a video row to the results list.
-
-        Args:
-            row: Gtk.ListBoxRow to add
-        """
-        self.youtube_listbox.append(row)
-
     def get_row_count(self):
         """Get the number of video results"""
-        count = 0
-        child = self.youtube_listbox.get_first_child()
-        while child:
-            count += 1
-            child = child.get_next_sibling()
-        return count
+        return self.video_list.store.get_n_items()
 
     def is_available(self):
         """Check if YouTube functionality is available"""
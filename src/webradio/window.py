@@ -5,20 +5,41 @@ gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 gi.require_version('Gst', '1.0')
 
-from gi.repository import Gtk, Adw, GLib, Gdk, GdkPixbuf, Gio, Gst
-import threading
+from gi.repository import Gtk, Adw, GLib, Gdk, Gio, Gst
+import functools
+import heapq
+import itertools
+import math
+import os
+import random
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import uuid4
+from typing import Optional
 from io import BytesIO
 
 from webradio.player import AudioPlayer, PlayerState
 from webradio.player_factory import create_player
 from webradio.logger import get_logger
-from webradio.ui.components.station_row import StationRow, MusicTrackRow, YouTubeVideoRow
-from webradio.ui.pages import DiscoverPage, FavoritesPage, HistoryPage, YouTubePage
+from webradio.ui.components.station_row import StationRow, MusicTrackRow
+from webradio.ui.components.recent_station_row import RecentStationRow
+from webradio.ui.components.player_controls import PlayerControls
+from webradio.ui.pages import (
+    DiscoverPage, FavoritesPage, HistoryPage, YouTubePage,
+    SearchPage, PlaylistsPage, ArtistsPage, AlbumsPage
+)
+from webradio.ui.helpers import clear_listbox, Debouncer
 from webradio.keyboard_shortcuts import create_shortcuts_manager
 from webradio.session_manager import create_session_manager
 from webradio.notifications import create_notification_manager
 from webradio.export_import import create_export_import_manager
+from webradio.station_cache import create_station_cache
+from webradio.favicon_cache import create_favicon_cache
+from webradio.icon_pool import create_icon_pool
 
 logger = get_logger(__name__)
 from webradio.radio_api import RadioBrowserAPI
@@ -29,18 +50,143 @@ from webradio.recorder import StreamRecorder
 from webradio.sleep_timer import SleepTimer
 from webradio.tray_icon import TrayIcon
 from webradio.music_library import MusicLibrary
-from webradio.youtube_music import YouTubeMusic
+from webradio.youtube_music import YouTubeMusic, thumbnail_url_for_size
 from webradio.inhibitor import SessionInhibitor
-from webradio.i18n import _
+from webradio.i18n import _, get_language
 
 # MPRIS import with fallback
 try:
     from webradio.mpris import MPRISInterface
     MPRIS_AVAILABLE = True
 except ImportError as e:
-    print(f"MPRIS not available: {e}")
+    logger.warning("MPRIS not available: %s", e)
     MPRIS_AVAILABLE = False
 
+# Delay after the last keystroke before a search-as-you-type request is sent
+SEARCH_DEBOUNCE_MS = 250
+
+# Seek bar drags are sent to the player once the slider rests this long
+# (every seek flushes the pipeline)
+SEEK_DEBOUNCE_MS = 100
+
+# Stream metadata updates arriving within this window are applied together
+TAGS_FLUSH_MS = 250
+
+# Interval of seek bar and time label updates while playing
+POSITION_UPDATE_SECONDS = 1
+
+# Position polls without a duration before a stream is treated as live
+LIVE_STREAM_POLLS = 5
+
+# Bands of the simulated spectrum animation (matches the visualizer's num_bands)
+SPECTRUM_BANDS = 80
+
+# Frame interval (microseconds) the spectrum animation speed is tuned for
+SPECTRUM_FRAME_US = 33000
+
+# Rows appended per main loop iteration when filling long lists
+ROW_BATCH_SIZE = 10
+
+# Stations added to favorites per main loop iteration when importing
+IMPORT_BATCH_SIZE = 50
+
+# Radio Browser counts one click per station and client per day, so a
+# station is reported again only after this long
+CLICK_INTERVAL_SECONDS = 24 * 60 * 60
+
+# Worker threads shared by all Radio Browser API requests
+IO_POOL_WORKERS = 4
+
+# Worker threads shared by favicon and thumbnail downloads
+IMAGE_POOL_WORKERS = 4
+
+# Scaled station logos kept in memory, enough for a few pages of search
+# results so going back to a list does not download or decode them again
+FAVICON_CACHE_ENTRIES = 512
+
+# Scaled YouTube thumbnail textures kept in memory: played videos at the
+# Now Playing (256px) and player bar (48px) sizes, plus result row logos (48px)
+THUMBNAIL_CACHE_ENTRIES = 256
+
+# Scaled YouTube thumbnails kept on disk (least recently used are removed)
+THUMBNAIL_CACHE_FILES = 200
+
+# Request headers of YouTube thumbnail downloads (browser user agent avoids blocks)
+THUMBNAIL_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+
+def _station_url(station):
+    """Get the stream URL of a station, preferring the resolved URL"""
+    return station.get('url_resolved') or station.get('url')
+
+
+@functools.lru_cache(maxsize=4)
+def _time_strings(language: str):
+    """Translated words of 'time ago' texts, looked up once per language"""
+    keys = ('ago', 'just_now', 'day', 'days', 'hour', 'hours', 'minute', 'minutes')
+    return {key: _(f'time_{key}') for key in keys}
+
+
+@functools.lru_cache(maxsize=64)
+def _time_ago_text(language: str, value: int, unit: Optional[str]):
+    """Translated 'time ago' text for value units (day/hour/minute, None: just now)"""
+    strings = _time_strings(language)
+    if unit is None:
+        return strings['just_now']
+    unit_text = strings[unit] if value == 1 else strings[f'{unit}s']
+    return f"{strings['ago']} {value} {unit_text}"
+
+
+def _join_list(value):
+    """Format a value that may be a list as comma separated text"""
+    return ', '.join(value) if isinstance(value, list) else value
+
+
+def _shorten_url(url):
+    """Shorten a long URL for display"""
+    return url[:60] + '...' if len(url) > 60 else url
+
+
+def _set_label_text(label, text):
+    """Set a label's text unless it already shows it (saves a relayout per update)"""
+    if label.get_label() != text:
+        label.set_label(text)
+
+
+# Sections of the Now Playing information dialog:
+# (group title, data source, ((key, row title, formatter, copy button), ...))
+# The 'station' source also has the stream URL under 'stream_url'.
+_INFO_SCHEMA = (
+    ('🎵 Currently Playing', 'tags', (
+        ('title', 'Title', str, False),
+        ('artist', 'Artist', str, False),
+        ('album', 'Album', str, False),
+    )),
+    ('📻 Station Information', 'station', (
+        ('country', 'Country', str, False),
+        ('state', 'State/Region', str, False),
+        ('language', 'Language', _join_list, False),
+        ('tags', 'Tags', _join_list, False),
+    )),
+    ('🔧 Technical Details', 'station', (
+        ('codec', 'Codec', lambda codec: codec.upper(), False),
+        ('bitrate', 'Bitrate', lambda bitrate: f"{bitrate} kbps", False),
+        ('homepage', 'Homepage', str, True),
+        ('stream_url', 'Stream URL', _shorten_url, True),
+    )),
+    ('📊 Statistics', 'station', (
+        ('votes', 'Votes', str, False),
+        ('clickcount', 'Total Clicks', str, False),
+    )),
+)
+
+
+@dataclass(slots=True)
+class _UIState:
+    """Handler state updated at input rate (keystrokes, shortcuts)"""
+    muted: bool = False
+    volume_before_mute: float = 1.0
+
 
 class WebRadioWindow(Adw.ApplicationWindow):
     """Main application window"""
@@ -64,25 +210,106 @@ class WebRadioWindow(Adw.ApplicationWindow):
         self.session_manager = create_session_manager()
         self.notification_manager = create_notification_manager(app)
         self.export_import_manager = create_export_import_manager()
+        self.station_cache = create_station_cache()
+        # Scaled logos are also kept on disk, so restarts do not download them again
+        self.favicon_cache = create_favicon_cache(
+            max_entries=FAVICON_CACHE_ENTRIES,
+            cache_dir=os.path.join(GLib.get_user_cache_dir(), 'webradio', 'favicons'))
+        # Scaled YouTube thumbnails of results and played videos, kept apart from station logos
+        self.thumbnail_cache = create_favicon_cache(
+            max_entries=THUMBNAIL_CACHE_ENTRIES, max_files=THUMBNAIL_CACHE_FILES,
+            cache_dir=os.path.join(GLib.get_user_cache_dir(), 'webradio', 'thumbs'))
 
         # Initialize managers with settings
         self.equalizer_manager = EqualizerManager(self.player, self.settings)
         self.recorder = StreamRecorder(self.player, self.settings)
         self.sleep_timer = SleepTimer(self.player, app, self.settings)
 
+        # Shared worker pool for API requests (avoids a new thread per request)
+        self._io_pool = ThreadPoolExecutor(max_workers=IO_POOL_WORKERS, thread_name_prefix='webradio-io')
+        self._image_pool = ThreadPoolExecutor(max_workers=IMAGE_POOL_WORKERS, thread_name_prefix='webradio-image')
+        self._image_pool.submit(self.favicon_cache.prune_disk)
+        self._image_pool.submit(self.thumbnail_cache.prune_disk)
+        # Click reports are fire-and-forget; one thread sends them in order so
+        # auditioning many stations never holds up station list requests
+        self._click_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='webradio-click')
+
+        # Shared HTTP session for image downloads (keep-alive per favicon host)
+        self._image_session = requests.Session()
+        self._image_session.headers.update({'User-Agent': 'WebRadioPlayer/1.0.0'})
+        self._image_session.mount('http://', HTTPAdapter(pool_maxsize=IMAGE_POOL_WORKERS))
+        self._image_session.mount('https://', HTTPAdapter(pool_maxsize=IMAGE_POOL_WORKERS))
+
+        # Station logos and YouTube thumbnails for all views
+        self.favicon_pool = create_icon_pool(self.favicon_cache, self._image_pool, self._image_session)
+        self.thumbnail_pool = create_icon_pool(
+            self.thumbnail_cache, self._image_pool, self._image_session,
+            timeout=10, headers=THUMBNAIL_HEADERS, url_for_size=thumbnail_url_for_size)
+        self._station_load_future = None
+        self._station_load_seq = 0  # Bumped for every new (non-append) station list request
+        self._global_search_seq = 0  # Bumped for every global search
+        self._click_times = {}  # Station uuid -> monotonic time of its last accepted click report
+        self._row_batches = {}  # ListBox -> [idle source id, rows left] of a running batched fill
+        self._history_rows = {}  # History entry key -> row shown in the history list
+        self._np_logo_url = None  # Favicon the Now Playing page is waiting for
+        self._np_logo_shown = None  # (url, texture) of the logo on the Now Playing page
+        self._np_dirty = False  # Now Playing page is out of date while hidden
+        self._thumb_generation = 0  # Bumped by every YouTube thumbnail or station logo load
+        self._youtube_thumb_future = None
+
+        # Themed icon paintables shared by rows that repeat the same icon
+        self._icon_cache = {}
+        self._icon_theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
+        self._icon_theme.connect('changed', lambda theme: self._icon_cache.clear())
+
+        # File filters for favorites import/export, built on first use
+        self._favorites_file_filters = None
+
+        # Library rows kept across reloads, keyed by artist / (album, artist)
+        self._artist_row_cache = {}
+        self._album_row_cache = {}
+
         # Flag to prevent recursive navigation button toggling
         self._updating_nav_buttons = False
+        # Sidebar button of the shown page, the only one that is active
+        self._active_nav = None
 
         # YouTube state for infinite scrolling
         self.youtube_current_query = ""
         self.youtube_current_offset = 0
         self.youtube_all_videos = []  # Store all fetched videos
+        # Fetched videos passing each duration filter, by minimum seconds
+        self._youtube_filtered = {}
         self.youtube_loading = False
 
+        # Search debounce timers and mute state
+        self._state = _UIState()
+        self._search_debounce = Debouncer(SEARCH_DEBOUNCE_MS, self._delayed_search)
+        self._global_search_debounce = Debouncer(SEARCH_DEBOUNCE_MS, self._delayed_global_search)
+
         # Seek bar state
         self.seeking = False  # Prevent update loop during seek
         self.is_seekable = False  # Whether current stream is seekable
+        self._stream_duration = None  # Duration (ns) of a seekable stream, once known
         self.position_update_timer = None
+        self._seek_debounce = Debouncer(SEEK_DEBOUNCE_MS, self._commit_seek)
+
+        # Stream metadata state
+        self._pending_tags = None  # Latest tags not yet shown
+        self._tags_timeout_id = None
+        self._shown_tags_key = None  # Station and track of the tags last shown
+
+        # Widgets and helpers created later, in _build_ui or after it
+        self.discover_page = None
+        self.search_entry = None
+        self.play_button = None
+        self.fav_button = None
+        self.record_button = None
+        self.volume_button = None
+        self.spectrum_visualizer = None
+        self.session_inhibitor = None
+        self.shortcuts_manager = None
+        self.toast_overlay = None
 
         # Connect player signals
         self.player.connect('state-changed', self._on_player_state_changed)
@@ -100,7 +327,8 @@ class WebRadioWindow(Adw.ApplicationWindow):
         if self.settings:
             self.settings.connect('changed::spectrum-style', self._on_spectrum_style_changed)
 
-        print(f"Managers initialized - Equalizer: {self.equalizer_manager is not None}, Recorder: {self.recorder is not None}")
+        logger.debug("Managers initialized - Equalizer: %s, Recorder: %s",
+                     self.equalizer_manager is not None, self.recorder is not None)
 
         # Setup actions
         self._setup_actions()
@@ -111,16 +339,16 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
         # Current state
         self.current_stations = []
-        self.spectrum_timeout_id = None
+        self.spectrum_tick_id = None
 
         # Minimize to tray behavior
         self.minimize_to_tray = True  # Enable minimize to tray when playing
 
         # Build UI immediately
-        print("Building UI...")
+        logger.debug("Building UI...")
         self._build_ui()
 
-        print("UI built successfully")
+        logger.debug("UI built successfully")
 
         # Setup system tray
         self.tray_icon = TrayIcon(self.get_application(), self)
@@ -132,9 +360,9 @@ class WebRadioWindow(Adw.ApplicationWindow):
         if MPRIS_AVAILABLE:
             try:
                 self.mpris = MPRISInterface(self)
-                print("MPRIS media controls enabled")
+                logger.debug("MPRIS media controls enabled")
             except Exception as e:
-                print(f"Failed to setup MPRIS: {e}")
+                logger.warning("Failed to setup MPRIS: %s", e)
                 self.mpris = None
         else:
             self.mpris = None
@@ -190,6 +418,17 @@ class WebRadioWindow(Adw.ApplicationWindow):
         self.view_stack = Adw.ViewStack()
         self.view_stack.set_vexpand(True)
 
+        # Pages that are only built when first shown (see _ensure_page)
+        self._lazy_page_builders = {
+            'search': self._create_search_page,
+            'playlists': self._create_playlists_page,
+            'local_music': self._create_local_music_page,
+            'artists': self._create_artists_page,
+            'albums': self._create_albums_page,
+            'youtube': self._create_youtube_page,
+        }
+        self._pages_built = set()
+
         # HOME Section Pages
         home_page = self._create_home_page()
         self.view_stack.add_named(home_page, "home")
@@ -197,29 +436,23 @@ class WebRadioWindow(Adw.ApplicationWindow):
         now_playing_page = self._create_now_playing_page()
         self.view_stack.add_named(now_playing_page, "now_playing")
 
-        search_page = self._create_search_page()
-        self.view_stack.add_named(search_page, "search")
+        self.view_stack.add_named(Gtk.Box(), "search")
 
         # LIBRARY Section Pages
-        playlists_page = self._create_playlists_page()
-        self.view_stack.add_named(playlists_page, "playlists")
-
-        local_music_page = self._create_local_music_page()
-        self.view_stack.add_named(local_music_page, "local_music")
+        self.view_stack.add_named(Gtk.Box(), "playlists")
 
-        artists_page = self._create_artists_page()
-        self.view_stack.add_named(artists_page, "artists")
+        # Built on first visit, it reads every track from the library database
+        self.view_stack.add_named(Gtk.Box(), "local_music")
 
-        albums_page = self._create_albums_page()
-        self.view_stack.add_named(albums_page, "albums")
+        self.view_stack.add_named(Gtk.Box(), "artists")
+        self.view_stack.add_named(Gtk.Box(), "albums")
 
         # ONLINE Section Pages
         # Create discover page (used for both Internet Radio and Discover)
         discover_page = self._create_discover_page()
         self.view_stack.add_named(discover_page, "discover")
 
-        youtube_page = self._create_youtube_page()
-        self.view_stack.add_named(youtube_page, "youtube")
+        self.view_stack.add_named(Gtk.Box(), "youtube")
 
         favorites_page = self._create_favorites_page()
         self.view_stack.add_named(favorites_page, "favorites")
@@ -247,8 +480,9 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
         # Set home page as initial view
         self.view_stack.set_visible_child_name("home")
+        self.view_stack.connect('notify::visible-child-name', self._on_visible_page_changed)
 
-        print("Spotify-style UI created")
+        logger.debug("Spotify-style UI created")
 
     def _create_sidebar(self):
         """Create professional sidebar with sections like Spotify"""
@@ -321,8 +555,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
         label.set_margin_end(16)
         label.set_margin_top(16)
         label.set_margin_bottom(8)
-        label.add_css_class('sidebar-section-label')
-        label.add_css_class('caption-heading')
+        label.set_css_classes(['sidebar-section-label', 'caption-heading'])
         container.append(label)
 
     def _add_section_separator(self, container):
@@ -366,17 +599,13 @@ class WebRadioWindow(Adw.ApplicationWindow):
         if button.get_active():
             self._updating_nav_buttons = True
             try:
-                # Deactivate other buttons
-                all_nav_buttons = [
-                    self.nav_home, self.nav_now_playing, self.nav_search,
-                    self.nav_playlists, self.nav_local_music, self.nav_artists, self.nav_albums,
-                    self.nav_radio, self.nav_youtube, self.nav_favorites, self.nav_history
-                ]
-                for nav_button in all_nav_buttons:
-                    if nav_button != button and nav_button.get_active():
-                        nav_button.set_active(False)
+                # Deactivate the previous button, no other one can be active
+                if self._active_nav is not None and self._active_nav is not button:
+                    self._active_nav.set_active(False)
+                self._active_nav = button
 
                 # Switch page
+                self._ensure_page(page_name)
                 self.view_stack.set_visible_child_name(page_name)
             finally:
                 self._updating_nav_buttons = False
@@ -397,20 +626,17 @@ class WebRadioWindow(Adw.ApplicationWindow):
             on_load_top_stations=self._load_top_stations,
             on_load_by_tag=self._load_by_tag,
             on_station_scroll=self._on_station_scroll,
-            on_station_activated=self._on_station_activated
+            on_station_activated=self._on_station_item_activated,
+            load_station_logo=self._load_favicon
         )
 
         # Store references for backwards compatibility
         self.search_entry = page.get_search_entry()
-        self.station_listbox = page.get_station_listbox()
+        self.station_list = page.get_station_list()
         self.country_dropdown = page.get_country_dropdown()
         self.country_store = page.get_country_store()
         self.station_scrolled = page.station_scrolled
 
-        # Store search state references
-        self.search_timeout_id = None
-        self.global_search_timeout_id = None
-
         # Store pagination state references (delegate to page)
         self.discover_page = page
         self.country_names = page.country_names
@@ -420,56 +646,56 @@ class WebRadioWindow(Adw.ApplicationWindow):
     # Pagination properties delegated to discover_page
     @property
     def current_offset(self):
-        return self.discover_page.current_offset if hasattr(self, 'discover_page') else 0
+        return self.discover_page.current_offset if self.discover_page is not None else 0
 
     @current_offset.setter
     def current_offset(self, value):
-        if hasattr(self, 'discover_page'):
+        if self.discover_page is not None:
             self.discover_page.current_offset = value
 
     @property
     def stations_per_page(self):
-        return self.discover_page.stations_per_page if hasattr(self, 'discover_page') else 50
+        return self.discover_page.stations_per_page if self.discover_page is not None else 50
 
     @stations_per_page.setter
     def stations_per_page(self, value):
-        if hasattr(self, 'discover_page'):
+        if self.discover_page is not None:
             self.discover_page.stations_per_page = value
 
     @property
     def is_loading_more(self):
-        return self.discover_page.is_loading_more if hasattr(self, 'discover_page') else False
+        return self.discover_page.is_loading_more if self.discover_page is not None else False
 
     @is_loading_more.setter
     def is_loading_more(self, value):
-        if hasattr(self, 'discover_page'):
+        if self.discover_page is not None:
             self.discover_page.is_loading_more = value
 
     @property
     def has_more_stations(self):
-        return self.discover_page.has_more_stations if hasattr(self, 'discover_page') else True
+        return self.discover_page.has_more_stations if self.discover_page is not None else True
 
     @has_more_stations.setter
     def has_more_stations(self, value):
-        if hasattr(self, 'discover_page'):
+        if self.discover_page is not None:
             self.discover_page.has_more_stations = value
 
     @property
     def current_filter_type(self):
-        return self.discover_page.current_filter_type if hasattr(self, 'discover_page') else None
+        return self.discover_page.current_filter_type if self.discover_page is not None else None
 
     @current_filter_type.setter
     def current_filter_type(self, value):
-        if hasattr(self, 'discover_page'):
+        if self.discover_page is not None:
             self.discover_page.current_filter_type = value
 
     @property
     def current_filter_value(self):
-        return self.discover_page.current_filter_value if hasattr(self, 'discover_page') else None
+        return self.discover_page.current_filter_value if self.discover_page is not None else None
 
     @current_filter_value.setter
     def current_filter_value(self, value):
-        if hasattr(self, 'discover_page'):
+        if self.discover_page is not None:
             self.discover_page.current_filter_value = value
 
     def _create_favorites_page(self):
@@ -615,6 +841,10 @@ class WebRadioWindow(Adw.ApplicationWindow):
             style = self.settings.get_string('spectrum-style')
             self.spectrum_visualizer.set_style(style)
 
+        # Only animate while the visualizer is on screen
+        self.spectrum_visualizer.connect('map', self._on_spectrum_mapped)
+        self.spectrum_visualizer.connect('unmap', self._on_spectrum_unmapped)
+
         spectrum_frame.set_child(self.spectrum_visualizer)
         page.append(spectrum_frame)
 
@@ -739,7 +969,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
             recent_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
 
             for station in recent_stations:
-                recent_row = self._create_compact_station_row(station)
+                recent_row = RecentStationRow(station, self._play_station_from_home)
                 recent_box.append(recent_row)
 
             page.append(recent_box)
@@ -808,43 +1038,34 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
         return box
 
-    def _create_compact_station_row(self, station):
-        """Create a compact clickable station row for recent stations"""
-        button = Gtk.Button()
-        button.set_has_frame(False)
-        button.connect('clicked', lambda b: self._play_station_from_home(station))
-
-        row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        row_box.set_margin_start(8)
-        row_box.set_margin_end(8)
-        row_box.set_margin_top(4)
-        row_box.set_margin_bottom(4)
+    def _get_icon_paintable(self, icon_name, size):
+        """Get a cached themed icon paintable for the given name and size"""
+        # The scale is part of the key, so moving to a HiDPI monitor loads sharper icons
+        scale = self.get_scale_factor()
+        key = (icon_name, size, scale)
+        paintable = self._icon_cache.get(key)
+        if paintable is None:
+            paintable = self._icon_theme.lookup_icon(
+                icon_name, None, size, scale,
+                Gtk.TextDirection.NONE, 0
+            )
+            self._icon_cache[key] = paintable
+        return paintable
 
-        # Small icon
-        icon = Gtk.Image()
-        icon.set_from_icon_name('audio-x-generic')
-        icon.set_pixel_size(32)
-        row_box.append(icon)
+    def _ensure_page(self, page_name):
+        """Build a lazily created page and swap it in for its placeholder"""
+        builder = self._lazy_page_builders.get(page_name)
+        if builder is None or page_name in self._pages_built:
+            return
 
-        # Station name
-        name_label = Gtk.Label(label=station.get('name', 'Unknown Station'))
-        name_label.set_xalign(0)
-        name_label.set_ellipsize(3)
-        name_label.set_hexpand(True)
-        row_box.append(name_label)
-
-        # Play icon
-        play_icon = Gtk.Image()
-        play_icon.set_from_icon_name('media-playback-start-symbolic')
-        play_icon.set_pixel_size(16)
-        play_icon.set_opacity(0.5)
-        row_box.append(play_icon)
-
-        button.set_child(row_box)
-        return button
+        self._pages_built.add(page_name)
+        page = builder()
+        self.view_stack.remove(self.view_stack.get_child_by_name(page_name))
+        self.view_stack.add_named(page, page_name)
 
     def _navigate_to(self, page_name):
         """Navigate to a specific page"""
+        self._ensure_page(page_name)
         self.view_stack.set_visible_child_name(page_name)
 
         # Update navigation buttons
@@ -859,131 +1080,36 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
     def _play_station_from_home(self, station):
         """Play a station from the home page recent list"""
-        url = station.get('url_resolved') or station.get('url')
+        url = _station_url(station)
         if url:
             self.player.play(url, station)
-            self._update_now_playing_page()
+            self._update_now_playing_page_if_visible()
 
     def _create_search_page(self):
-        """Create global search page"""
-        page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        page.set_margin_start(18)
-        page.set_margin_end(18)
-        page.set_margin_top(18)
-        page.set_margin_bottom(18)
-        page.add_css_class('content-page')
-
-        # Title
-        title = Gtk.Label(label=_("Search"))
-        title.add_css_class('title-2')
-        title.set_xalign(0)
-        page.append(title)
-
-        # Search box
-        search_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-
-        self.global_search_entry = Gtk.Entry()
-        self.global_search_entry.set_placeholder_text(_('search_placeholder'))
-        self.global_search_entry.set_hexpand(True)
-        self.global_search_entry.connect('activate', self._on_global_search)
-        self.global_search_entry.connect('changed', self._on_global_search_changed)
-        search_box.append(self.global_search_entry)
-
-        search_btn = Gtk.Button(label=_('search_button'))
-        search_btn.add_css_class('pill')
-        search_btn.add_css_class('suggested-action')
-        search_btn.connect('clicked', self._on_global_search)
-        search_box.append(search_btn)
-
-        page.append(search_box)
-
-        # Results area with scrolled window
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        scrolled.set_vexpand(True)
-
-        self.global_search_listbox = Gtk.ListBox()
-        self.global_search_listbox.add_css_class('boxed-list')
-        self.global_search_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.global_search_listbox.connect('row-activated', self._on_global_search_station_activated)
-        scrolled.set_child(self.global_search_listbox)
-
-        page.append(scrolled)
+        """Create global search page using SearchPage component"""
+        page = SearchPage(
+            on_search_activate=self._on_global_search,
+            on_search_changed=self._on_global_search_changed,
+            on_station_activated=self._on_global_search_station_activated
+        )
 
-        # Initial status page
-        self.global_search_status = Adw.StatusPage()
-        self.global_search_status.set_icon_name('system-search-symbolic')
-        self.global_search_status.set_title(_("Search"))
-        self.global_search_status.set_description(_("search_description"))
-        self.global_search_listbox.append(self.global_search_status)
+        # Store references for backwards compatibility
+        self.global_search_entry = page.get_search_entry()
+        self.global_search_listbox = page.get_listbox()
+        self.global_search_status = page.get_status_page()
 
         return page
 
     def _create_playlists_page(self):
-        """Create playlists page"""
-        page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        page.set_margin_start(18)
-        page.set_margin_end(18)
-        page.set_margin_top(18)
-        page.set_margin_bottom(18)
-        page.add_css_class('content-page')
-
-        # Header
-        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-
-        title = Gtk.Label(label=_("playlists_title"))
-        title.add_css_class('title-2')
-        title.set_xalign(0)
-        title.set_hexpand(True)
-        header_box.append(title)
-
-        create_btn = Gtk.Button(label=_("create_playlist"))
-        create_btn.add_css_class('pill')
-        create_btn.set_icon_name('list-add-symbolic')
-        header_box.append(create_btn)
-
-        page.append(header_box)
-
-        # Playlist list (to be implemented)
-        status_page = Adw.StatusPage()
-        status_page.set_icon_name('view-list-symbolic')
-        status_page.set_title(_("no_playlists"))
-        status_page.set_description(_("create_playlist_hint"))
-        page.append(status_page)
-
-        return page
+        """Create playlists page using PlaylistsPage component"""
+        return PlaylistsPage()
 
     def _create_artists_page(self):
-        """Create artists page"""
-        page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        page.set_margin_start(18)
-        page.set_margin_end(18)
-        page.set_margin_top(18)
-        page.set_margin_bottom(18)
-        page.add_css_class('content-page')
+        """Create artists page using ArtistsPage component"""
+        page = ArtistsPage()
 
-        # Title
-        title = Gtk.Label(label=_("artists_title"))
-        title.add_css_class('title-2')
-        title.set_xalign(0)
-        page.append(title)
-
-        # Artists list
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_vexpand(True)
-
-        self.artists_listbox = Gtk.ListBox()
-        self.artists_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-
-        # Placeholder
-        placeholder = Adw.StatusPage()
-        placeholder.set_icon_name('system-users-symbolic')
-        placeholder.set_title(_("no_artists"))
-        placeholder.set_description(_("add_folder_hint"))
-        self.artists_listbox.set_placeholder(placeholder)
-
-        scrolled.set_child(self.artists_listbox)
-        page.append(scrolled)
+        # Store references for backwards compatibility
+        self.artists_listbox = page.get_listbox()
 
         # Load artists
         self._load_artists()
@@ -991,36 +1117,11 @@ class WebRadioWindow(Adw.ApplicationWindow):
         return page
 
     def _create_albums_page(self):
-        """Create albums page"""
-        page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        page.set_margin_start(18)
-        page.set_margin_end(18)
-        page.set_margin_top(18)
-        page.set_margin_bottom(18)
-        page.add_css_class('content-page')
+        """Create albums page using AlbumsPage component"""
+        page = AlbumsPage()
 
-        # Title
-        title = Gtk.Label(label=_("albums_title"))
-        title.add_css_class('title-2')
-        title.set_xalign(0)
-        page.append(title)
-
-        # Albums grid
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_vexpand(True)
-
-        self.albums_listbox = Gtk.ListBox()
-        self.albums_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-
-        # Placeholder
-        placeholder = Adw.StatusPage()
-        placeholder.set_icon_name('media-optical-symbolic')
-        placeholder.set_title(_("no_albums"))
-        placeholder.set_description(_("add_folder_hint"))
-        self.albums_listbox.set_placeholder(placeholder)
-
-        scrolled.set_child(self.albums_listbox)
-        page.append(scrolled)
+        # Store references for backwards compatibility
+        self.albums_listbox = page.get_listbox()
 
         # Load albums
         self._load_albums()
@@ -1034,19 +1135,21 @@ class WebRadioWindow(Adw.ApplicationWindow):
             on_search=self._on_youtube_search,
             on_filter_changed=self._on_youtube_filter_changed,
             on_scroll=self._on_youtube_scroll,
-            on_video_activated=self._on_youtube_video_activated
+            on_video_activated=self._on_youtube_video_activated,
+            load_thumbnail=self._load_youtube_row_thumbnail
         )
 
         # Store references for backwards compatibility
+        self.youtube_page = page
         if page.is_available():
             self.youtube_search_entry = page.get_search_entry()
             self.youtube_duration_filter = page.get_duration_filter()
-            self.youtube_listbox = page.get_listbox()
+            self.youtube_list = page.get_video_list()
         else:
             # yt-dlp not available, set dummy references
             self.youtube_search_entry = None
             self.youtube_duration_filter = None
-            self.youtube_listbox = None
+            self.youtube_list = None
 
         return page
 
@@ -1055,208 +1158,104 @@ class WebRadioWindow(Adw.ApplicationWindow):
         artists = self.music_library.get_all_artists()
 
         # Clear existing
-        child = self.artists_listbox.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.artists_listbox.remove(child)
-            child = next_child
+        clear_listbox(self.artists_listbox)
 
-        # Add artist rows
+        # Reuse rows from the previous load, only build rows for new artists
+        cache = {}
         for artist in artists:
-            row = Gtk.ListBoxRow()
-            label = Gtk.Label(label=artist)
-            label.set_xalign(0)
-            label.set_margin_start(12)
-            label.set_margin_end(12)
-            label.set_margin_top(8)
-            label.set_margin_bottom(8)
-            row.set_child(label)
+            row = self._artist_row_cache.get(artist)
+            if row is None:
+                row = self._create_artist_row(artist)
+            cache[artist] = row
             self.artists_listbox.append(row)
+        self._artist_row_cache = cache
+
+    def _create_artist_row(self, artist):
+        """Create an artist list row"""
+        row = Gtk.ListBoxRow()
+        label = Gtk.Label(label=artist)
+        label.set_xalign(0)
+        label.set_margin_start(12)
+        label.set_margin_end(12)
+        label.set_margin_top(8)
+        label.set_margin_bottom(8)
+        row.set_child(label)
+        return row
 
     def _load_albums(self):
         """Load albums from music library"""
         albums = self.music_library.get_all_albums()
 
         # Clear existing
-        child = self.albums_listbox.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.albums_listbox.remove(child)
-            child = next_child
+        clear_listbox(self.albums_listbox)
 
-        # Add album rows
+        # Reuse rows from the previous load, only build rows for new albums
+        cache = {}
         for album in albums:
-            row = Gtk.ListBoxRow()
-
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-            box.set_margin_start(12)
-            box.set_margin_end(12)
-            box.set_margin_top(8)
-            box.set_margin_bottom(8)
-
-            album_label = Gtk.Label(label=album['album'])
-            album_label.set_xalign(0)
-            box.append(album_label)
-
-            artist_label = Gtk.Label(label=album['artist'])
-            artist_label.set_xalign(0)
-            artist_label.set_opacity(0.7)
-            box.append(artist_label)
-
-            row.set_child(box)
+            key = (album['album'], album['artist'])
+            row = self._album_row_cache.get(key)
+            if row is None:
+                row = self._create_album_row(album)
+            cache[key] = row
             self.albums_listbox.append(row)
+        self._album_row_cache = cache
 
-    def _create_player_controls(self):
-        """Create player control bar with 3 logical groups - Spotify style"""
-        # Main container with separator
-        main_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        main_container.add_css_class('player-bar')
-
-        # No clamp - full width like Spotify
-        bar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=18)
-        bar.set_margin_start(18)
-        bar.set_margin_end(18)
-        bar.set_margin_top(12)
-        bar.set_margin_bottom(12)
-
-        # GROUP 1: Station Info (left side, expanding)
-        info_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        info_box.set_hexpand(True)
-
-        # Logo (48px instead of 64px)
-        self.playing_logo = Gtk.Image()
-        self.playing_logo.set_pixel_size(48)
-        self.playing_logo.set_from_icon_name('audio-x-generic')
-        info_box.append(self.playing_logo)
-
-        # Station Name + Metadata (vertical)
-        text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        text_box.set_valign(Gtk.Align.CENTER)
-
-        self.station_label = Gtk.Label(label=_('no_station_playing'))
-        self.station_label.set_xalign(0)
-        self.station_label.set_ellipsize(3)  # ELLIPSIZE_END
-        self.station_label.add_css_class('heading')
-        text_box.append(self.station_label)
-
-        self.metadata_label = Gtk.Label(label='')
-        self.metadata_label.set_xalign(0)
-        self.metadata_label.set_ellipsize(3)
-        self.metadata_label.set_opacity(0.5)
-        text_box.append(self.metadata_label)
-
-        info_box.append(text_box)
-        bar.append(info_box)
-
-        # Seek bar (timeline) - between info and controls
-        seek_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-        seek_box.set_hexpand(True)
-
-        # Time labels container
-        time_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-
-        self.current_time_label = Gtk.Label(label="0:00")
-        self.current_time_label.set_xalign(0)
-        self.current_time_label.set_opacity(0.7)
-        time_box.append(self.current_time_label)
-
-        # Spacer
-        spacer = Gtk.Label()
-        spacer.set_hexpand(True)
-        time_box.append(spacer)
-
-        self.total_time_label = Gtk.Label(label="0:00")
-        self.total_time_label.set_xalign(1)
-        self.total_time_label.set_opacity(0.7)
-        time_box.append(self.total_time_label)
-
-        # Seek scale
-        self.seek_scale = Gtk.Scale()
-        self.seek_scale.set_range(0, 100)
-        self.seek_scale.set_value(0)
-        self.seek_scale.set_draw_value(False)
-        self.seek_scale.set_hexpand(True)
-        # Use change-value instead of value-changed to control when to seek
-        self.seek_scale.connect('change-value', self._on_seek_changed)
-        self.seek_scale.set_sensitive(False)
-
-        seek_box.append(self.seek_scale)
-        seek_box.append(time_box)
-        bar.append(seek_box)
-
-        # GROUP 2: Playback Controls (center)
-        controls_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        controls_box.add_css_class('linked')
-
-        # Favorite button (before play)
-        self.fav_button = Gtk.ToggleButton()
-        self.fav_button.set_icon_name('starred-symbolic')
-        self.fav_button.set_tooltip_text(_('Add to favorites'))
-        self.fav_button.connect('toggled', self._on_favorite_toggled)
-        self.fav_button.set_sensitive(False)
-        controls_box.append(self.fav_button)
-
-        # Play/Pause (suggested-action + circular)
-        self.play_button = Gtk.Button()
-        self.play_button.set_icon_name('media-playback-start-symbolic')
-        self.play_button.set_tooltip_text(_('Play/Pause'))
-        self.play_button.connect('clicked', self._on_play_pause)
-        self.play_button.add_css_class('suggested-action')
-        self.play_button.add_css_class('circular')
-        self.play_button.set_sensitive(False)
-        controls_box.append(self.play_button)
-
-        # Stop button
-        self.stop_button = Gtk.Button()
-        self.stop_button.set_icon_name('media-playback-stop-symbolic')
-        self.stop_button.set_tooltip_text(_('Stop'))
-        self.stop_button.connect('clicked', self._on_stop)
-        self.stop_button.set_sensitive(False)
-        controls_box.append(self.stop_button)
-
-        bar.append(controls_box)
-
-        # GROUP 3: Features + Volume (right side)
-        features_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-
-        # Record button
-        self.record_button = Gtk.ToggleButton()
-        self.record_button.set_icon_name('media-record-symbolic')
-        self.record_button.set_tooltip_text(_('Record Stream'))
-        self.record_button.connect('toggled', self._on_record_toggled)
-        self.record_button.set_sensitive(False)
-        features_box.append(self.record_button)
-
-        # Recording label (dynamically hidden)
-        self.recording_label = Gtk.Label(label='')
-        self.recording_label.add_css_class('error')
-        self.recording_label.set_visible(False)
-        features_box.append(self.recording_label)
+    def _create_album_row(self, album):
+        """Create an album list row"""
+        row = Gtk.ListBoxRow()
 
-        # Sleep timer
-        self.sleep_button = Gtk.MenuButton()
-        self.sleep_button.set_icon_name('alarm-symbolic')
-        self.sleep_button.set_tooltip_text(_('Sleep Timer'))
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        box.set_margin_start(12)
+        box.set_margin_end(12)
+        box.set_margin_top(8)
+        box.set_margin_bottom(8)
 
-        # Create sleep timer menu
-        sleep_menu = Gio.Menu()
-        for minutes in self.sleep_timer.get_presets():
-            sleep_menu.append(f"{minutes} min", f"win.sleep-timer::{minutes}")
-        sleep_menu.append(_("Stop Timer"), "win.sleep-timer-stop")
+        album_label = Gtk.Label(label=album['album'])
+        album_label.set_xalign(0)
+        box.append(album_label)
 
-        self.sleep_button.set_menu_model(sleep_menu)
-        features_box.append(self.sleep_button)
+        artist_label = Gtk.Label(label=album['artist'])
+        artist_label.set_xalign(0)
+        artist_label.set_opacity(0.7)
+        box.append(artist_label)
 
-        # Volume button (Gtk.VolumeButton instead of Scale!)
-        self.volume_button = Gtk.VolumeButton()
-        self.volume_button.set_value(1.0)
-        self.volume_button.connect('value-changed', self._on_volume_button_changed)
-        features_box.append(self.volume_button)
+        row.set_child(box)
+        return row
 
-        bar.append(features_box)
+    def _create_player_controls(self):
+        """Create player control bar with 3 logical groups - Spotify style"""
+        # Widgets and signal handlers come from data/ui/player_controls.ui
+        controls = PlayerControls(
+            on_seek_changed=self._on_seek_changed,
+            on_favorite_toggled=self._on_favorite_toggled,
+            on_play_pause=self._on_play_pause,
+            on_stop=self._on_stop,
+            on_record_toggled=self._on_record_toggled,
+            on_volume_changed=self._on_volume_button_changed,
+        )
 
-        main_container.append(bar)
-        return main_container
+        self.playing_logo = controls.playing_logo
+        self.station_label = controls.station_label
+        self.metadata_label = controls.metadata_label
+        self.seek_scale = controls.seek_scale
+        self.current_time_label = controls.current_time_label
+        self.total_time_label = controls.total_time_label
+        self.fav_button = controls.fav_button
+        self.play_button = controls.play_button
+        self.stop_button = controls.stop_button
+        self.record_button = controls.record_button
+        self.recording_label = controls.recording_label
+        self.sleep_button = controls.sleep_button
+        self.volume_button = controls.volume_button
+
+        # Sleep timer menu is built once in _setup_actions
+        self.sleep_button.set_menu_model(self._sleep_menu)
+
+        # No position polling while the window is hidden in the background
+        self.seek_scale.connect('map', self._on_seek_scale_mapped)
+        self.seek_scale.connect('unmap', self._on_seek_scale_unmapped)
+
+        return controls
 
     def _setup_actions(self):
         """Setup window actions"""
@@ -1274,6 +1273,12 @@ class WebRadioWindow(Adw.ApplicationWindow):
         stop_timer_action.connect("activate", self._on_sleep_timer_stop)
         self.add_action(stop_timer_action)
 
+        # Sleep timer menu (shared by the player bar)
+        self._sleep_menu = Gio.Menu()
+        for minutes in self.sleep_timer.get_presets():
+            self._sleep_menu.append(f"{minutes} min", f"win.sleep-timer::{minutes}")
+        self._sleep_menu.append(_("Stop Timer"), "win.sleep-timer-stop")
+
         # Show keyboard shortcuts action
         shortcuts_action = Gio.SimpleAction.new("show-shortcuts", None)
         shortcuts_action.connect("activate", lambda a, p: self._show_shortcuts_dialog())
@@ -1281,23 +1286,20 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
     def _start_loading_stations(self):
         """Start loading stations"""
-        print("Starting to load stations...")
+        logger.debug("Starting to load stations...")
+        # Show the last known top stations right away, then refresh them
+        cached = self.station_cache.load('top_stations')
+        if cached:
+            self._display_stations(cached)
         self._load_top_stations()
         # Load countries for dropdown
         self._load_countries()
         return False
 
-    def _on_station_scroll(self, adjustment):
-        """Handle scrolling to load more stations"""
-        # Check if we're near the bottom (within 200 pixels)
-        value = adjustment.get_value()
-        upper = adjustment.get_upper()
-        page_size = adjustment.get_page_size()
-
-        if value + page_size >= upper - 200:
-            # Near bottom, load more if available
-            if not self.is_loading_more and self.has_more_stations:
-                self._load_more_stations()
+    def _on_station_scroll(self, scrolled, pos):
+        """Load more stations once the list is scrolled to the bottom"""
+        if pos == Gtk.PositionType.BOTTOM and not self.is_loading_more and self.has_more_stations:
+            self._load_more_stations()
 
     def _load_more_stations(self):
         """Load the next batch of stations"""
@@ -1307,7 +1309,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
         self.is_loading_more = True
         self.current_offset += self.stations_per_page
 
-        print(f"Loading more stations (offset: {self.current_offset})...")
+        logger.debug("Loading more stations (offset: %s)...", self.current_offset)
 
         # Load based on current filter type
         if self.current_filter_type == 'top':
@@ -1317,6 +1319,30 @@ class WebRadioWindow(Adw.ApplicationWindow):
         elif self.current_filter_type == 'search':
             self._on_search_paged(append=True)
 
+    def _submit_station_load(self, load, append=False):
+        """Run a station list loader on the I/O pool
+
+        The loader is called with the request sequence number, which it hands
+        back to _show_station_page with its results. A new (non-append)
+        request supersedes any load that is still queued, and results of a
+        superseded load that was already running are dropped, so stale
+        results never reach the station list.
+        """
+        if not append:
+            self._station_load_seq += 1
+        previous = self._station_load_future
+        if not append and previous and previous.cancel():
+            # A cancelled page load never runs, so release the pagination lock
+            self.is_loading_more = False
+        self._station_load_future = self._io_pool.submit(load, self._station_load_seq)
+
+    def _show_station_page(self, seq, stations, append=False):
+        """Display loaded stations unless a newer request has replaced them"""
+        if seq != self._station_load_seq:
+            logger.debug("Dropping %d stations from a superseded request", len(stations))
+            return
+        self._display_stations(stations, append)
+
     def _load_top_stations(self):
         """Load top voted stations (reset pagination)"""
         self.current_offset = 0
@@ -1327,25 +1353,29 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
     def _load_top_stations_paged(self, append=False):
         """Load top voted stations with pagination"""
-        print(f"Loading top stations (offset: {self.current_offset})...")
+        logger.debug("Loading top stations (offset: %d)", self.current_offset)
 
-        def load():
+        offset = self.current_offset
+
+        def load(seq):
             try:
-                stations = self.api.get_top_stations(self.stations_per_page, offset=self.current_offset)
-                print(f"Loaded {len(stations)} stations")
+                stations = self.api.get_top_stations(self.stations_per_page, offset=offset)
+                logger.debug("Loaded %d stations", len(stations))
+
+                # Remember the first page for instant display on next start
+                if offset == 0 and stations:
+                    self.station_cache.save('top_stations', stations)
 
                 if len(stations) < self.stations_per_page:
                     self.has_more_stations = False
 
-                GLib.idle_add(self._display_stations, stations, append)
+                self._dispatch(self._show_station_page, seq, stations, append)
                 self.is_loading_more = False
-            except Exception as e:
-                print(f"Error loading stations: {e}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                logger.exception("Error loading stations")
                 self.is_loading_more = False
 
-        threading.Thread(target=load, daemon=True).start()
+        self._submit_station_load(load, append)
 
     def _load_by_tag(self, tag: str):
         """Load stations by tag (reset pagination)"""
@@ -1357,48 +1387,54 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
     def _load_by_tag_paged(self, tag: str, append=False):
         """Load stations by tag with pagination"""
-        print(f"Loading stations with tag: {tag} (offset: {self.current_offset})")
+        logger.debug("Loading stations with tag: %s (offset: %d)", tag, self.current_offset)
 
-        def load():
+        def load(seq):
             try:
                 stations = self.api.search_by_tag(tag, self.stations_per_page, offset=self.current_offset)
-                print(f"Loaded {len(stations)} stations for tag {tag}")
+                logger.debug("Loaded %d stations for tag %s", len(stations), tag)
 
                 if len(stations) < self.stations_per_page:
                     self.has_more_stations = False
 
-                GLib.idle_add(self._display_stations, stations, append)
+                self._dispatch(self._show_station_page, seq, stations, append)
                 self.is_loading_more = False
             except Exception as e:
-                print(f"Error loading stations: {e}")
+                logger.error("Error loading stations: %s", e)
                 self.is_loading_more = False
 
-        threading.Thread(target=load, daemon=True).start()
+        self._submit_station_load(load, append)
 
     def _load_countries(self):
         """Load available countries in background"""
         def load():
             try:
                 countries = self.api.get_countries(300)
-                # Sort by station count (descending)
-                countries_sorted = sorted(countries, key=lambda x: x.get('stationcount', 0), reverse=True)
 
-                # Take top 50 countries with most stations
-                top_countries = countries_sorted[:50]
+                # Take top 50 countries with most stations (descending)
+                top_countries = heapq.nlargest(50, countries, key=lambda x: x.get('stationcount', 0))
+
+                # Build dropdown labels here so the UI thread only splices
+                names = []
+                labels = []
+                for country in top_countries:
+                    name = country.get('name', '')
+                    count = country.get('stationcount', 0)
+                    if name and count > 0:
+                        names.append(name)
+                        labels.append(f"{name} ({count})")
 
                 def update_ui():
-                    for country in top_countries:
-                        name = country.get('name', '')
-                        count = country.get('stationcount', 0)
-                        if name and count > 0:
-                            self.country_store.append(f"{name} ({count})")
-                            self.country_names.append(name)
+                    # Single splice emits one items-changed instead of one per country
+                    self.country_store.splice(self.country_store.get_n_items(), 0, labels)
+                    self.country_names.extend(names)
+                    return False
 
                 GLib.idle_add(update_ui)
             except Exception as e:
-                print(f"Error loading countries: {e}")
+                logger.error("Error loading countries: %s", e)
 
-        threading.Thread(target=load, daemon=True).start()
+        self._io_pool.submit(load)
 
     def _on_country_changed(self, dropdown, param):
         """Handle country filter change"""
@@ -1409,7 +1445,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
         country = self.country_names[selected]
 
         if country:  # Not "All Countries"
-            print(f"Filtering by country: {country}")
+            logger.debug("Filtering by country: %s", country)
             self._load_by_country(country)
         else:
             # Load top stations when "All Countries" is selected
@@ -1417,17 +1453,17 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
     def _load_by_country(self, country: str):
         """Load stations by country"""
-        print(f"Loading stations for country: {country}")
+        logger.debug("Loading stations for country: %s", country)
 
-        def load():
+        def load(seq):
             try:
                 stations = self.api.search_by_country(country, 100)
-                print(f"Loaded {len(stations)} stations for {country}")
-                GLib.idle_add(self._display_stations, stations)
+                logger.debug("Loaded %d stations for %s", len(stations), country)
+                self._dispatch(self._show_station_page, seq, stations)
             except Exception as e:
-                print(f"Error loading stations: {e}")
+                logger.error("Error loading stations: %s", e)
 
-        threading.Thread(target=load, daemon=True).start()
+        self._submit_station_load(load)
 
     def _on_search(self, widget):
         """Handle search (reset pagination)"""
@@ -1446,67 +1482,52 @@ class WebRadioWindow(Adw.ApplicationWindow):
         """Handle search with pagination"""
         query = self.current_filter_value if append else self.search_entry.get_text().strip()
 
-        print(f"Searching for: {query} (offset: {self.current_offset})")
+        logger.debug("Searching for: %s (offset: %d)", query, self.current_offset)
 
-        def search():
+        def search(seq):
             try:
                 stations = self.api.search_stations(query, self.stations_per_page, offset=self.current_offset)
-                print(f"Found {len(stations)} stations")
+                logger.debug("Found %d stations", len(stations))
 
                 if len(stations) < self.stations_per_page:
                     self.has_more_stations = False
 
-                GLib.idle_add(self._display_stations, stations, append)
+                self._dispatch(self._show_station_page, seq, stations, append)
                 self.is_loading_more = False
             except Exception as e:
-                print(f"Error searching: {e}")
+                logger.error("Error searching: %s", e)
                 self.is_loading_more = False
 
-        threading.Thread(target=search, daemon=True).start()
+        self._submit_station_load(search, append)
 
     def _display_stations(self, stations, append=False):
         """Display stations in list"""
-        print(f"Displaying {len(stations)} stations (append={append})...")
+        logger.debug("Displaying %d stations (append=%s)", len(stations), append)
 
         if append:
             # Append to existing stations
-            if not hasattr(self, 'current_stations'):
-                self.current_stations = []
             self.current_stations.extend(stations)
         else:
             # Replace all stations
             self.current_stations = stations
 
-            # Clear existing rows
-            child = self.station_listbox.get_first_child()
-            while child:
-                next_child = child.get_next_sibling()
-                self.station_listbox.remove(child)
-                child = next_child
-
-        # Add new rows (either all or just the new ones for append)
-        for station in stations:
-            is_fav = self.favorites_manager.is_favorite(station.get('stationuuid', ''))
-            row = StationRow(station, is_fav)
-            self.station_listbox.append(row)
+        # Rows are created by the list view for the visible stations only
+        self.station_list.set_stations(stations, self.favorites_manager.get_favorite_uuids(), append)
 
-        print(f"Added {len(stations)} stations to UI (total: {len(self.current_stations)})")
+        logger.debug("Added %d stations to UI (total: %d)", len(stations), len(self.current_stations))
 
     def _load_favorites(self):
         """Load favorites"""
         favorites = self.favorites_manager.get_favorites()
-        print(f"Loading {len(favorites)} favorites")
+        logger.debug("Loading %d favorites", len(favorites))
 
         # Clear
-        child = self.favorites_listbox.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.favorites_listbox.remove(child)
-            child = next_child
+        clear_listbox(self.favorites_listbox)
 
         # Add with delete callback
         for station in favorites:
-            row = StationRow(station, True, on_delete_favorite=self._on_delete_favorite)
+            row = StationRow(station, True, on_delete_favorite=self._on_delete_favorite,
+                             load_logo=self._load_favicon)
             self.favorites_listbox.append(row)
 
         return False  # Don't repeat timeout
@@ -1514,45 +1535,86 @@ class WebRadioWindow(Adw.ApplicationWindow):
     def _on_station_activated(self, listbox, row):
         """Play selected station"""
         if isinstance(row, StationRow):
-            station = row.station
-            print(f"Playing: {station.get('name')}")
+            self._play_station(row.station)
 
-            url = station.get('url_resolved') or station.get('url')
-            if url:
-                self.player.play(url, station)
+    def _on_station_item_activated(self, list_view, position):
+        """Play the station activated in the discover list"""
+        station = list_view.get_station(position)
+        if station is not None:
+            self._play_station(station)
 
-                # Add to history
-                self.history_manager.add_entry(station)
-                self._load_history()  # Refresh history page
+    def _play_station(self, station):
+        """Play a station picked from a station list"""
+        name = station.get('name', 'Unknown')
+        uuid = station.get('stationuuid')
+        url = _station_url(station)
 
-                # Update station info
-                self.station_label.set_text(station.get('name', 'Unknown'))
+        # Re-activating the station that is already playing is a no-op
+        current = self.player.get_current_station()
+        if uuid and current and current.get('stationuuid') == uuid and self.player.is_playing():
+            return
 
-                # Update station details
-                # Details are shown in Now Playing page (removed from player bar for cleaner UI)
-                self.metadata_label.set_text('')  # Clear until we get metadata
+        logger.debug("Playing: %s", name)
 
-                # Update logo
-                self._update_playing_logo(station.get('favicon', ''))
+        if url:
+            self.player.play(url, station)
 
-                # Update Now Playing page
-                self._update_now_playing_page()
+            # Add to history
+            self.history_manager.add_entry(station)
 
-                # Enable buttons
-                self.play_button.set_sensitive(True)
-                self.stop_button.set_sensitive(True)
-                self.fav_button.set_sensitive(True)
-                self.record_button.set_sensitive(True)
-                self._update_fav_button()
+            # Update station info
+            self.station_label.set_text(name)
+
+            # Update station details
+            # Details are shown in Now Playing page (removed from player bar for cleaner UI)
+            self.metadata_label.set_text('')  # Clear until we get metadata
+
+            # Heavier refreshes run at idle priority so the stream starts buffering first
+            GLib.idle_add(self._refresh_for_new_station, station.get('favicon', ''),
+                          priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+            # Enable buttons
+            self._set_controls_sensitive(
+                (self.play_button, self.stop_button, self.fav_button, self.record_button), True
+            )
+            self._update_fav_button()
+
+            # Update MPRIS metadata
+            if self.mpris:
+                GLib.idle_add(self.mpris.update_metadata, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+            # Register click
+            if uuid:
+                self._register_click(uuid)
+
+    def _dispatch(self, func, *args):
+        """
+        Run func on the main thread.
+
+        Calls made on the main thread run right away instead of waiting one
+        main loop iteration. Calls from worker threads go through idle_add.
+        """
+        if GLib.MainContext.default().is_owner():
+            func(*args)
+        else:
+            GLib.idle_add(func, *args)
+
+    def _register_click(self, uuid):
+        """Report a station play to the Radio Browser API in the background"""
+        self._click_pool.submit(self._send_click, uuid)
 
-                # Update MPRIS metadata
-                if self.mpris:
-                    self.mpris.update_metadata()
+    def _send_click(self, uuid):
+        """Report a station play unless it was reported within CLICK_INTERVAL_SECONDS
 
-                # Register click
-                uuid = station.get('stationuuid')
-                if uuid:
-                    threading.Thread(target=lambda: self.api.register_click(uuid), daemon=True).start()
+        Runs on the single click worker, so reports for one station never
+        overlap. Only accepted reports are remembered, failed ones are sent
+        again on the next play.
+        """
+        last = self._click_times.get(uuid)
+        if last is not None and time.monotonic() - last < CLICK_INTERVAL_SECONDS:
+            return
+        if self.api.register_click(uuid):
+            self._click_times[uuid] = time.monotonic()
 
     def _register_keyboard_shortcuts(self):
         """Register all keyboard shortcut handlers"""
@@ -1598,34 +1660,30 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
     def _shortcut_mute(self):
         """Toggle mute"""
-        if not hasattr(self, '_muted'):
-            self._muted = False
-            self._volume_before_mute = 1.0
-
-        if self._muted:
+        if self._state.muted:
             # Unmute
-            self.player.set_volume(self._volume_before_mute)
-            self.volume_button.set_value(self._volume_before_mute)
-            self._muted = False
+            self.player.set_volume(self._state.volume_before_mute)
+            self.volume_button.set_value(self._state.volume_before_mute)
+            self._state.muted = False
             logger.debug("Unmuted")
         else:
             # Mute
-            self._volume_before_mute = self.player.get_volume()
+            self._state.volume_before_mute = self.player.get_volume()
             self.player.set_volume(0.0)
             self.volume_button.set_value(0.0)
-            self._muted = True
+            self._state.muted = True
             logger.debug("Muted")
 
     def _shortcut_focus_search(self):
         """Focus the search entry"""
-        if hasattr(self, 'search_entry') and self.search_entry:
+        if self.search_entry is not None:
             self.view_stack.set_visible_child_name('discover')
             self.search_entry.grab_focus()
             logger.debug("Focused search entry")
 
     def _shortcut_toggle_recording(self):
         """Toggle recording on/off"""
-        if hasattr(self, 'record_button') and self.record_button:
+        if self.record_button is not None:
             current_state = self.record_button.get_active()
             self.record_button.set_active(not current_state)
             logger.debug(f"Recording toggled: {not current_state}")
@@ -1637,7 +1695,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
             uuid = station.get('stationuuid')
             if uuid and not self.favorites_manager.is_favorite(uuid):
                 self.favorites_manager.add_favorite(station)
-                if hasattr(self, 'fav_button'):
+                if self.fav_button is not None:
                     self.fav_button.set_active(True)
                 toast = Adw.Toast.new(_("Added to favorites"))
                 toast.set_timeout(2)
@@ -1646,7 +1704,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
     def _show_shortcuts_dialog(self):
         """Show keyboard shortcuts help dialog"""
-        if hasattr(self, 'shortcuts_manager'):
+        if self.shortcuts_manager is not None:
             self.shortcuts_manager.show_shortcuts_dialog()
 
     def _on_play_pause(self, button):
@@ -1659,12 +1717,22 @@ class WebRadioWindow(Adw.ApplicationWindow):
     def _on_stop(self, button):
         """Stop playback"""
         self.player.stop()
+        self._cancel_pending_tags()
         self.station_label.set_text(_('no_station_playing'))
         self.metadata_label.set_text('')
-        self.playing_logo.set_from_icon_name('audio-x-generic')
-        self.play_button.set_sensitive(False)
-        self.stop_button.set_sensitive(False)
-        self.fav_button.set_sensitive(False)
+        self.playing_logo.set_from_paintable(self._get_icon_paintable('audio-x-generic', 48))
+        self._set_controls_sensitive((self.play_button, self.stop_button, self.fav_button), False)
+
+    def _set_controls_sensitive(self, buttons, sensitive: bool):
+        """Set the sensitivity of several player controls with their notifications frozen"""
+        for button in buttons:
+            button.freeze_notify()
+        try:
+            for button in buttons:
+                button.set_sensitive(sensitive)
+        finally:
+            for button in buttons:
+                button.thaw_notify()
 
     def _on_volume_changed(self, scale):
         """Change volume (legacy scale handler)"""
@@ -1708,7 +1776,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
             self.favorites_manager.remove_favorite(uuid)
             self._load_favorites()
             self._update_fav_button()
-            print(f"Deleted from favorites: {station.get('name')}")
+            logger.debug("Deleted from favorites: %s", station.get('name'))
 
     def _update_fav_button(self):
         """Update favorite button state"""
@@ -1716,17 +1784,46 @@ class WebRadioWindow(Adw.ApplicationWindow):
         if station:
             uuid = station.get('stationuuid', '')
             is_fav = self.favorites_manager.is_favorite(uuid)
-            # Block handler to prevent recursive calls
-            self.fav_button.handler_block_by_func(self._on_favorite_toggled)
-            self.fav_button.set_active(is_fav)
-            self.fav_button.handler_unblock_by_func(self._on_favorite_toggled)
-            # Update icon based on state
-            if is_fav:
-                self.fav_button.set_icon_name('starred')
-                self.fav_button.add_css_class('accent')
-            else:
-                self.fav_button.set_icon_name('starred-symbolic')
-                self.fav_button.remove_css_class('accent')
+            # Emit the button's property notifications once for all changes below
+            self.fav_button.freeze_notify()
+            try:
+                # Block handler to prevent recursive calls
+                self.fav_button.handler_block_by_func(self._on_favorite_toggled)
+                self.fav_button.set_active(is_fav)
+                self.fav_button.handler_unblock_by_func(self._on_favorite_toggled)
+                # Update icon based on state
+                if is_fav:
+                    self.fav_button.set_icon_name('starred')
+                    self.fav_button.add_css_class('accent')
+                else:
+                    self.fav_button.set_icon_name('starred-symbolic')
+                    self.fav_button.remove_css_class('accent')
+            finally:
+                self.fav_button.thaw_notify()
+
+    def _get_favorites_file_filters(self):
+        """Get the OPML/M3U file filters shared by the import and export dialogs"""
+        if self._favorites_file_filters is None:
+            filters = Gio.ListStore.new(Gtk.FileFilter)
+
+            opml_filter = Gtk.FileFilter()
+            opml_filter.set_name(_("OPML Files (*.opml)"))
+            opml_filter.add_pattern("*.opml")
+            filters.append(opml_filter)
+
+            m3u_filter = Gtk.FileFilter()
+            m3u_filter.set_name(_("M3U Playlists (*.m3u)"))
+            m3u_filter.add_pattern("*.m3u")
+            filters.append(m3u_filter)
+
+            all_filter = Gtk.FileFilter()
+            all_filter.set_name(_("All Files"))
+            all_filter.add_pattern("*")
+            filters.append(all_filter)
+
+            self._favorites_file_filters = (filters, opml_filter)
+
+        return self._favorites_file_filters
 
     def _on_export_favorites(self):
         """Handle export favorites button click"""
@@ -1736,23 +1833,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
         dialog.set_initial_name("webradio-favorites")
 
         # Set file filters for OPML and M3U
-        filters = Gio.ListStore.new(Gtk.FileFilter)
-
-        opml_filter = Gtk.FileFilter()
-        opml_filter.set_name(_("OPML Files (*.opml)"))
-        opml_filter.add_pattern("*.opml")
-        filters.append(opml_filter)
-
-        m3u_filter = Gtk.FileFilter()
-        m3u_filter.set_name(_("M3U Playlists (*.m3u)"))
-        m3u_filter.add_pattern("*.m3u")
-        filters.append(m3u_filter)
-
-        all_filter = Gtk.FileFilter()
-        all_filter.set_name(_("All Files"))
-        all_filter.add_pattern("*")
-        filters.append(all_filter)
-
+        filters, opml_filter = self._get_favorites_file_filters()
         dialog.set_filters(filters)
         dialog.set_default_filter(opml_filter)
 
@@ -1801,23 +1882,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
         dialog.set_title(_("Import Favorites"))
 
         # Set file filters for OPML and M3U
-        filters = Gio.ListStore.new(Gtk.FileFilter)
-
-        opml_filter = Gtk.FileFilter()
-        opml_filter.set_name(_("OPML Files (*.opml)"))
-        opml_filter.add_pattern("*.opml")
-        filters.append(opml_filter)
-
-        m3u_filter = Gtk.FileFilter()
-        m3u_filter.set_name(_("M3U Playlists (*.m3u)"))
-        m3u_filter.add_pattern("*.m3u")
-        filters.append(m3u_filter)
-
-        all_filter = Gtk.FileFilter()
-        all_filter.set_name(_("All Files"))
-        all_filter.add_pattern("*")
-        filters.append(all_filter)
-
+        filters, opml_filter = self._get_favorites_file_filters()
         dialog.set_filters(filters)
 
         # Show open dialog
@@ -1832,66 +1897,108 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
                 # Determine format from extension
                 if file_path.endswith('.m3u'):
-                    stations = self.export_import_manager.import_from_m3u(file_path)
+                    stations = self.export_import_manager.iter_m3u(file_path)
                     format_name = "M3U"
                 else:
-                    stations = self.export_import_manager.import_from_opml(file_path)
+                    stations = self.export_import_manager.iter_opml(file_path)
                     format_name = "OPML"
 
-                if stations:
-                    # Add imported stations to favorites
-                    added_count = 0
-                    for station in stations:
-                        # Generate a UUID if not present
-                        if 'stationuuid' not in station:
-                            import uuid
-                            station['stationuuid'] = str(uuid.uuid4())
-
-                        # Add to favorites (skip duplicates)
-                        if not self.favorites_manager.is_favorite(station['stationuuid']):
-                            self.favorites_manager.add_favorite(station)
-                            added_count += 1
-
-                    # Reload favorites list
-                    self._load_favorites()
-
-                    # Show toast notification
-                    toast = Adw.Toast.new(_("Imported {added} of {total} stations from {format}").format(
-                        added=added_count, total=len(stations), format=format_name))
-                    toast.set_timeout(3)
-                    self.toast_overlay.add_toast(toast)
-                else:
-                    toast = Adw.Toast.new(_("Failed to import favorites"))
-                    toast.set_timeout(3)
-                    self.toast_overlay.add_toast(toast)
+                self._import_favorites_in_batches(stations, format_name)
 
         except Exception as e:
             logger.error(f"Import favorites error: {e}")
 
+    def _import_favorites_in_batches(self, stations, format_name: str):
+        """
+        Add imported stations to favorites, IMPORT_BATCH_SIZE per main loop iteration.
+
+        Stations are read from the file as they are consumed, so large
+        playlists are never held in memory at once and the UI stays
+        responsive while importing.
+        """
+        counts = {'total': 0, 'added': 0}
+        # Stations are collected and saved in one go once the file is read
+        existing_uuids = set(self.favorites_manager.get_favorite_uuids())
+        new_stations = []
+
+        def show_toast(text):
+            toast = Adw.Toast.new(text)
+            toast.set_timeout(3)
+            if self.toast_overlay is not None:
+                self.toast_overlay.add_toast(toast)
+
+        def import_batch():
+            batch = 0
+            failed = False
+            try:
+                for station in itertools.islice(stations, IMPORT_BATCH_SIZE):
+                    batch += 1
+                    counts['total'] += 1
+
+                    # Generate a UUID if not present
+                    if 'stationuuid' not in station:
+                        station['stationuuid'] = str(uuid4())
+
+                    # Skip duplicates
+                    if station['stationuuid'] not in existing_uuids:
+                        existing_uuids.add(station['stationuuid'])
+                        new_stations.append(station)
+            except Exception as e:
+                logger.error(f"Import favorites error: {e}")
+                failed = True
+
+            if batch == IMPORT_BATCH_SIZE and not failed:
+                return GLib.SOURCE_CONTINUE
+
+            # All or nothing: a file that cannot be read to the end imports nothing
+            if not failed:
+                try:
+                    counts['added'] = self.favorites_manager.add_favorites(new_stations)
+                except Exception as e:
+                    logger.error(f"Import favorites error: {e}")
+                    failed = True
+
+            # Reload favorites list
+            if counts['added']:
+                self._load_favorites()
+
+            if counts['total'] and not failed:
+                show_toast(_("Imported {added} of {total} stations from {format}").format(
+                    added=counts['added'], total=counts['total'], format=format_name))
+            else:
+                show_toast(_("Failed to import favorites"))
+            return GLib.SOURCE_REMOVE
+
+        GLib.idle_add(import_batch)
+
     def _on_player_state_changed(self, player, state):
         """Handle player state change"""
         if state == PlayerState.PLAYING.value:
             self.play_button.set_icon_name('media-playback-pause-symbolic')
             # Activate spectrum visualizer
-            if hasattr(self, 'spectrum_visualizer'):
+            if self.spectrum_visualizer is not None:
                 self.spectrum_visualizer.set_active(True)
                 self._start_spectrum_animation()
             # Start position update timer
             self._start_position_updates()
             # Inhibit suspend while playing
-            if hasattr(self, 'session_inhibitor'):
+            if self.session_inhibitor is not None:
                 self.session_inhibitor.inhibit()
         else:
             self.play_button.set_icon_name('media-playback-start-symbolic')
             # Deactivate spectrum visualizer
-            if hasattr(self, 'spectrum_visualizer'):
+            if self.spectrum_visualizer is not None:
                 self.spectrum_visualizer.set_active(False)
                 self._stop_spectrum_animation()
             # Stop position update timer
             self._stop_position_updates()
             # Uninhibit suspend when not playing
-            if hasattr(self, 'session_inhibitor'):
+            if self.session_inhibitor is not None:
                 self.session_inhibitor.uninhibit()
+            # Stopped, also when play() switches station: tags still waiting
+            # for TAGS_FLUSH_MS belong to the previous stream
+            if state in (PlayerState.STOPPED.value, PlayerState.ERROR.value):
+                self._cancel_pending_tags()
 
         # Update MPRIS
         if self.mpris:
@@ -1899,14 +2006,40 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
     def _on_player_error(self, player, error_msg):
         """Handle player error"""
-        print(f"Player error: {error_msg}")
+        logger.warning("Player error: %s", error_msg)
 
     def _on_tags_updated(self, player, tags):
-        """Handle metadata tags"""
+        """Handle metadata tags, applying at most one update every TAGS_FLUSH_MS"""
+        self._pending_tags = tags
+        if self._tags_timeout_id is None:
+            self._tags_timeout_id = GLib.timeout_add(TAGS_FLUSH_MS, self._flush_tags)
+
+    def _cancel_pending_tags(self):
+        """Drop metadata tags that have not been shown yet"""
+        if self._tags_timeout_id:
+            GLib.source_remove(self._tags_timeout_id)
+            self._tags_timeout_id = None
+        self._pending_tags = None
+        self._shown_tags_key = None
+
+    def _flush_tags(self):
+        """Show the latest metadata tags unless they repeat the current track"""
+        self._tags_timeout_id = None
+        tags, self._pending_tags = self._pending_tags, None
+        if tags is None:
+            return False
+
         title = tags.get('title', '')
         artist = tags.get('artist', '')
         organization = tags.get('organization', '')
 
+        # Stations often resend the same tags, skip the notification and D-Bus updates then
+        station_uuid = self.player.current_station.get('stationuuid') if self.player.current_station else None
+        key = (station_uuid, title, artist, organization)
+        if key == self._shown_tags_key:
+            return False
+        self._shown_tags_key = key
+
         # Make sure station name is displayed in player bar
         if self.player.current_station:
             station_name = self.player.current_station.get('name', 'Unknown')
@@ -1926,98 +2059,75 @@ class WebRadioWindow(Adw.ApplicationWindow):
             self.notification_manager.notify_track_change(station_name, title, artist)
 
         # Update Now Playing page
-        self._update_now_playing_page()
+        self._update_now_playing_page_if_visible()
 
         # Update MPRIS metadata
         if self.mpris:
             self.mpris.update_metadata()
 
+        return False
+
+    def _refresh_for_new_station(self, favicon_url: str):
+        """Refresh the views showing the playing station, in one main loop dispatch"""
+        self._load_history()
+        self._update_playing_logo(favicon_url)
+        self._update_now_playing_page_if_visible()
+        return False
+
     def _update_playing_logo(self, favicon_url: str):
         """Update the now playing logo"""
-        if not favicon_url:
-            self.playing_logo.set_from_icon_name('audio-x-generic')
-            return
-
-        def load_logo():
-            try:
-                response = requests.get(favicon_url, timeout=5)
-                if response.status_code == 200:
-                    GLib.idle_add(self._set_playing_logo_from_data, response.content)
-            except:
-                pass
+        self._thumb_generation += 1
+        self.playing_logo.set_from_paintable(self._get_icon_paintable('audio-x-generic', 48))
+        if favicon_url:
+            self._load_favicon(favicon_url, 64, self.playing_logo.set_from_paintable)
 
-        threading.Thread(target=load_logo, daemon=True).start()
+    def _load_favicon(self, url: str, size: int, on_loaded, wanted=None):
+        """
+        Load a station favicon scaled to size x size.
 
-    def _set_playing_logo_from_data(self, image_data: bytes):
-        """Set the playing logo from image data"""
-        try:
-            loader = GdkPixbuf.PixbufLoader()
-            loader.write(image_data)
-            loader.close()
-
-            pixbuf = loader.get_pixbuf()
-            if pixbuf:
-                # Scale to 64x64 for the player bar
-                scaled = pixbuf.scale_simple(64, 64, GdkPixbuf.InterpType.BILINEAR)
-                texture = Gdk.Texture.new_for_pixbuf(scaled)
-                self.playing_logo.set_from_paintable(texture)
-        except Exception as e:
-            print(f"Failed to load playing logo: {e}")
+        The texture is passed to on_loaded on the main thread, right away if
+        it is cached. wanted, if given, is called (also from the image pool,
+        so it must not touch widgets) to check whether the logo is still
+        needed; loads nobody wants anymore are skipped.
+        """
+        self.favicon_pool.request(url, (size,), lambda textures: on_loaded(textures[size]), wanted)
 
     def _on_search_changed(self, entry):
         """Handle search text changed - real-time search with debounce"""
-        # Cancel previous timeout
-        if self.search_timeout_id:
-            GLib.source_remove(self.search_timeout_id)
-            self.search_timeout_id = None
-
-        query = entry.get_text().strip()
+        # Search (or load top stations when empty) once typing pauses
+        self._search_debounce.trigger(entry.get_text().strip())
 
-        # If empty, load top stations after a delay
+    def _delayed_search(self, query):
+        """Execute delayed search"""
         if not query:
-            self.search_timeout_id = GLib.timeout_add(500, self._delayed_load_top_stations)
+            self._load_top_stations()
             return
 
-        # Start search after 500ms of no typing
-        self.search_timeout_id = GLib.timeout_add(500, self._delayed_search, query)
+        logger.debug("Real-time search for: %s", query)
 
-    def _delayed_search(self, query):
-        """Execute delayed search"""
-        self.search_timeout_id = None
-        if query:
-            print(f"Real-time search for: {query}")
-
-            def search():
-                try:
-                    stations = self.api.search_stations(query, 50)
-                    print(f"Found {len(stations)} stations")
-                    GLib.idle_add(self._display_stations, stations)
-                except Exception as e:
-                    print(f"Error searching: {e}")
+        def search(seq):
+            try:
+                stations = self.api.search_stations(query, 50)
+                logger.debug("Found %d stations", len(stations))
+                self._dispatch(self._show_station_page, seq, stations)
+            except Exception as e:
+                logger.error("Error searching: %s", e)
 
-            threading.Thread(target=search, daemon=True).start()
-        return False
-
-    def _delayed_load_top_stations(self):
-        """Load top stations after delay"""
-        self.search_timeout_id = None
-        self._load_top_stations()
-        return False
+        self._submit_station_load(search)
 
     def _on_global_search(self, widget):
         """Handle global search"""
+        # Drop a pending debounced search, this one supersedes it
+        self._global_search_debounce.cancel()
+
         query = self.global_search_entry.get_text().strip()
         if not query:
             return
 
-        print(f"Global search for: {query}")
+        logger.debug("Global search for: %s", query)
 
         # Clear previous results
-        child = self.global_search_listbox.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.global_search_listbox.remove(child)
-            child = next_child
+        self._clear_global_search_results()
 
         # Show loading status
         loading_status = Adw.StatusPage()
@@ -2025,54 +2135,47 @@ class WebRadioWindow(Adw.ApplicationWindow):
         loading_status.set_title(_("placeholder_loading"))
         self.global_search_listbox.append(loading_status)
 
-        def search():
+        def search(seq):
             try:
                 stations = self.api.search_stations(query, 100)
-                print(f"Global search found {len(stations)} stations")
-                GLib.idle_add(self._display_global_search_results, stations)
+                logger.debug("Global search found %d stations", len(stations))
+                self._dispatch(self._finish_global_search, seq, self._display_global_search_results, stations)
             except Exception as e:
-                print(f"Error in global search: {e}")
-                GLib.idle_add(self._show_global_search_error, str(e))
+                logger.warning("Error in global search: %s", e)
+                self._dispatch(self._finish_global_search, seq, self._show_global_search_error, str(e))
+
+        self._global_search_seq += 1
+        self._io_pool.submit(search, self._global_search_seq)
 
-        threading.Thread(target=search, daemon=True).start()
+    def _finish_global_search(self, seq, func, *args):
+        """Pass on global search results or errors unless a newer search has replaced them"""
+        if seq != self._global_search_seq:
+            logger.debug("Dropping results of a superseded global search")
+            return
+        func(*args)
 
     def _on_global_search_changed(self, entry):
         """Handle global search text changed - real-time search with debounce"""
-        # Cancel previous timeout
-        if hasattr(self, 'global_search_timeout_id') and self.global_search_timeout_id:
-            GLib.source_remove(self.global_search_timeout_id)
-            self.global_search_timeout_id = None
-
         query = entry.get_text().strip()
 
         # If empty, show initial status
         if not query:
-            child = self.global_search_listbox.get_first_child()
-            while child:
-                next_child = child.get_next_sibling()
-                self.global_search_listbox.remove(child)
-                child = next_child
+            self._global_search_debounce.cancel()
+            self._clear_global_search_results()
             self.global_search_listbox.append(self.global_search_status)
             return
 
-        # Start search after 500ms of no typing
-        self.global_search_timeout_id = GLib.timeout_add(500, self._delayed_global_search, query)
+        # Start search once typing pauses
+        self._global_search_debounce.trigger()
 
-    def _delayed_global_search(self, query):
+    def _delayed_global_search(self):
         """Execute delayed global search"""
-        self.global_search_timeout_id = None
-        if query:
-            self._on_global_search(None)
-        return False
+        self._on_global_search(None)
 
     def _display_global_search_results(self, stations):
         """Display global search results"""
         # Clear previous results
-        child = self.global_search_listbox.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.global_search_listbox.remove(child)
-            child = next_child
+        self._clear_global_search_results()
 
         if not stations:
             # No results
@@ -2084,19 +2187,64 @@ class WebRadioWindow(Adw.ApplicationWindow):
             return
 
         # Add station rows
-        for station in stations:
-            is_fav = self.favorites_manager.is_favorite(station.get('stationuuid', ''))
-            row = StationRow(station, is_fav)
-            self.global_search_listbox.append(row)
+        fav_uuids = self.favorites_manager.get_favorite_uuids()
+        self._append_rows_in_batches(
+            self.global_search_listbox, stations,
+            lambda station: StationRow(station, station.get('stationuuid', '') in fav_uuids,
+                                       load_logo=self._load_favicon)
+        )
+
+    def _clear_global_search_results(self):
+        """Remove all rows from the global search list, stopping a running fill"""
+        self._cancel_row_batches(self.global_search_listbox)
+        clear_listbox(self.global_search_listbox)
+
+    def _append_rows_in_batches(self, listbox, items, create_row, replace=True):
+        """
+        Append a row per item to a ListBox, ROW_BATCH_SIZE rows at a time.
+
+        The first batch is added right away, the rest from an idle handler so
+        GTK can draw between batches. A new fill of the same list replaces
+        one that is still running, unless replace is False; its rows are then
+        appended after the pending ones.
+        """
+        rows = ((create_row, item) for item in items)
+        if replace:
+            self._cancel_row_batches(listbox)
+        else:
+            pending = self._row_batches.get(listbox)
+            if pending is not None:
+                pending[1] = itertools.chain(pending[1], rows)
+                return
+
+        pending = [None, rows]  # [idle source id, (create_row, item) pairs left]
+
+        def append_batch():
+            count = 0
+            for create, item in itertools.islice(pending[1], ROW_BATCH_SIZE):
+                listbox.append(create(item))
+                count += 1
+
+            if count < ROW_BATCH_SIZE:
+                if self._row_batches.get(listbox) is pending:
+                    del self._row_batches[listbox]
+                return GLib.SOURCE_REMOVE
+            return GLib.SOURCE_CONTINUE
+
+        if append_batch():
+            pending[0] = GLib.idle_add(append_batch)
+            self._row_batches[listbox] = pending
+
+    def _cancel_row_batches(self, listbox):
+        """Stop a batched fill of a ListBox that is still running"""
+        pending = self._row_batches.pop(listbox, None)
+        if pending:
+            GLib.source_remove(pending[0])
 
     def _show_global_search_error(self, error_msg):
         """Show global search error"""
         # Clear previous results
-        child = self.global_search_listbox.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.global_search_listbox.remove(child)
-            child = next_child
+        self._clear_global_search_results()
 
         error_status = Adw.StatusPage()
         error_status.set_icon_name('dialog-error-symbolic')
@@ -2110,10 +2258,10 @@ class WebRadioWindow(Adw.ApplicationWindow):
             return
 
         station = row.station
-        url = station.get('url_resolved') or station.get('url')
+        url = _station_url(station)
         if url:
             self.player.play(url, station)
-            self._update_now_playing_page()
+            self._update_now_playing_page_if_visible()
 
     def _on_info_clicked(self, button):
         """Show Now Playing information dialog"""
@@ -2160,11 +2308,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
         # Load station logo
         favicon_url = station.get('favicon')
         if favicon_url:
-            threading.Thread(
-                target=self._load_info_dialog_logo,
-                args=(favicon_url, station_logo),
-                daemon=True
-            ).start()
+            self._load_info_dialog_logo(favicon_url, station_logo)
 
         logo_box.append(station_logo)
         content_box.append(logo_box)
@@ -2177,190 +2321,123 @@ class WebRadioWindow(Adw.ApplicationWindow):
         station_name.set_margin_bottom(12)
         content_box.append(station_name)
 
-        # Now Playing Section
-        if tags.get('title') or tags.get('artist'):
-            now_playing_group = Adw.PreferencesGroup()
-            now_playing_group.set_title('🎵 Currently Playing')
-            now_playing_group.set_margin_bottom(12)
+        # Information groups, skipping empty fields and groups
+        sources = {'tags': tags, 'station': dict(station, stream_url=_station_url(station))}
+        for group_title, source, fields in _INFO_SCHEMA:
+            values = sources[source]
+            group = None
+            for key, title, formatter, copyable in fields:
+                value = values.get(key)
+                subtitle = formatter(value) if value else None
+                if not subtitle:
+                    continue
+                if group is None:
+                    group = Adw.PreferencesGroup()
+                    group.set_title(group_title)
+                    group.set_margin_bottom(12)
+                group.add(self._make_info_row(title, subtitle, value if copyable else None))
+            if group is not None:
+                content_box.append(group)
 
-            if tags.get('title'):
-                title_row = Adw.ActionRow()
-                title_row.set_title('Title')
-                title_row.set_subtitle(tags['title'])
-                now_playing_group.add(title_row)
-
-            if tags.get('artist'):
-                artist_row = Adw.ActionRow()
-                artist_row.set_title('Artist')
-                artist_row.set_subtitle(tags['artist'])
-                now_playing_group.add(artist_row)
-
-            if tags.get('album'):
-                album_row = Adw.ActionRow()
-                album_row.set_title('Album')
-                album_row.set_subtitle(tags['album'])
-                now_playing_group.add(album_row)
-
-            content_box.append(now_playing_group)
-
-        # Station Information
-        station_group = Adw.PreferencesGroup()
-        station_group.set_title('📻 Station Information')
-        station_group.set_margin_bottom(12)
-
-        if station.get('country'):
-            country_row = Adw.ActionRow()
-            country_row.set_title('Country')
-            country_row.set_subtitle(station['country'])
-            station_group.add(country_row)
-
-        if station.get('state'):
-            state_row = Adw.ActionRow()
-            state_row.set_title('State/Region')
-            state_row.set_subtitle(station['state'])
-            station_group.add(state_row)
-
-        if station.get('language'):
-            lang_row = Adw.ActionRow()
-            lang_row.set_title('Language')
-            lang_row.set_subtitle(', '.join(station['language']) if isinstance(station['language'], list) else station['language'])
-            station_group.add(lang_row)
-
-        if station.get('tags'):
-            tags_text = ', '.join(station['tags']) if isinstance(station['tags'], list) else station['tags']
-            if tags_text:
-                tags_row = Adw.ActionRow()
-                tags_row.set_title('Tags')
-                tags_row.set_subtitle(tags_text)
-                station_group.add(tags_row)
-
-        content_box.append(station_group)
-
-        # Technical Information
-        tech_group = Adw.PreferencesGroup()
-        tech_group.set_title('🔧 Technical Details')
-        tech_group.set_margin_bottom(12)
-
-        if station.get('codec'):
-            codec_row = Adw.ActionRow()
-            codec_row.set_title('Codec')
-            codec_row.set_subtitle(station['codec'].upper())
-            tech_group.add(codec_row)
-
-        if station.get('bitrate'):
-            bitrate_row = Adw.ActionRow()
-            bitrate_row.set_title('Bitrate')
-            bitrate_row.set_subtitle(f"{station['bitrate']} kbps")
-            tech_group.add(bitrate_row)
-
-        if station.get('homepage'):
-            homepage_row = Adw.ActionRow()
-            homepage_row.set_title('Homepage')
-            homepage_row.set_subtitle(station['homepage'])
-
-            # Copy button
-            copy_btn = Gtk.Button()
-            copy_btn.set_icon_name('edit-copy-symbolic')
-            copy_btn.set_valign(Gtk.Align.CENTER)
-            copy_btn.set_tooltip_text('Copy URL')
-            copy_btn.connect('clicked', lambda b: self._copy_to_clipboard(station['homepage']))
-            homepage_row.add_suffix(copy_btn)
+        scrolled.set_child(content_box)
+        main_box.append(scrolled)
 
-            tech_group.add(homepage_row)
+        dialog.set_content(main_box)
+        dialog.present()
 
-        if station.get('url_resolved') or station.get('url'):
-            stream_url = station.get('url_resolved') or station.get('url')
-            stream_row = Adw.ActionRow()
-            stream_row.set_title('Stream URL')
-            stream_row.set_subtitle(stream_url[:60] + '...' if len(stream_url) > 60 else stream_url)
+    def _make_info_row(self, title: str, subtitle: str, copy_text: Optional[str] = None):
+        """Create an information dialog row, with a copy button if copy_text is given"""
+        row = Adw.ActionRow()
+        row.set_title(title)
+        row.set_subtitle(subtitle)
 
-            # Copy button
+        if copy_text:
             copy_btn = Gtk.Button()
             copy_btn.set_icon_name('edit-copy-symbolic')
             copy_btn.set_valign(Gtk.Align.CENTER)
             copy_btn.set_tooltip_text('Copy URL')
-            copy_btn.connect('clicked', lambda b: self._copy_to_clipboard(stream_url))
-            stream_row.add_suffix(copy_btn)
-
-            tech_group.add(stream_row)
-
-        content_box.append(tech_group)
-
-        # Statistics
-        if station.get('votes') or station.get('clickcount'):
-            stats_group = Adw.PreferencesGroup()
-            stats_group.set_title('📊 Statistics')
-
-            if station.get('votes'):
-                votes_row = Adw.ActionRow()
-                votes_row.set_title('Votes')
-                votes_row.set_subtitle(str(station['votes']))
-                stats_group.add(votes_row)
-
-            if station.get('clickcount'):
-                clicks_row = Adw.ActionRow()
-                clicks_row.set_title('Total Clicks')
-                clicks_row.set_subtitle(str(station['clickcount']))
-                stats_group.add(clicks_row)
+            copy_btn.connect('clicked', lambda b: self._copy_to_clipboard(copy_text))
+            row.add_suffix(copy_btn)
 
-            content_box.append(stats_group)
-
-        scrolled.set_child(content_box)
-        main_box.append(scrolled)
-
-        dialog.set_content(main_box)
-        dialog.present()
+        return row
 
     def _load_info_dialog_logo(self, url: str, image_widget: Gtk.Image):
         """Load logo for info dialog"""
-        try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                GLib.idle_add(self._set_info_dialog_logo, image_widget, response.content)
-        except:
-            pass
-
-    def _set_info_dialog_logo(self, image_widget: Gtk.Image, image_data: bytes):
-        """Set logo in info dialog"""
-        try:
-            loader = GdkPixbuf.PixbufLoader()
-            loader.write(image_data)
-            loader.close()
-            pixbuf = loader.get_pixbuf()
-            if pixbuf:
-                scaled = pixbuf.scale_simple(128, 128, GdkPixbuf.InterpType.BILINEAR)
-                texture = Gdk.Texture.new_for_pixbuf(scaled)
-                image_widget.set_from_paintable(texture)
-        except:
-            pass
+        self._load_favicon(url, 128, image_widget.set_from_paintable)
 
     def _copy_to_clipboard(self, text: str):
         """Copy text to clipboard"""
         clipboard = Gdk.Display.get_default().get_clipboard()
         clipboard.set(text)
 
+    @staticmethod
+    def _history_key(entry: dict):
+        """Identify a history entry together with the data its row shows"""
+        return (entry.get('stationuuid', ''), entry.get('timestamp'), entry.get('play_count', 1))
+
     def _load_history(self):
-        """Load and display history"""
-        # Clear existing items
-        while True:
-            row = self.history_listbox.get_row_at_index(0)
-            if row is None:
-                break
-            self.history_listbox.remove(row)
+        """
+        Load and display history
+
+        Rows are kept across reloads and only rows for new or changed entries
+        are built, so a new play adds one row instead of rebuilding the list.
+        """
+        self._cancel_row_batches(self.history_listbox)
 
         # Get recent history
         recent = self.history_manager.get_recent(limit=50)
+        # One reference time for all 'time ago' labels
+        now = datetime.now()
 
-        for entry in recent:
+        def create_row(entry):
             # Entry contains all station data directly
-            row = self._create_history_row(entry, entry)
-            self.history_listbox.append(row)
+            row = self._create_history_row(entry, entry, now)
+            self._history_rows[self._history_key(entry)] = row
+            return row
+
+        if not self._history_rows:
+            self._append_rows_in_batches(self.history_listbox, recent, create_row)
+            return False  # Don't repeat timeout
+
+        old_rows = self._history_rows
+        self._history_rows = {}
+        rows = []
+        for entry in recent:
+            key = self._history_key(entry)
+            if key in self._history_rows:
+                continue
+            row = old_rows.pop(key, None)
+            if row is None:
+                row = create_row(entry)
+            else:
+                self._history_rows[key] = row
+                self._refresh_history_row_time(row, now)
+            rows.append(row)
+
+        # Drop rows for entries that are gone or have changed
+        for row in old_rows.values():
+            row.dropped = True
+            self.history_listbox.remove(row)
+
+        # Move rows into the new order, leaving rows already in place alone
+        for index, row in enumerate(rows):
+            if self.history_listbox.get_row_at_index(index) is row:
+                continue
+            if row.get_parent() is not None:
+                self.history_listbox.remove(row)
+            self.history_listbox.insert(row, index)
 
         return False  # Don't repeat timeout
 
-    def _create_history_row(self, station: dict, entry: dict):
+    def _refresh_history_row_time(self, row, now: datetime):
+        """Update the 'time ago' label of a kept history row"""
+        if row.time_label is not None:
+            row.time_label.set_text(self._format_time_ago(row.played_at, now))
+
+    def _create_history_row(self, station: dict, entry: dict, now: Optional[datetime] = None):
         """Create a history list row"""
         row = Gtk.ListBoxRow()
+        row.dropped = False  # Set once the row is removed from the history list
 
         box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         box.set_margin_start(12)
@@ -2371,12 +2448,12 @@ class WebRadioWindow(Adw.ApplicationWindow):
         # Station logo
         logo = Gtk.Image()
         logo.set_pixel_size(48)
-        logo.set_from_icon_name('audio-x-generic-symbolic')
+        logo.set_from_paintable(self._get_icon_paintable('audio-x-generic-symbolic', 48))
 
         # Load favicon if available
         favicon_url = station.get('favicon')
         if favicon_url:
-            self._load_history_logo(favicon_url, logo)
+            self._load_history_logo(favicon_url, logo, row)
 
         box.append(logo)
 
@@ -2390,16 +2467,19 @@ class WebRadioWindow(Adw.ApplicationWindow):
         info_box.append(name_label)
 
         # Last played time
-        import datetime
+        row.time_label = None
+        row.played_at = None
         timestamp = entry.get('timestamp')
         if timestamp:
             try:
-                dt = datetime.datetime.fromisoformat(timestamp)
-                time_ago = self._format_time_ago(dt)
+                dt = datetime.fromisoformat(timestamp)
+                time_ago = self._format_time_ago(dt, now)
                 time_label = Gtk.Label(label=time_ago)
                 time_label.set_xalign(0)
                 time_label.set_opacity(0.7)
                 info_box.append(time_label)
+                row.time_label = time_label
+                row.played_at = dt
             except:
                 pass
 
@@ -2417,53 +2497,23 @@ class WebRadioWindow(Adw.ApplicationWindow):
         row.station_data = station
         return row
 
-    def _load_history_logo(self, url: str, image_widget: Gtk.Image):
-        """Load logo for history list"""
-        def load_in_thread():
-            try:
-                response = requests.get(url, timeout=5)
-                if response.status_code == 200:
-                    GLib.idle_add(self._set_history_logo, image_widget, response.content)
-            except:
-                pass
-
-        import threading
-        thread = threading.Thread(target=load_in_thread, daemon=True)
-        thread.start()
+    def _load_history_logo(self, url: str, image_widget: Gtk.Image, row: Gtk.ListBoxRow):
+        """Load logo for history list, unless its row is dropped first"""
+        self._load_favicon(url, 48, image_widget.set_from_paintable, lambda: not row.dropped)
 
-    def _set_history_logo(self, image_widget: Gtk.Image, image_data: bytes):
-        """Set logo in history row"""
-        try:
-            loader = GdkPixbuf.PixbufLoader()
-            loader.write(image_data)
-            loader.close()
-            pixbuf = loader.get_pixbuf()
-            if pixbuf:
-                scaled = pixbuf.scale_simple(48, 48, GdkPixbuf.InterpType.BILINEAR)
-                texture = Gdk.Texture.new_for_pixbuf(scaled)
-                image_widget.set_from_paintable(texture)
-        except:
-            pass
-
-    def _format_time_ago(self, dt):
-        """Format datetime as 'time ago' string"""
-        import datetime
-        now = datetime.datetime.now()
-        diff = now - dt
+    def _format_time_ago(self, dt: datetime, now: Optional[datetime] = None):
+        """Format datetime as 'time ago' string, relative to now (default: current time)"""
+        diff = (now or datetime.now()) - dt
 
+        # The text only depends on the bucket, so it is built once per bucket and language
         if diff.days > 0:
-            unit = _('time_day') if diff.days == 1 else _('time_days')
-            return f"{_('time_ago')} {diff.days} {unit}"
+            return _time_ago_text(get_language(), diff.days, 'day')
         elif diff.seconds >= 3600:
-            hours = diff.seconds // 3600
-            unit = _('time_hour') if hours == 1 else _('time_hours')
-            return f"{_('time_ago')} {hours} {unit}"
+            return _time_ago_text(get_language(), diff.seconds // 3600, 'hour')
         elif diff.seconds >= 60:
-            minutes = diff.seconds // 60
-            unit = _('time_minute') if minutes == 1 else _('time_minutes')
-            return f"{_('time_ago')} {minutes} {unit}"
+            return _time_ago_text(get_language(), diff.seconds // 60, 'minute')
         else:
-            return _('time_just_now')
+            return _time_ago_text(get_language(), 0, None)
 
     def _on_clear_history(self, button):
         """Clear all history"""
@@ -2486,40 +2536,49 @@ class WebRadioWindow(Adw.ApplicationWindow):
         """Handle history station activation"""
         if hasattr(row, 'station_data'):
             station = row.station_data
-            print(f"Playing from history: {station.get('name')}")
+            logger.debug("Playing from history: %s", station.get('name'))
 
-            url = station.get('url_resolved') or station.get('url')
+            url = _station_url(station)
             if url:
                 self.player.play(url, station)
 
                 # Add to history
                 self.history_manager.add_entry(station)
-                self._load_history()  # Refresh history page
 
                 # Update station info
                 self.station_label.set_text(station.get('name', 'Unknown'))
 
                 # Details are shown in Now Playing page (removed from player bar for cleaner UI)
 
-                # Update now playing page
-                self._update_now_playing_page()
+                # Refresh history, logo and now playing page once playback has started
+                GLib.idle_add(self._refresh_for_new_station, station.get('favicon', ''),
+                              priority=GLib.PRIORITY_DEFAULT_IDLE)
 
                 # Register click with API
                 if station.get('stationuuid'):
-                    import threading
-                    threading.Thread(
-                        target=self.api.register_click,
-                        args=(station['stationuuid'],),
-                        daemon=True
-                    ).start()
+                    self._register_click(station['stationuuid'])
+
+    def _update_now_playing_page_if_visible(self):
+        """Update the Now Playing page now if it is shown, else once it is shown"""
+        if self.view_stack.get_visible_child_name() == 'now_playing':
+            self._update_now_playing_page()
+        else:
+            self._np_dirty = True
+        return False
+
+    def _on_visible_page_changed(self, stack, param):
+        """Catch up on Now Playing updates that were postponed while it was hidden"""
+        if self._np_dirty and stack.get_visible_child_name() == 'now_playing':
+            self._update_now_playing_page()
 
     def _update_now_playing_page(self):
         """Update now playing page with current station info"""
+        self._np_dirty = False
         if self.player.is_playing() and self.player.current_station:
             station = self.player.current_station
 
             # Update station name
-            self.np_station_label.set_label(station.get('name', 'Unknown Station'))
+            _set_label_text(self.np_station_label, station.get('name', 'Unknown Station'))
 
             # Update metadata
             tags = self.player.get_current_tags()
@@ -2527,9 +2586,9 @@ class WebRadioWindow(Adw.ApplicationWindow):
                 track_text = tags.get('title', '')
                 if tags.get('artist'):
                     track_text = f"{tags.get('artist')} - {track_text}"
-                self.np_track_label.set_label(track_text)
+                _set_label_text(self.np_track_label, track_text)
             else:
-                self.np_track_label.set_label('')
+                _set_label_text(self.np_track_label, '')
 
             # Update details
             details = []
@@ -2540,98 +2599,123 @@ class WebRadioWindow(Adw.ApplicationWindow):
             if station.get('codec'):
                 details.append(station['codec'].upper())
 
-            self.np_details_label.set_label(' • '.join(details))
+            _set_label_text(self.np_details_label, ' • '.join(details))
 
             # Update logo
             if station.get('favicon'):
                 self._load_np_logo(station['favicon'])
         else:
-            self.np_station_label.set_label(_("No Station Playing"))
-            self.np_track_label.set_label('')
-            self.np_details_label.set_label('')
-            self.np_logo.set_from_icon_name('audio-x-generic')
+            self._np_logo_url = None
+            self._np_logo_shown = None
+            _set_label_text(self.np_station_label, _("No Station Playing"))
+            _set_label_text(self.np_track_label, '')
+            _set_label_text(self.np_details_label, '')
+            placeholder = self._get_icon_paintable('audio-x-generic', 256)
+            if self.np_logo.get_paintable() is not placeholder:
+                self.np_logo.set_from_paintable(placeholder)
 
     def _load_np_logo(self, url: str):
-        """Load logo for now playing page"""
-        def load_in_thread():
-            try:
-                response = requests.get(url, timeout=5)
-                if response.status_code == 200:
-                    GLib.idle_add(self._set_np_logo, response.content)
-            except:
-                pass
+        """Load logo for now playing page, unless another station is shown first"""
+        self._np_logo_url = url
 
-        import threading
-        thread = threading.Thread(target=load_in_thread, daemon=True)
-        thread.start()
+        # Metadata updates refresh the page often; keep the logo that is up.
+        # The texture is held here too, so row logos filling the favicon
+        # cache cannot evict it while the station plays.
+        if self._np_logo_shown is not None and self._np_logo_shown[0] == url:
+            return
 
-    def _set_np_logo(self, image_data: bytes):
-        """Set logo on now playing page"""
-        try:
-            loader = GdkPixbuf.PixbufLoader()
-            loader.write(image_data)
-            loader.close()
-            pixbuf = loader.get_pixbuf()
-            if pixbuf:
-                scaled = pixbuf.scale_simple(256, 256, GdkPixbuf.InterpType.BILINEAR)
-                texture = Gdk.Texture.new_for_pixbuf(scaled)
+        def wanted():
+            return self._np_logo_url == url
+
+        def on_loaded(texture):
+            if wanted():
+                self._np_logo_shown = (url, texture)
                 self.np_logo.set_from_paintable(texture)
-        except:
-            pass
+
+        self._load_favicon(url, 256, on_loaded, wanted)
+
+    def _on_spectrum_mapped(self, visualizer):
+        """Resume the spectrum animation when the visualizer is shown"""
+        if visualizer.is_active:
+            self._start_spectrum_animation()
+
+    def _on_spectrum_unmapped(self, visualizer):
+        """Pause the spectrum animation while the visualizer is hidden"""
+        self._stop_spectrum_animation()
 
     def _start_spectrum_animation(self):
-        """Start spectrum animation with simulated data"""
-        import random
-        import math
+        """
+        Start spectrum animation with simulated data
+
+        Does nothing if the animation is already running or the visualizer
+        is not on screen; it is then started once the visualizer is mapped.
+        """
+        if self.spectrum_tick_id or not self.spectrum_visualizer.get_mapped():
+            return
 
         # Store previous values for smoother animation
         self.spectrum_phase = 0
 
-        def update_spectrum():
-            if not hasattr(self, 'spectrum_visualizer') or not self.spectrum_visualizer.is_active:
-                return False
+        # Per-band terms, computed once instead of every frame.
+        # Base level decreases with frequency: low frequencies (bass) are typically louder
+        bases = [-60 - (i / SPECTRUM_BANDS) * 25 for i in range(SPECTRUM_BANDS)]
+        # Wave patterns for visual interest. sin(phase + x) = sin(phase)cos(x) + cos(phase)sin(x),
+        # so with the per-band sines and cosines stored a frame needs six trig calls in total
+        waves = [
+            (12 * math.cos(i * 0.15), 12 * math.sin(i * 0.15),
+             8 * math.cos(i * 0.08), 8 * math.sin(i * 0.08),
+             6 * math.cos(i * 0.2), 6 * math.sin(i * 0.2))
+            for i in range(SPECTRUM_BANDS)
+        ]
+        uniform = random.uniform
+        rand = random.random
+
+        last_frame_time = None
+
+        def update_spectrum(widget, frame_clock):
+            nonlocal last_frame_time
+            if not widget.is_active:
+                self.spectrum_tick_id = None
+                return GLib.SOURCE_REMOVE
+
+            # Advance the waves by elapsed time, so their speed does not depend on the refresh rate
+            frame_time = frame_clock.get_frame_time()
+            elapsed = frame_time - last_frame_time if last_frame_time is not None else SPECTRUM_FRAME_US
+            last_frame_time = frame_time
 
             # Generate more dynamic spectrum data with wave patterns
             magnitudes = []
-            self.spectrum_phase += 0.15
-
-            for i in range(80):  # Match num_bands
-                # Create more realistic spectrum with bass emphasis
-                # Low frequencies (bass) are typically louder
-                freq_position = i / 80.0
-
-                # Base level decreases with frequency
-                base = -60 - (freq_position * 25)
-
-                # Add wave patterns for visual interest
-                wave1 = math.sin(self.spectrum_phase + i * 0.15) * 12
-                wave2 = math.sin(self.spectrum_phase * 0.7 + i * 0.08) * 8
-                wave3 = math.cos(self.spectrum_phase * 1.3 + i * 0.2) * 6
-
-                # Random variation for natural feel
-                variation = random.uniform(-8, 3)
-
-                # Combine all components
-                magnitude = base + wave1 + wave2 + wave3 + variation
+            self.spectrum_phase += 0.15 * elapsed / SPECTRUM_FRAME_US
+            phase = self.spectrum_phase
+            sin1, cos1 = math.sin(phase), math.cos(phase)
+            sin2, cos2 = math.sin(phase * 0.7), math.cos(phase * 0.7)
+            sin3, cos3 = math.sin(phase * 1.3), math.cos(phase * 1.3)
+
+            for base, (cos_a, sin_a, cos_b, sin_b, cos_c, sin_c) in zip(bases, waves):
+                # Combine base level, the three waves and random variation for natural feel
+                magnitude = (base
+                             + sin1 * cos_a + cos1 * sin_a
+                             + sin2 * cos_b + cos2 * sin_b
+                             + cos3 * cos_c - sin3 * sin_c
+                             + uniform(-8, 3))
 
                 # Occasional peaks for dynamics
-                if random.random() > 0.95:
-                    magnitude += random.uniform(10, 20)
+                if rand() > 0.95:
+                    magnitude += uniform(10, 20)
 
-                magnitude = min(0, max(-80, magnitude))
-                magnitudes.append(magnitude)
+                magnitudes.append(min(0, max(-80, magnitude)))
 
-            self.spectrum_visualizer.set_spectrum_data(magnitudes)
-            return True  # Continue animation
+            widget.set_spectrum_data(magnitudes)
+            return GLib.SOURCE_CONTINUE  # Continue animation
 
-        # Update spectrum at ~30 FPS
-        self.spectrum_timeout_id = GLib.timeout_add(33, update_spectrum)
+        # Update spectrum once per frame drawn by the visualizer
+        self.spectrum_tick_id = self.spectrum_visualizer.add_tick_callback(update_spectrum)
 
     def _stop_spectrum_animation(self):
         """Stop spectrum animation"""
-        if hasattr(self, 'spectrum_timeout_id') and self.spectrum_timeout_id:
-            GLib.source_remove(self.spectrum_timeout_id)
-            self.spectrum_timeout_id = None
+        if self.spectrum_tick_id:
+            self.spectrum_visualizer.remove_tick_callback(self.spectrum_tick_id)
+            self.spectrum_tick_id = None
 
     def _on_close_request(self, window):
         """Handle window close request"""
@@ -2641,7 +2725,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
         # Check if player is playing
         if self.player.is_playing() and self.minimize_to_tray:
             # Hide window instead of closing - let app run in background
-            print("Minimizing to background (player is running)")
+            logger.debug("Minimizing to background (player is running)")
             self.hide()
 
             # Update tray icon tooltip if available
@@ -2654,7 +2738,11 @@ class WebRadioWindow(Adw.ApplicationWindow):
             return True
         else:
             # Allow window to close (will quit application)
-            print("Closing window (no playback)")
+            logger.debug("Closing window (no playback)")
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            self._image_pool.shutdown(wait=False, cancel_futures=True)
+            self._click_pool.shutdown(wait=False, cancel_futures=True)
+            self._image_session.close()
             return False
 
     def _save_session(self):
@@ -2681,7 +2769,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
             # Restore volume
             volume = session.get('volume', 1.0)
             self.player.set_volume(volume)
-            if hasattr(self, 'volume_button'):
+            if self.volume_button is not None:
                 self.volume_button.set_value(volume)
 
             # Restore station and playback if it was playing
@@ -2717,10 +2805,10 @@ class WebRadioWindow(Adw.ApplicationWindow):
         self.station_label.set_text(name)
 
         # Update buttons
-        if hasattr(self, 'play_button'):
+        if self.play_button is not None:
             self.play_button.set_sensitive(True)
 
-        if hasattr(self, 'fav_button'):
+        if self.fav_button is not None:
             uuid = station.get('stationuuid')
             if uuid:
                 is_fav = self.favorites_manager.is_favorite(uuid)
@@ -2730,7 +2818,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
         # Load favicon if available
         favicon = station.get('favicon')
         if favicon:
-            self._load_favicon(favicon, lambda pixbuf: self.playing_logo.set_from_pixbuf(pixbuf))
+            self._load_favicon(favicon, 64, self.playing_logo.set_from_paintable)
 
     def _show_tray_unavailable_dialog(self):
         """Show dialog when tray is not available"""
@@ -2738,7 +2826,6 @@ class WebRadioWindow(Adw.ApplicationWindow):
         dialog.set_heading("System Tray nicht verfügbar")
 
         # Check desktop environment
-        import os
         desktop = os.environ.get('XDG_CURRENT_DESKTOP', '').lower()
 
         if 'gnome' in desktop:
@@ -2790,7 +2877,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
         # Show toast notification
         toast = Adw.Toast.new(f"🔴 Recording started")
         toast.set_timeout(3)
-        if hasattr(self, 'toast_overlay'):
+        if self.toast_overlay is not None:
             self.toast_overlay.add_toast(toast)
 
         # Send desktop notification
@@ -2798,7 +2885,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
             self.notification_manager.notify_recording_started(file_path)
 
         # Update record button icon to show recording state
-        if hasattr(self, 'record_button'):
+        if self.record_button is not None:
             self.record_button.set_icon_name('media-playback-stop-symbolic')
             self.record_button.add_css_class('recording-active')
 
@@ -2814,7 +2901,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
         # Show toast notification
         toast = Adw.Toast.new(f"⏹️ Recording saved ({duration_str})")
         toast.set_timeout(5)
-        if hasattr(self, 'toast_overlay'):
+        if self.toast_overlay is not None:
             self.toast_overlay.add_toast(toast)
 
         # Send desktop notification
@@ -2822,13 +2909,13 @@ class WebRadioWindow(Adw.ApplicationWindow):
             self.notification_manager.notify_recording_stopped(file_path, duration_str)
 
         # Update record button icon back to normal
-        if hasattr(self, 'record_button'):
+        if self.record_button is not None:
             self.record_button.set_icon_name('media-record-symbolic')
             self.record_button.remove_css_class('recording-active')
 
     def _on_sleep_timer_expired(self, timer):
         """Handle sleep timer expiration"""
-        print("Sleep timer expired")
+        logger.info("Sleep timer expired")
         # Timer handles the action automatically (stop/pause/quit)
 
     def _on_sleep_timer_action(self, action, parameter):
@@ -2844,10 +2931,10 @@ class WebRadioWindow(Adw.ApplicationWindow):
             toast.set_timeout(3)
 
             # Get toast overlay (assuming we're inside a window)
-            if hasattr(self, 'toast_overlay'):
+            if self.toast_overlay is not None:
                 self.toast_overlay.add_toast(toast)
             else:
-                print(f"Sleep timer started: {minutes} minutes")
+                logger.debug("Sleep timer started: %s minutes", minutes)
 
     def _on_sleep_timer_stop(self, action, parameter):
         """Stop sleep timer"""
@@ -2857,18 +2944,18 @@ class WebRadioWindow(Adw.ApplicationWindow):
             toast = Adw.Toast.new("Sleep timer stopped")
             toast.set_timeout(2)
 
-            if hasattr(self, 'toast_overlay'):
+            if self.toast_overlay is not None:
                 self.toast_overlay.add_toast(toast)
             else:
-                print("Sleep timer stopped")
+                logger.debug("Sleep timer stopped")
 
     def _on_spectrum_style_changed(self, settings, key):
         """Handle spectrum style change from settings"""
-        if not hasattr(self, 'spectrum_visualizer'):
+        if self.spectrum_visualizer is None:
             return
 
         style = settings.get_string('spectrum-style')
-        print(f"Spectrum style changed to: {style}")
+        logger.debug("Spectrum style changed to: %s", style)
         self.spectrum_visualizer.set_style(style)
 
     def _on_record_toggled(self, button):
@@ -2885,13 +2972,13 @@ class WebRadioWindow(Adw.ApplicationWindow):
                 self.recording_label.set_visible(True)
                 button.set_tooltip_text(_('Stop Recording'))
 
-                print(f"Recording started (placeholder): {station.get('name')}")
+                logger.debug("Recording started (placeholder): %s", station.get('name'))
         else:
             # Stop recording
             self.recording_label.set_visible(False)
             button.set_tooltip_text(_('Start Recording'))
 
-            print("Recording stopped (placeholder)")
+            logger.debug("Recording stopped (placeholder)")
 
     def _on_recording_started(self, recorder, file_path):
         """Handle recording started"""
@@ -2899,7 +2986,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
         self.recording_label.set_label('REC')
         self.recording_label.set_visible(True)
 
-        print(f"Recording to: {file_path}")
+        logger.debug("Recording to: %s", file_path)
 
     def _on_recording_stopped(self, recorder, file_path, duration):
         """Handle recording stopped"""
@@ -2910,10 +2997,10 @@ class WebRadioWindow(Adw.ApplicationWindow):
         toast = Adw.Toast.new(f"Recording saved: {duration}s")
         toast.set_timeout(5)
 
-        if hasattr(self, 'toast_overlay'):
+        if self.toast_overlay is not None:
             self.toast_overlay.add_toast(toast)
 
-        print(f"Recording saved: {file_path} ({duration}s)")
+        logger.info("Recording saved: %s (%ss)", file_path, duration)
 
     def _on_play_station(self, station):
         """Play a station and add to history"""
@@ -2931,16 +3018,11 @@ class WebRadioWindow(Adw.ApplicationWindow):
         tracks = self.music_library.get_all_tracks()
 
         # Clear existing rows
-        child = self.music_listbox.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.music_listbox.remove(child)
-            child = next_child
+        self._cancel_row_batches(self.music_listbox)
+        clear_listbox(self.music_listbox)
 
         # Add tracks
-        for track in tracks:
-            row = MusicTrackRow(track)
-            self.music_listbox.append(row)
+        self._append_rows_in_batches(self.music_listbox, tracks, MusicTrackRow)
 
         # Update status
         if tracks:
@@ -2960,18 +3042,18 @@ class WebRadioWindow(Adw.ApplicationWindow):
             folder = dialog.select_folder_finish(result)
             if folder:
                 path = folder.get_path()
-                print(f"Adding music folder: {path}")
+                logger.debug("Adding music folder: %s", path)
                 self.music_library.add_music_path(path)
 
                 # Automatically scan after adding
                 self._on_scan_library(None)
         except Exception as e:
-            print(f"Folder selection error: {e}")
+            logger.warning("Folder selection error: %s", e)
 
     def _on_scan_library(self, button):
         """Start library scan"""
         if self.music_library.is_scanning:
-            print("Scan already in progress")
+            logger.debug("Scan already in progress")
             return
 
         # Update UI
@@ -2990,12 +3072,17 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
     def _on_scan_complete(self, count):
         """Handle scan completion"""
-        print(f"Scan complete: {count} tracks")
+        logger.debug("Scan complete: %d tracks", count)
         self.scan_button.set_sensitive(True)
         self.library_status_label.set_label(_('tracks_found', count=count))
 
-        # Reload track list
-        self._load_local_tracks()
+        # Reload track list and library views (unbuilt pages load when first shown)
+        if 'local_music' in self._pages_built:
+            self._load_local_tracks()
+        if 'artists' in self._pages_built:
+            self._load_artists()
+        if 'albums' in self._pages_built:
+            self._load_albums()
 
     def _on_local_track_activated(self, listbox, row):
         """Play selected local track"""
@@ -3010,11 +3097,11 @@ class WebRadioWindow(Adw.ApplicationWindow):
                 'album': track['album']
             }
 
-            print(f"Playing local track: {track['title']} - {track['artist']}")
+            logger.debug("Playing local track: %s - %s", track['title'], track['artist'])
             self.player.play(file_uri, station_info)
 
             # Update now playing UI
-            self._update_now_playing_page()
+            self._update_now_playing_page_if_visible()
 
     # YouTube Search Handlers
 
@@ -3024,29 +3111,19 @@ class WebRadioWindow(Adw.ApplicationWindow):
         if not query:
             return
 
-        print(f"Searching YouTube: {query}")
+        logger.debug("Searching YouTube: %s", query)
 
         # Reset for new search
         self.youtube_current_query = query
         self.youtube_current_offset = 0
         self.youtube_all_videos = []
+        self._youtube_filtered = {}
 
         # Clear existing results
-        child = self.youtube_listbox.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.youtube_listbox.remove(child)
-            child = next_child
+        self.youtube_list.set_videos(())
 
         # Show loading indicator
-        loading_row = Gtk.ListBoxRow()
-        loading_label = Gtk.Label(label="Suche läuft...")
-        loading_label.set_margin_start(12)
-        loading_label.set_margin_end(12)
-        loading_label.set_margin_top(12)
-        loading_label.set_margin_bottom(12)
-        loading_row.set_child(loading_label)
-        self.youtube_listbox.append(loading_row)
+        self.youtube_page.set_loading("Suche läuft...")
 
         # Search in background thread
         self._load_more_youtube_results()
@@ -3063,41 +3140,37 @@ class WebRadioWindow(Adw.ApplicationWindow):
             videos = self.youtube_music.search(self.youtube_current_query, max_results=20)
             GLib.idle_add(self._append_youtube_results, videos)
 
-        threading.Thread(target=search_thread, daemon=True).start()
+        self._io_pool.submit(search_thread)
 
     def _append_youtube_results(self, new_videos):
         """Append new YouTube results to the list"""
-        # Remove loading indicator if present
-        child = self.youtube_listbox.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            if isinstance(child.get_child(), Gtk.Label):
-                label = child.get_child()
-                if label.get_label() in ["Suche läuft...", "Lade mehr..."]:
-                    self.youtube_listbox.remove(child)
-                    break
-            child = next_child
-
-        # Store all videos
+        # Hide loading indicator
+        self.youtube_page.set_loading(None)
+
+        # Store all videos and keep the filtered lists in step
         self.youtube_all_videos.extend(new_videos)
+        for min_duration, videos in self._youtube_filtered.items():
+            videos.extend(self._filter_youtube_videos(new_videos, min_duration))
 
         # Apply duration filter and add rows
-        filtered_videos = self._filter_youtube_videos(new_videos)
-        for video in filtered_videos:
-            row = YouTubeVideoRow(video)
-            self.youtube_listbox.append(row)
+        filtered_videos = self._filter_youtube_videos(new_videos, self._youtube_min_duration())
+        self.youtube_list.set_videos(filtered_videos, append=True)
 
-        print(f"Appended {len(filtered_videos)} YouTube videos (total: {len(self.youtube_all_videos)})")
+        logger.debug("Appended %d YouTube videos (total: %d)", len(filtered_videos), len(self.youtube_all_videos))
 
         self.youtube_loading = False
         return False
 
-    def _filter_youtube_videos(self, videos):
-        """Filter videos by minimum duration"""
+    def _load_youtube_row_thumbnail(self, url: str, size: int, on_loaded, wanted=None):
+        """Load a result row thumbnail, downloading the smallest variant that fits size"""
+        self.thumbnail_pool.request(url, (size,), lambda textures: on_loaded(textures[size]), wanted)
+
+    def _youtube_min_duration(self):
+        """Minimum video length in seconds selected in the duration filter"""
         selected = self.youtube_duration_filter.get_selected()
 
         # Map selection to minimum seconds
-        min_duration = {
+        return {
             0: 0,      # Alle
             1: 300,    # 5 min
             2: 600,    # 10 min
@@ -3105,74 +3178,66 @@ class WebRadioWindow(Adw.ApplicationWindow):
             4: 1800    # 30 min
         }.get(selected, 0)
 
+    def _filter_youtube_videos(self, videos, min_duration):
+        """Filter videos by minimum duration"""
         if min_duration == 0:
             return videos
 
         return [v for v in videos if v.get('duration', 0) >= min_duration]
 
+    def _filtered_youtube_results(self):
+        """All fetched videos passing the duration filter, filtered once per filter"""
+        min_duration = self._youtube_min_duration()
+        if min_duration == 0:
+            return self.youtube_all_videos
+
+        videos = self._youtube_filtered.get(min_duration)
+        if videos is None:
+            videos = self._filter_youtube_videos(self.youtube_all_videos, min_duration)
+            self._youtube_filtered[min_duration] = videos
+        return videos
+
     def _on_youtube_filter_changed(self, dropdown, param):
         """Handle duration filter change - refilter existing results"""
-        # Clear displayed results
-        child = self.youtube_listbox.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.youtube_listbox.remove(child)
-            child = next_child
-
-        # Reapply filter to all videos
-        filtered_videos = self._filter_youtube_videos(self.youtube_all_videos)
-        for video in filtered_videos:
-            row = YouTubeVideoRow(video)
-            self.youtube_listbox.append(row)
-
-        print(f"Filtered to {len(filtered_videos)} videos")
-
-    def _on_youtube_scroll(self, adjustment):
-        """Handle scroll event for infinite scrolling"""
-        value = adjustment.get_value()
-        upper = adjustment.get_upper()
-        page_size = adjustment.get_page_size()
-
-        # Load more when scrolled to 80% of content
-        if value + page_size >= upper * 0.8:
-            if not self.youtube_loading and self.youtube_current_query:
-                print("Near bottom, loading more YouTube results...")
-
-                # Add loading indicator
-                loading_row = Gtk.ListBoxRow()
-                loading_label = Gtk.Label(label="Lade mehr...")
-                loading_label.set_margin_start(12)
-                loading_label.set_margin_end(12)
-                loading_label.set_margin_top(12)
-                loading_label.set_margin_bottom(12)
-                loading_row.set_child(loading_label)
-                self.youtube_listbox.append(loading_row)
-
-                self._load_more_youtube_results()
+        # Reapply filter to all videos, replacing the shown results in one splice
+        filtered_videos = self._filtered_youtube_results()
+        self.youtube_list.set_videos(filtered_videos)
+
+        logger.debug("Filtered to %d videos", len(filtered_videos))
+
+    def _on_youtube_scroll(self, scrolled, pos):
+        """Load more YouTube results once the list is scrolled to the bottom"""
+        if pos == Gtk.PositionType.BOTTOM and not self.youtube_loading and self.youtube_current_query:
+            logger.debug("Scrolled to bottom, loading more YouTube results...")
+
+            # Add loading indicator
+            self.youtube_page.set_loading("Lade mehr...")
+
+            self._load_more_youtube_results()
 
     def _display_youtube_results(self, videos):
         """Display YouTube search results (deprecated - use _append_youtube_results)"""
         # This function is kept for compatibility but shouldn't be used anymore
         self._append_youtube_results(videos)
 
-    def _on_youtube_video_activated(self, listbox, row):
-        """Play selected YouTube video"""
-        if isinstance(row, YouTubeVideoRow):
-            video = row.video
+    def _on_youtube_video_activated(self, list_view, position):
+        """Play the YouTube video activated in the result list"""
+        video = list_view.get_video(position)
+        if video is not None:
             video_url = video.get('url', '')
 
-            print(f"Getting audio stream for: {video['title']}")
+            logger.debug("Getting audio stream for: %s", video['title'])
 
             # Show loading indicator in now playing
-            GLib.idle_add(self.station_label.set_label, "Loading YouTube audio...")
+            self._dispatch(self.station_label.set_label, "Loading YouTube audio...")
 
             # Disable UI to prevent multiple clicks
-            GLib.idle_add(self.youtube_listbox.set_sensitive, False)
+            self._dispatch(self.youtube_list.set_sensitive, False)
 
             # Get audio URL in background thread
             def get_audio_thread():
                 try:
-                    print(f"Fetching audio URL for: {video_url}")
+                    logger.debug("Fetching audio URL for: %s", video_url)
                     audio_url = self.youtube_music.get_audio_url(video_url)
 
                     if audio_url:
@@ -3185,7 +3250,7 @@ class WebRadioWindow(Adw.ApplicationWindow):
                             'is_youtube': True  # Flag for YouTube recording
                         }
 
-                        print(f"Got audio URL, playing: {video['title']}")
+                        logger.debug("Got audio URL, playing: %s", video['title'])
 
                         # Play in main thread
                         def play_audio():
@@ -3193,30 +3258,34 @@ class WebRadioWindow(Adw.ApplicationWindow):
                             self._update_now_playing_page()
 
                             # Enable player controls (including recording for YouTube!)
-                            self.play_button.set_sensitive(True)
-                            self.stop_button.set_sensitive(True)
-                            self.fav_button.set_sensitive(False)  # No favorites for YouTube
-                            self.record_button.set_sensitive(True)  # Enable recording for YouTube
+                            # Enable recording for YouTube, but no favorites
+                            self._set_controls_sensitive(
+                                (self.play_button, self.stop_button, self.record_button), True
+                            )
+                            self.fav_button.set_sensitive(False)
 
                             # Re-enable YouTube list
-                            self.youtube_listbox.set_sensitive(True)
+                            self.youtube_list.set_sensitive(True)
 
                             # Update station and metadata labels
                             self.station_label.set_text(video['title'])
                             self.metadata_label.set_text(video.get('channel', 'YouTube'))
 
                             # Update "Now Playing" page with YouTube thumbnail
+                            self._np_logo_url = None
+                            self._np_logo_shown = None
                             self.np_station_label.set_text(video['title'])
                             self.np_track_label.set_text(video.get('channel', 'YouTube'))
 
                             # Load YouTube thumbnail for "Now Playing" page AND player bar
                             thumbnail_url = video.get('thumbnail', '')
                             if thumbnail_url:
-                                self._load_youtube_thumbnail_for_now_playing(thumbnail_url)
-                                self._load_youtube_thumbnail_for_player_bar(thumbnail_url)
+                                self._load_youtube_thumbnail(
+                                    thumbnail_url, [(self.np_logo, 256), (self.playing_logo, 48)]
+                                )
                             else:
                                 self.np_logo.set_from_icon_name('multimedia-player-symbolic')
-                                self.logo_image.set_from_icon_name('multimedia-player-symbolic')
+                                self.playing_logo.set_from_icon_name('multimedia-player-symbolic')
 
                             # Update MPRIS metadata with YouTube thumbnail
                             if self.mpris:
@@ -3226,141 +3295,52 @@ class WebRadioWindow(Adw.ApplicationWindow):
 
                         GLib.idle_add(play_audio)
                     else:
-                        print("Failed to get audio URL")
+                        logger.warning("Failed to get audio URL")
                         def show_error():
                             self.station_label.set_label("Failed to load YouTube audio")
-                            self.youtube_listbox.set_sensitive(True)
+                            self.youtube_list.set_sensitive(True)
                             return False
                         GLib.idle_add(show_error)
                 except Exception as e:
-                    print(f"Error in YouTube playback: {e}")
+                    logger.warning("Error in YouTube playback: %s", e)
                     def show_error():
                         self.station_label.set_label(f"Error: {str(e)}")
-                        self.youtube_listbox.set_sensitive(True)
+                        self.youtube_list.set_sensitive(True)
                         return False
                     GLib.idle_add(show_error)
 
-            threading.Thread(target=get_audio_thread, daemon=True).start()
-
-    def _load_youtube_thumbnail_for_now_playing(self, url: str):
-        """Load YouTube thumbnail for the Now Playing page"""
-        import threading
-        import urllib.request
-        from gi.repository import GdkPixbuf, Gio
-
-        def download_and_set():
-            try:
-                print(f"Loading Now Playing thumbnail from: {url}")
-
-                # Download thumbnail
-                req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-                response = urllib.request.urlopen(req, timeout=10)
-                data = response.read()
-
-                print(f"Downloaded {len(data)} bytes for Now Playing thumbnail")
-
-                # Load into pixbuf
-                input_stream = Gio.MemoryInputStream.new_from_data(data, None)
-                pixbuf = GdkPixbuf.Pixbuf.new_from_stream(input_stream, None)
-
-                print(f"Loaded Now Playing pixbuf: {pixbuf.get_width()}x{pixbuf.get_height()}")
-
-                # Scale to fit the Now Playing logo size (256x256)
-                target_size = 256
-
-                orig_width = pixbuf.get_width()
-                orig_height = pixbuf.get_height()
-
-                # Scale to fit within 256x256 while maintaining aspect ratio
-                scale = min(target_size / orig_width, target_size / orig_height)
-                new_width = int(orig_width * scale)
-                new_height = int(orig_height * scale)
-
-                scaled_pixbuf = pixbuf.scale_simple(new_width, new_height, GdkPixbuf.InterpType.BILINEAR)
-
-                print(f"Scaled Now Playing thumbnail from {orig_width}x{orig_height} to {new_width}x{new_height}")
-
-                # Set image in main thread using Gdk.Texture (GTK4 way)
-                def set_thumbnail():
-                    texture = Gdk.Texture.new_for_pixbuf(scaled_pixbuf)
-                    self.np_logo.set_from_paintable(texture)
-                    print(f"Now Playing thumbnail applied: {new_width}x{new_height}")
-                    return False
-
-                GLib.idle_add(set_thumbnail)
-                print("Now Playing thumbnail set successfully")
-
-            except Exception as e:
-                print(f"Failed to load Now Playing thumbnail from {url}: {e}")
-                # Fallback to icon
-                def set_fallback():
-                    self.np_logo.set_from_icon_name('multimedia-player-symbolic')
-                    self.np_logo.set_pixel_size(256)
-                    return False
-                GLib.idle_add(set_fallback)
-
-        threading.Thread(target=download_and_set, daemon=True).start()
-
-    def _load_youtube_thumbnail_for_player_bar(self, url: str):
-        """Load YouTube thumbnail for the player bar (bottom left logo)"""
-        import threading
-        import urllib.request
-        from gi.repository import GdkPixbuf, Gio
-
-        def download_and_set():
-            try:
-                print(f"Loading player bar thumbnail from: {url}")
-
-                # Download thumbnail
-                req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-                response = urllib.request.urlopen(req, timeout=10)
-                data = response.read()
+            self._io_pool.submit(get_audio_thread)
 
-                print(f"Downloaded {len(data)} bytes for player bar thumbnail")
+    def _load_youtube_thumbnail(self, url: str, targets):
+        """
+        Load a YouTube thumbnail into several image widgets.
 
-                # Load into pixbuf
-                input_stream = Gio.MemoryInputStream.new_from_data(data, None)
-                pixbuf = GdkPixbuf.Pixbuf.new_from_stream(input_stream, None)
+        targets is a list of (image widget, size) pairs. The thumbnail is
+        downloaded and decoded once; each widget gets a copy scaled to fit
+        its size, keeping the aspect ratio. Starting another load, or a
+        station logo, drops this one: a load still queued is cancelled and
+        a finished one no longer touches the widgets.
+        """
+        self._thumb_generation += 1
+        generation = self._thumb_generation
+        if self._youtube_thumb_future is not None:
+            self._youtube_thumb_future.cancel()
 
-                print(f"Loaded player bar pixbuf: {pixbuf.get_width()}x{pixbuf.get_height()}")
+        def wanted():
+            return generation == self._thumb_generation
 
-                # Scale to fit the player bar logo size (48x48)
-                target_size = 48
+        def set_thumbnails(textures):
+            for image, size in targets:
+                image.set_from_paintable(textures[size])
 
-                orig_width = pixbuf.get_width()
-                orig_height = pixbuf.get_height()
+        def set_fallback():
+            logger.warning("Failed to load YouTube thumbnail from %s", url)
+            for image, size in targets:
+                image.set_from_icon_name('multimedia-player-symbolic')
+                image.set_pixel_size(size)
 
-                # Scale to fit within 48x48 while maintaining aspect ratio
-                scale = min(target_size / orig_width, target_size / orig_height)
-                new_width = int(orig_width * scale)
-                new_height = int(orig_height * scale)
-
-                scaled_pixbuf = pixbuf.scale_simple(new_width, new_height, GdkPixbuf.InterpType.BILINEAR)
-
-                print(f"Scaled player bar thumbnail from {orig_width}x{orig_height} to {new_width}x{new_height}")
-
-                # Set image in main thread using Gdk.Texture (GTK4 way)
-                def set_thumbnail():
-                    if hasattr(self, 'logo_image'):
-                        texture = Gdk.Texture.new_for_pixbuf(scaled_pixbuf)
-                        self.logo_image.set_from_paintable(texture)
-                        print(f"Player bar thumbnail applied: {new_width}x{new_height}")
-                    return False
-
-                GLib.idle_add(set_thumbnail)
-                print("Player bar thumbnail set successfully")
-
-            except Exception as e:
-                print(f"Failed to load player bar thumbnail from {url}: {e}")
-                # Fallback to icon
-                def set_fallback():
-                    if hasattr(self, 'logo_image'):
-                        self.logo_image.set_from_icon_name('multimedia-player-symbolic')
-                        self.logo_image.set_pixel_size(48)
-                    return False
-                GLib.idle_add(set_fallback)
-
-        threading.Thread(target=download_and_set, daemon=True).start()
+        self._youtube_thumb_future = self.thumbnail_pool.request(
+            url, [size for _, size in targets], set_thumbnails, wanted, set_fallback)
 
     # Seek bar functions
 
@@ -3369,62 +3349,107 @@ class WebRadioWindow(Adw.ApplicationWindow):
         if not self.is_seekable:
             return False
 
-        print(f"Seeking to position: {value}%")
+        # Coalesce drags: only the value the slider rests on is sent
+        self.seeking = True
+        self._seek_debounce.trigger(value)
+
+        return False  # Allow default handler to update the scale
+
+    def _commit_seek(self, value):
+        """Send the seek bar position to the player"""
+        self.seeking = False
 
         # Convert percentage to nanoseconds
-        if hasattr(self.player, 'playbin'):
-            success, duration = self.player.playbin.query_duration(Gst.Format.TIME)
-            if success and duration > 0:
+        playbin = getattr(self.player, 'playbin', None)
+        if playbin is not None:
+            # The position timer already knows the duration of seekable streams
+            duration = self._stream_duration
+            if duration is None:
+                success, duration = playbin.query_duration(Gst.Format.TIME)
+                if not success:
+                    duration = 0
+            if duration > 0:
                 position = int((value / 100.0) * duration)
-                self.player.playbin.seek_simple(Gst.Format.TIME, Gst.SeekFlags.FLUSH, position)
+                playbin.seek_simple(Gst.Format.TIME, Gst.SeekFlags.FLUSH, position)
 
-        return False  # Allow default handler to update the scale
+    def _on_seek_scale_mapped(self, scale):
+        """Resume position updates when the player bar is shown again"""
+        if self.player.is_playing():
+            self._start_position_updates()
+
+    def _on_seek_scale_unmapped(self, scale):
+        """Pause position updates while the player bar is hidden"""
+        if self.position_update_timer:
+            GLib.source_remove(self.position_update_timer)
+            self.position_update_timer = None
 
     def _start_position_updates(self):
         """Start timer to update seek bar position"""
         if self.position_update_timer:
             return  # Already running
+        if not self.seek_scale.get_mapped():
+            return  # Started again when the player bar is mapped
+
+        live_polls = 0
+        duration = None  # Known once prerolled; the timer restarts for every new stream
+        gst_second = Gst.SECOND
 
         def update_position():
+            nonlocal live_polls, duration
             if not hasattr(self.player, 'playbin'):
+                self.position_update_timer = None
                 return False
 
-            # Query duration and position
-            success_dur, duration = self.player.playbin.query_duration(Gst.Format.TIME)
-            success_pos, position = self.player.playbin.query_position(Gst.Format.TIME)
-
-            if success_dur and duration > 0:
-                # Stream is seekable
-                self.is_seekable = True
-                self.seek_scale.set_sensitive(True)
-
-                # Update total time
-                total_seconds = duration // Gst.SECOND
-                total_mins = total_seconds // 60
-                total_secs = total_seconds % 60
-                self.total_time_label.set_text(f"{total_mins}:{total_secs:02d}")
-
+            # Minimized windows stay mapped; nobody sees the seek bar there
+            surface = self.get_surface()
+            if surface is not None and surface.get_state() & Gdk.ToplevelState.MINIMIZED:
+                return True
+
+            # Query duration until it is known; position only matters for seekable streams
+            if duration is None:
+                success_dur, queried = self.player.playbin.query_duration(Gst.Format.TIME)
+                if success_dur and queried > 0:
+                    duration = queried
+                    self._stream_duration = duration
+
+                    # Stream is seekable; total time is set once
+                    live_polls = 0
+                    self.is_seekable = True
+                    self.seek_scale.set_sensitive(True)
+                    total_mins, total_secs = divmod(duration // gst_second, 60)
+                    _set_label_text(self.total_time_label, f"{total_mins}:{total_secs:02d}")
+
+            if duration is not None:
+                success_pos, position = self.player.playbin.query_position(Gst.Format.TIME)
                 if success_pos:
                     # Update current time
-                    current_seconds = position // Gst.SECOND
-                    current_mins = current_seconds // 60
-                    current_secs = current_seconds % 60
-                    self.current_time_label.set_text(f"{current_mins}:{current_secs:02d}")
-
-                    # Update seek bar position (change-value won't trigger on set_value)
-                    percentage = (position / duration) * 100
-                    self.seek_scale.set_value(percentage)
+                    current_mins, current_secs = divmod(position // gst_second, 60)
+                    _set_label_text(self.current_time_label, f"{current_mins}:{current_secs:02d}")
+
+                    # Update seek bar position (change-value won't trigger on set_value),
+                    # unless a drag is still waiting to be committed
+                    if not self.seeking:
+                        percentage = (position / duration) * 100
+                        self.seek_scale.set_value(percentage)
             else:
                 # Stream is not seekable (live radio)
                 self.is_seekable = False
                 self.seek_scale.set_sensitive(False)
-                self.current_time_label.set_text("Live")
-                self.total_time_label.set_text("")
+                _set_label_text(self.current_time_label, "Live")
+                _set_label_text(self.total_time_label, "")
+
+                # Files know their duration shortly after starting; a stream
+                # that still has none is live, so stop polling until the
+                # next state change restarts the timer
+                live_polls += 1
+                if live_polls >= LIVE_STREAM_POLLS:
+                    self.position_update_timer = None
+                    return False
 
             return True  # Keep timer running
 
-        # Update every 500ms
-        self.position_update_timer = GLib.timeout_add(500, update_position)
+        # Time labels show whole seconds, so there is nothing to gain from polling faster
+        self.position_update_timer = GLib.timeout_add_seconds(POSITION_UPDATE_SECONDS, update_position)
 
     def _stop_position_updates(self):
         """Stop position update timer"""
@@ -3435,9 +3460,14 @@ class WebRadioWindow(Adw.ApplicationWindow):
                 pass  # Timer was already removed
             self.position_update_timer = None
 
+        # Drop any seek that has not been committed yet
+        self._seek_debounce.cancel()
+        self.seeking = False
+
         # Reset UI
         self.seek_scale.set_value(0)
         self.seek_scale.set_sensitive(False)
         self.current_time_label.set_text("0:00")
         self.total_time_label.set_text("0:00")
         self.is_seekable = False
+        self._stream_duration = None
@@ -4,7 +4,7 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GLib, Gdk, GdkPixbuf, Gio
+from gi.repository import Gtk, Adw, GLib, Gdk, Gio
 import threading
 import requests
 from io import BytesIO
@@ -12,6 +12,7 @@ from io import BytesIO
 from webradio.player import AudioPlayer, PlayerState
 from webradio.radio_api import RadioBrowserAPI
 from webradio.favorites import FavoritesManager
+from webradio.ui.helpers import decode_scaled_texture
 
 
 class StationRow(Gtk.ListBoxRow):
@@ -78,23 +79,17 @@ class StationRow(Gtk.ListBoxRow):
         try:
             response = requests.get(url, timeout=5)
             if response.status_code == 200:
-                GLib.idle_add(self._set_logo_from_data, response.content)
+                # Decode at the final size in this thread, only the texture goes to the main loop
+                texture = decode_scaled_texture(response.content, 48)
+                if texture is not None:
+                    GLib.idle_add(self._set_logo, texture)
         except:
             pass
 
-    def _set_logo_from_data(self, image_data: bytes):
-        """Set logo from image data"""
-        try:
-            loader = GdkPixbuf.PixbufLoader()
-            loader.write(image_data)
-            loader.close()
-            pixbuf = loader.get_pixbuf()
-            if pixbuf:
-                scaled = pixbuf.scale_simple(48, 48, GdkPixbuf.InterpType.BILINEAR)
-                texture = Gdk.Texture.new_for_pixbuf(scaled)
-                self.logo_image.set_from_paintable(texture)
-        except:
-            pass
+    def _set_logo(self, texture: Gdk.Texture):
+        """Set logo texture"""
+        self.logo_image.set_from_paintable(texture)
+        return False
 
 
 class WebRadioWindow(Adw.ApplicationWindow):
@@ -2,11 +2,43 @@
 
 import subprocess
 import json
+import re
 from typing import List, Dict, Optional
 from webradio.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Thumbnail variants served by i.ytimg.com for every video: (file name, height)
+THUMBNAIL_VARIANTS = (('mqdefault.jpg', 180), ('hqdefault.jpg', 360))
+
+# Only JPEG thumbnails under /vi/ are rewritten, /vi_webp/ does not serve the .jpg variants
+_THUMBNAIL_RE = re.compile(r'^(https?://i\d*\.ytimg\.com/vi/[^/]+/)\w+\.jpg$')
+
+
+def thumbnail_url_for_size(url: str, size: int) -> str:
+    """
+    Get the smallest YouTube thumbnail variant that still covers size pixels.
+
+    Search results point at the 640x480 (or larger) thumbnail, most of which
+    is thrown away when showing it as a small logo. URLs that are not
+    i.ytimg.com thumbnails are returned unchanged.
+
+    Args:
+        url: Thumbnail URL
+        size: Largest width or height the thumbnail is shown at
+
+    Returns:
+        str: URL of the thumbnail variant to download
+    """
+    match = _THUMBNAIL_RE.match(url)
+    if not match:
+        return url
+
+    for name, height in THUMBNAIL_VARIANTS:
+        if height >= size:
+            return match.group(1) + name
+    return url
+
 
 class YouTubeMusic:
     """YouTube search and streaming handler"""
@@ -128,6 +128,31 @@ class TestExportImportManager(unittest.TestCase):
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
 
+    def test_iter_opml_top_level_outlines(self):
+        """Test streaming stations from OPML, skipping nested and URL-less outlines"""
+        opml = (
+            '<?xml version="1.0"?><opml version="2.0"><body>'
+            '<outline text="One" url="http://one.example.com"/>'
+            '<outline text="Folder"><outline text="Nested" url="http://nested.example.com"/></outline>'
+            '<outline text="Two" url="http://two.example.com" country="Germany"/>'
+            '</body></opml>'
+        )
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.opml', delete=False) as f:
+            f.write(opml)
+            temp_file = f.name
+
+        try:
+            stations = self.manager.iter_opml(temp_file)
+            self.assertEqual(next(stations)['name'], 'One')
+
+            rest = list(stations)
+            self.assertEqual([s['name'] for s in rest], ['Two'])
+            self.assertEqual(rest[0]['country'], 'Germany')
+
+        finally:
+            if os.path.exists(temp_file):
+                os.unlink(temp_file)
+
     def test_import_invalid_file(self):
         """Test importing from non-existent file"""
         imported = self.manager.import_from_opml('/nonexistent/file.opml')
@@ -0,0 +1,113 @@
+"""Unit tests for favicon cache"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from webradio.favicon_cache import FaviconCache
+
+
+class TestFaviconCache(unittest.TestCase):
+    """Test in-memory favicon LRU cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.cache = FaviconCache(max_entries=2, failure_ttl=60)
+
+    def test_lookup_missing(self):
+        """Test looking up a logo that was never stored"""
+        self.assertEqual(self.cache.lookup('http://a/icon.png', 64), (False, None))
+
+    def test_store_and_lookup(self):
+        """Test storing a logo for a given size"""
+        texture = object()
+        self.cache.store('http://a/icon.png', 64, texture)
+
+        self.assertEqual(self.cache.lookup('http://a/icon.png', 64), (True, texture))
+        self.assertEqual(self.cache.lookup('http://a/icon.png', 128), (False, None))
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused logo is evicted when full"""
+        self.cache.store('http://a', 64, 'a')
+        self.cache.store('http://b', 64, 'b')
+        self.cache.lookup('http://a', 64)
+        self.cache.store('http://c', 64, 'c')
+
+        self.assertEqual(self.cache.lookup('http://a', 64), (True, 'a'))
+        self.assertEqual(self.cache.lookup('http://b', 64), (False, None))
+        self.assertEqual(self.cache.lookup('http://c', 64), (True, 'c'))
+
+    def test_failure_is_cached(self):
+        """Test that failed URLs are reported as found without a logo"""
+        self.cache.store_failure('http://dead')
+        self.assertEqual(self.cache.lookup('http://dead', 48), (True, None))
+
+    def test_failure_expires(self):
+        """Test that failed URLs are retried after the TTL"""
+        with patch('webradio.favicon_cache.time.monotonic', return_value=100.0):
+            self.cache.store_failure('http://dead')
+        with patch('webradio.favicon_cache.time.monotonic', return_value=161.0):
+            self.assertEqual(self.cache.lookup('http://dead', 48), (False, None))
+
+    def test_store_clears_failure(self):
+        """Test that a successful load replaces a cached failure"""
+        self.cache.store_failure('http://flaky')
+        self.cache.store('http://flaky', 64, 'logo')
+        self.assertEqual(self.cache.lookup('http://flaky', 128), (False, None))
+
+
+class TestFaviconDiskCache(unittest.TestCase):
+    """Test the on-disk favicon cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = FaviconCache(cache_dir=self.test_dir, max_files=2)
+
+    def tearDown(self):
+        """Clean up after tests"""
+        shutil.rmtree(self.test_dir)
+
+    def _write(self, url, size, data=b'png'):
+        self.cache.write_to_disk(url, size, lambda path: Path(path).write_bytes(data))
+
+    def test_write_and_find(self):
+        """Test that written logos are found per url and size"""
+        self.assertIsNone(self.cache.find_on_disk('http://a', 48))
+
+        self._write('http://a', 48)
+
+        path = self.cache.find_on_disk('http://a', 48)
+        self.assertEqual(path.read_bytes(), b'png')
+        self.assertIsNone(self.cache.find_on_disk('http://a', 256))
+
+    def test_failed_save_leaves_no_file(self):
+        """Test that a failed encode does not leave files behind"""
+        self.cache.write_to_disk('http://a', 48, lambda path: False)
+
+        self.assertIsNone(self.cache.find_on_disk('http://a', 48))
+        self.assertEqual(os.listdir(self.test_dir), [])
+
+    def test_prune_removes_least_recently_used(self):
+        """Test that pruning keeps the most recently used logos"""
+        for i, url in enumerate(['http://a', 'http://b', 'http://c']):
+            self._write(url, 48)
+            path = self.cache.find_on_disk(url, 48)
+            os.utime(path, (1000 + i, 1000 + i))
+
+        self.assertEqual(self.cache.prune_disk(), 1)
+        self.assertIsNone(self.cache.find_on_disk('http://a', 48))
+        self.assertIsNotNone(self.cache.find_on_disk('http://c', 48))
+
+    def test_memory_only_without_directory(self):
+        """Test that the disk cache is disabled without a directory"""
+        cache = FaviconCache()
+        cache.write_to_disk('http://a', 48, lambda path: self.fail('should not save'))
+        self.assertIsNone(cache.find_on_disk('http://a', 48))
+        self.assertEqual(cache.prune_disk(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
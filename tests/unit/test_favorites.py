@@ -80,6 +80,46 @@ class TestFavoritesManager(unittest.TestCase):
         self.manager.add_favorite(station)
         self.assertTrue(self.manager.is_favorite('test-uuid-123'))
 
+    def test_get_favorite_uuids(self):
+        """Test getting the set of favorite UUIDs"""
+        self.assertEqual(self.manager.get_favorite_uuids(), frozenset())
+
+        self.manager.add_favorite({'stationuuid': '1', 'name': 'One'})
+        self.manager.add_favorite({'stationuuid': '2', 'name': 'Two'})
+
+        uuids = self.manager.get_favorite_uuids()
+        self.assertIn('1', uuids)
+        self.assertIn('2', uuids)
+        self.assertNotIn('3', uuids)
+
+    def test_is_favorite_after_remove_and_clear(self):
+        """Test that favorite lookups follow removals and clearing"""
+        self.manager.add_favorite({'stationuuid': '1', 'name': 'One'})
+        self.manager.add_favorite({'stationuuid': '2', 'name': 'Two'})
+
+        self.manager.remove_favorite('1')
+        self.assertFalse(self.manager.is_favorite('1'))
+        self.assertTrue(self.manager.is_favorite('2'))
+
+        self.manager.clear_favorites()
+        self.assertFalse(self.manager.is_favorite('2'))
+
+    def test_add_favorites(self):
+        """Test adding several favorites with a single save"""
+        self.manager.add_favorite({'stationuuid': '1', 'name': 'One'})
+
+        added = self.manager.add_favorites([
+            {'stationuuid': '1', 'name': 'One'},
+            {'stationuuid': '2', 'name': 'Two'},
+            {'stationuuid': '2', 'name': 'Two again'},
+            {'stationuuid': '3', 'name': 'Three'},
+        ])
+
+        self.assertEqual(added, 2)
+        self.assertEqual([f['name'] for f in self.manager.favorites], ['One', 'Two', 'Three'])
+        with open(self.manager.favorites_file, 'r') as f:
+            self.assertEqual(len(json.load(f)), 3)
+
     def test_save_and_load_favorites(self):
         """Test saving and loading favorites"""
         station = {
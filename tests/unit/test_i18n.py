@@ -0,0 +1,49 @@
+"""Unit tests for i18n module"""
+
+import unittest
+from webradio.i18n import I18n, TRANSLATIONS
+
+
+class TestI18n(unittest.TestCase):
+    """Test translation lookups"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.translator = I18n()
+        self.translator.set_language('en')
+
+    def test_translate_known_key(self):
+        """Test translating a key that exists"""
+        self.assertEqual(self.translator._('menu_quit'), TRANSLATIONS['en']['menu_quit'])
+
+    def test_unknown_key_returns_key(self):
+        """Test that unknown keys are returned unchanged"""
+        self.assertEqual(self.translator._('no_such_key'), 'no_such_key')
+
+    def test_format_kwargs(self):
+        """Test formatting with keyword arguments"""
+        self.assertEqual(self.translator._('tracks_found', count=3), '3 tracks found')
+
+    def test_set_language_updates_lookups(self):
+        """Test that changing language changes cached lookups"""
+        self.translator.set_language('de')
+        self.assertEqual(self.translator._('time_ago'), TRANSLATIONS['de']['time_ago'])
+
+        self.translator.set_language('en')
+        self.assertEqual(self.translator._('time_ago'), TRANSLATIONS['en']['time_ago'])
+
+    def test_fallback_to_english(self):
+        """Test that keys missing in a language fall back to English"""
+        missing = set(TRANSLATIONS['en']) - set(TRANSLATIONS['de'])
+        self.translator.set_language('de')
+        for key in missing:
+            self.assertEqual(self.translator._(key), TRANSLATIONS['en'][key])
+
+    def test_unsupported_language_ignored(self):
+        """Test that unsupported languages are ignored"""
+        self.translator.set_language('xx')
+        self.assertEqual(self.translator.lang, 'en')
+
+
+if __name__ == '__main__':
+    unittest.main()
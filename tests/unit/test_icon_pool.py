@@ -0,0 +1,156 @@
+"""Unit tests for the shared icon pool"""
+
+import unittest
+from concurrent.futures import Future
+from unittest.mock import patch
+from webradio.favicon_cache import FaviconCache
+from webradio.icon_pool import IconPool
+
+
+class FakeTexture:
+    """Stands in for a decoded Gdk.Texture"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def save_to_png(self, path):
+        return True
+
+
+class FakeResponse:
+    """Streamed requests response"""
+
+    def __init__(self, status_code, data=b''):
+        self.status_code = status_code
+        self.data = data
+
+    def iter_content(self, chunk_size):
+        yield self.data
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class FakeSession:
+    """requests.Session answering from a dict of url -> (status, data)"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requested = []
+
+    def get(self, url, headers=None, stream=False, timeout=None):
+        self.requested.append(url)
+        return FakeResponse(*self.responses.get(url, (404, b'')))
+
+
+class ManualExecutor:
+    """Executor running submitted work only when told to"""
+
+    def __init__(self):
+        self.tasks = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.tasks.append((future, fn, args))
+        return future
+
+    def run_all(self):
+        tasks, self.tasks = self.tasks, []
+        for future, fn, args in tasks:
+            future.set_running_or_notify_cancel()
+            future.set_result(fn(*args))
+
+
+class TestIconPool(unittest.TestCase):
+    """Test loading, sharing and skipping of image loads"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.cache = FaviconCache(max_entries=8)
+        self.executor = ManualExecutor()
+        self.session = FakeSession({'http://a/logo.png': (200, b'logo')})
+        self.pool = IconPool(self.cache, self.executor, self.session)
+
+        # Main loop callbacks run when flushed; the decoder wraps the downloaded bytes
+        self.idle = []
+        idle_patch = patch('webradio.icon_pool.GLib.idle_add',
+                           side_effect=lambda func, *args: self.idle.append((func, args)))
+        decode_patch = patch('webradio.icon_pool.decode_scaled_texture_from_chunks',
+                             side_effect=lambda chunks, size: FakeTexture(b''.join(chunks)))
+        idle_patch.start()
+        decode_patch.start()
+        self.addCleanup(idle_patch.stop)
+        self.addCleanup(decode_patch.stop)
+
+    def _run(self):
+        """Run queued loads, then the main loop callbacks they scheduled"""
+        self.executor.run_all()
+        idle, self.idle = self.idle, []
+        for func, args in idle:
+            func(*args)
+
+    def test_cached_image_delivered_synchronously(self):
+        """Test that a memory cache hit is passed on right away"""
+        texture = FakeTexture(b'cached')
+        self.cache.store('http://a/logo.png', 48, texture)
+        loaded = []
+
+        future = self.pool.request('http://a/logo.png', (48,), loaded.append)
+
+        self.assertIsNone(future)
+        self.assertEqual(loaded, [{48: texture}])
+        self.assertEqual(self.executor.tasks, [])
+
+    def test_second_request_joins_running_load(self):
+        """Test that a request for an image already loading shares that load"""
+        first, second = [], []
+        self.assertIsNotNone(self.pool.request('http://a/logo.png', (48,), first.append))
+        self.assertIsNone(self.pool.request('http://a/logo.png', (48,), second.append))
+        self._run()
+
+        self.assertEqual(self.session.requested, ['http://a/logo.png'])
+        self.assertEqual(first[0][48].data, b'logo')
+        self.assertIs(second[0][48], first[0][48])
+        self.assertEqual(self.cache.lookup('http://a/logo.png', 48), (True, first[0][48]))
+
+    def test_unwanted_load_is_skipped(self):
+        """Test that a load nobody waits for anymore is not downloaded"""
+        loaded = []
+        self.pool.request('http://a/logo.png', (48,), loaded.append, wanted=lambda: False)
+        self._run()
+
+        self.assertEqual(self.session.requested, [])
+        self.assertEqual(loaded, [])
+        self.assertEqual(self.pool._waiters, {})
+        self.assertEqual(self.cache.lookup('http://a/logo.png', 48), (False, None))
+
+    def test_failed_load_calls_on_failed(self):
+        """Test that a missing image is reported and remembered as failed"""
+        loaded, failed = [], []
+        self.pool.request('http://a/missing.png', (48,), loaded.append, on_failed=lambda: failed.append(True))
+        self._run()
+
+        self.assertEqual(loaded, [])
+        self.assertEqual(failed, [True])
+        self.assertEqual(self.cache.lookup('http://a/missing.png', 48), (True, None))
+
+    def test_falls_back_to_original_url(self):
+        """Test that the original URL is loaded if the sized variant does not exist"""
+        pool = IconPool(self.cache, self.executor, self.session,
+                        url_for_size=lambda url, size: url.replace('logo', 'logo-small'))
+        loaded = []
+        pool.request('http://a/logo.png', (48,), loaded.append)
+        self._run()
+
+        self.assertEqual(self.session.requested, ['http://a/logo-small.png', 'http://a/logo.png'])
+        self.assertEqual(loaded[0][48].data, b'logo')
+
+
+if __name__ == '__main__':
+    unittest.main()
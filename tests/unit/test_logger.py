@@ -2,8 +2,10 @@
 
 import unittest
 import logging
+import os
 from pathlib import Path
-from webradio.logger import get_logger, WebRadioLogger
+from unittest.mock import patch
+from webradio.logger import get_logger, WebRadioLogger, LOG_LEVEL_ENV
 
 
 class TestLogger(unittest.TestCase):
@@ -43,6 +45,33 @@ class TestLogger(unittest.TestCase):
         # Log file should exist
         self.assertTrue(log_file.exists())
 
+    def test_default_level_skips_debug(self):
+        """Test that debug messages are skipped unless enabled"""
+        self.addCleanup(WebRadioLogger()._setup_logging)
+        env = {k: v for k, v in os.environ.items() if k != LOG_LEVEL_ENV}
+        with patch.dict(os.environ, env, clear=True):
+            WebRadioLogger()._setup_logging()
+
+        self.assertFalse(get_logger('test_default').isEnabledFor(logging.DEBUG))
+        self.assertTrue(get_logger('test_default').isEnabledFor(logging.INFO))
+
+    def test_level_from_environment(self):
+        """Test that WEBRADIO_LOG sets the logger and file handler level"""
+        self.addCleanup(WebRadioLogger()._setup_logging)
+        with patch.dict(os.environ, {LOG_LEVEL_ENV: 'debug'}):
+            WebRadioLogger()._setup_logging()
+
+        self.assertTrue(get_logger('test_env').isEnabledFor(logging.DEBUG))
+        self.assertEqual(WebRadioLogger().file_handler.level, logging.DEBUG)
+
+    def test_invalid_level_from_environment(self):
+        """Test that an unknown WEBRADIO_LOG value falls back to INFO"""
+        self.addCleanup(WebRadioLogger()._setup_logging)
+        with patch.dict(os.environ, {LOG_LEVEL_ENV: 'loud'}):
+            WebRadioLogger()._setup_logging()
+
+        self.assertEqual(logging.getLogger('webradio').level, logging.INFO)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,74 @@
+"""Unit tests for station cache"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from webradio.station_cache import StationCache
+
+
+class TestStationCache(unittest.TestCase):
+    """Test station list disk cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.cache = StationCache(str(self.test_dir))
+
+    def tearDown(self):
+        """Clean up after tests"""
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_load_missing(self):
+        """Test loading a key that was never saved"""
+        self.assertIsNone(self.cache.load('top_stations'))
+
+    def test_save_and_load(self):
+        """Test round-tripping a station list"""
+        stations = [
+            {'stationuuid': '1', 'name': 'Rock Station'},
+            {'stationuuid': '2', 'name': 'Jazz Radio – Ü'}
+        ]
+
+        self.cache.save('top_stations', stations)
+        self.assertEqual(self.cache.load('top_stations'), stations)
+
+    def test_save_overwrites(self):
+        """Test that saving replaces the previous list"""
+        self.cache.save('top_stations', [{'stationuuid': '1'}])
+        self.cache.save('top_stations', [{'stationuuid': '2'}])
+
+        self.assertEqual(self.cache.load('top_stations'), [{'stationuuid': '2'}])
+
+    def test_no_temp_files_left(self):
+        """Test that atomic writes leave no temporary files"""
+        self.cache.save('top_stations', [{'stationuuid': '1'}])
+
+        files = [p.name for p in self.test_dir.iterdir()]
+        self.assertEqual(files, ['top_stations.json'])
+
+    def test_corrupt_file(self):
+        """Test that a corrupt cache file is ignored"""
+        (self.test_dir / 'top_stations.json').write_text('{not json', encoding='utf-8')
+        self.assertIsNone(self.cache.load('top_stations'))
+
+    def test_non_list_file(self):
+        """Test that a cache file without a list is ignored"""
+        (self.test_dir / 'top_stations.json').write_text('{"a": 1}', encoding='utf-8')
+        self.assertIsNone(self.cache.load('top_stations'))
+
+    def test_unwritable_dir_falls_back_to_memory(self):
+        """Test that a cache directory that cannot be created keeps lists in memory"""
+        blocker = self.test_dir / 'file'
+        blocker.write_text('', encoding='utf-8')
+        cache = StationCache(str(blocker / 'cache'))
+
+        self.assertIsNone(cache.cache_dir)
+        self.assertIsNone(cache.load('top_stations'))
+        cache.save('top_stations', [{'stationuuid': '1'}])
+        self.assertEqual(cache.load('top_stations'), [{'stationuuid': '1'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Unit tests for the GtkBuilder templates
+
+These tests parse the .ui files directly, so they run without a display server.
+"""
+
+import unittest
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+UI_DIR = Path(__file__).resolve().parents[2] / 'src' / 'webradio' / 'data' / 'ui'
+
+# Template file -> (GType name, ids bound with Gtk.Template.Child)
+TEMPLATES = {
+    'search_page.ui': ('WebRadioSearchPage', ['title_label', 'search_entry', 'search_button', 'results_listbox']),
+    'playlists_page.ui': ('WebRadioPlaylistsPage', ['title_label', 'create_button', 'status_page']),
+    'artists_page.ui': ('WebRadioArtistsPage', ['title_label', 'listbox', 'placeholder']),
+    'albums_page.ui': ('WebRadioAlbumsPage', ['title_label', 'listbox', 'placeholder']),
+    'recent_station_row.ui': ('WebRadioRecentStationRow', ['name_label']),
+    'station_row_content.ui': ('WebRadioStationRowContent', ['logo_image', 'name_label', 'details_label', 'fav_icon']),
+    'music_track_row.ui': ('WebRadioMusicTrackRow', ['title_label', 'details_label', 'duration_label']),
+    'youtube_video_row_content.ui': ('WebRadioYouTubeVideoRowContent', [
+        'thumbnail', 'title_label', 'channel_label', 'duration_label',
+    ]),
+    'player_controls.ui': ('WebRadioPlayerControls', [
+        'playing_logo', 'station_label', 'metadata_label', 'seek_scale',
+        'current_time_label', 'total_time_label', 'fav_button', 'play_button',
+        'stop_button', 'record_button', 'recording_label', 'sleep_button', 'volume_button',
+    ]),
+}
+
+# Template file -> handlers declared with Gtk.Template.Callback
+CALLBACKS = {
+    'player_controls.ui': [
+        'on_seek_change_value', 'on_fav_toggled', 'on_play_clicked',
+        'on_stop_clicked', 'on_record_toggled', 'on_volume_changed',
+    ],
+}
+
+# Template file -> parent widget class
+PARENTS = {
+    'recent_station_row.ui': 'GtkButton',
+    'music_track_row.ui': 'GtkListBoxRow',
+    'youtube_video_row_content.ui': 'GtkBox',
+}
+
+
+class TestUITemplates(unittest.TestCase):
+    """Test the bundled widget templates"""
+
+    def test_templates_exist(self):
+        """Test that every template file is shipped"""
+        for filename in TEMPLATES:
+            self.assertTrue((UI_DIR / filename).exists(), filename)
+
+    def test_template_class_names(self):
+        """Test that templates declare the expected GType names"""
+        for filename, (class_name, _) in TEMPLATES.items():
+            root = ET.parse(UI_DIR / filename).getroot()
+            template = root.find('template')
+            self.assertIsNotNone(template, filename)
+            self.assertEqual(template.get('class'), class_name)
+            self.assertEqual(template.get('parent'), PARENTS.get(filename, 'GtkBox'))
+
+    def test_template_children_defined(self):
+        """Test that all template children have matching object ids"""
+        for filename, (_, child_ids) in TEMPLATES.items():
+            root = ET.parse(UI_DIR / filename).getroot()
+            ids = {obj.get('id') for obj in root.iter('object')}
+            for child_id in child_ids:
+                self.assertIn(child_id, ids, f"{filename}: {child_id}")
+
+    def test_template_signal_handlers(self):
+        """Test that templates only reference known callbacks"""
+        for filename, callbacks in CALLBACKS.items():
+            root = ET.parse(UI_DIR / filename).getroot()
+            handlers = {signal.get('handler') for signal in root.iter('signal')}
+            self.assertEqual(handlers, set(callbacks), filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
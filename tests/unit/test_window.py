@@ -0,0 +1,65 @@
+"""Unit tests for main window request handling"""
+
+import unittest
+from unittest.mock import Mock, patch
+from webradio.window import WebRadioWindow, CLICK_INTERVAL_SECONDS
+
+
+class TestSupersededRequests(unittest.TestCase):
+    """Test that results of superseded requests are dropped"""
+
+    def test_stale_station_page_dropped(self):
+        """Test that a station page from an older request is not displayed"""
+        window = Mock(_station_load_seq=2)
+
+        WebRadioWindow._show_station_page(window, 1, [{'stationuuid': 'old'}])
+        window._display_stations.assert_not_called()
+
+        WebRadioWindow._show_station_page(window, 2, [{'stationuuid': 'new'}])
+        window._display_stations.assert_called_once_with([{'stationuuid': 'new'}], False)
+
+    def test_stale_global_search_dropped(self):
+        """Test that results and errors of an older global search are not shown"""
+        window = Mock(_global_search_seq=2)
+
+        WebRadioWindow._finish_global_search(window, 1, window._display_global_search_results, ['old'])
+        WebRadioWindow._finish_global_search(window, 1, window._show_global_search_error, 'timeout')
+        window._display_global_search_results.assert_not_called()
+        window._show_global_search_error.assert_not_called()
+
+        WebRadioWindow._finish_global_search(window, 2, window._display_global_search_results, ['new'])
+        window._display_global_search_results.assert_called_once_with(['new'])
+
+
+class TestClickReports(unittest.TestCase):
+    """Test reporting station plays to the Radio Browser API"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.window = Mock(_click_times={})
+        self.window.api.register_click.return_value = True
+
+    def test_repeated_play_reported_once_per_interval(self):
+        """Test that a station is reported again only after the interval"""
+        with patch('webradio.window.time.monotonic', return_value=1000.0):
+            WebRadioWindow._send_click(self.window, 'a')
+            WebRadioWindow._send_click(self.window, 'a')
+        self.assertEqual(self.window.api.register_click.call_count, 1)
+
+        with patch('webradio.window.time.monotonic', return_value=1000.0 + CLICK_INTERVAL_SECONDS):
+            WebRadioWindow._send_click(self.window, 'a')
+        self.assertEqual(self.window.api.register_click.call_count, 2)
+
+    def test_failed_report_retried(self):
+        """Test that a report the API did not accept is sent again"""
+        self.window.api.register_click.return_value = False
+
+        WebRadioWindow._send_click(self.window, 'a')
+        WebRadioWindow._send_click(self.window, 'a')
+
+        self.assertEqual(self.window.api.register_click.call_count, 2)
+        self.assertEqual(self.window._click_times, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
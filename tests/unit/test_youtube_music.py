@@ -0,0 +1,39 @@
+"""Unit tests for YouTube helpers"""
+
+import unittest
+from webradio.youtube_music import thumbnail_url_for_size
+
+
+class TestThumbnailUrlForSize(unittest.TestCase):
+    """Test picking the thumbnail variant for a display size"""
+
+    def test_small_logo_uses_medium_quality(self):
+        """Test that small logos get the 320x180 variant"""
+        url = 'https://i.ytimg.com/vi/abc123/sddefault.jpg'
+        self.assertEqual(thumbnail_url_for_size(url, 48),
+                         'https://i.ytimg.com/vi/abc123/mqdefault.jpg')
+
+    def test_large_logo_uses_high_quality(self):
+        """Test that larger logos get the 480x360 variant"""
+        url = 'https://i.ytimg.com/vi/abc123/maxresdefault.jpg'
+        self.assertEqual(thumbnail_url_for_size(url, 256),
+                         'https://i.ytimg.com/vi/abc123/hqdefault.jpg')
+
+    def test_oversized_keeps_url(self):
+        """Test that sizes beyond the variants keep the original URL"""
+        url = 'https://i.ytimg.com/vi/abc123/maxresdefault.jpg'
+        self.assertEqual(thumbnail_url_for_size(url, 720), url)
+
+    def test_webp_unchanged(self):
+        """Test that WebP thumbnails are not rewritten to JPEG variants"""
+        url = 'https://i.ytimg.com/vi_webp/abc123/sddefault.webp'
+        self.assertEqual(thumbnail_url_for_size(url, 48), url)
+
+    def test_other_hosts_unchanged(self):
+        """Test that non-YouTube thumbnails are not rewritten"""
+        url = 'https://example.com/vi/abc123/sddefault.jpg'
+        self.assertEqual(thumbnail_url_for_size(url, 48), url)
+
+
+if __name__ == '__main__':
+    unittest.main()